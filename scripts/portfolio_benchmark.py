@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Portfolio scraper benchmarks.
+
+Usage:
+    python portfolio_benchmark.py parsing [--rows N]
+    python portfolio_benchmark.py imports [--budget-ms 150]
+    python portfolio_benchmark.py run [--source debank] [--offline] [--headed] [--no-blocking]
+    python portfolio_benchmark.py compare BASE_COMMIT [HEAD_COMMIT]
+    python portfolio_benchmark.py compare abc1234-noblock abc1234   # blocking off vs on
+    python portfolio_benchmark.py record debank 0xWALLET medium
+    python portfolio_benchmark.py generate [--source debank] [--preset huge]
+    python portfolio_benchmark.py generate --source debank --projects 200 --sections 1 --rows 2 --name protocols200
+"""
+import argparse
+import sys
+
+from portfolio_scraper.bench import harness
+from portfolio_scraper.bench import imports as imports_bench
+from portfolio_scraper.bench import parsing as parsing_bench
+from portfolio_scraper.bench import synthetic
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Portfolio scraper benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parsing_parser = subparsers.add_parser("parsing", help="Numeric parser microbenchmark")
+    parsing_parser.add_argument("--rows", type=int, default=5000, help="Cells per column")
+
+    imports_parser = subparsers.add_parser("imports", help="Check import time and heavy dependencies of entry points")
+    imports_parser.add_argument("--budget-ms", type=float, default=imports_bench.DEFAULT_BUDGET_MS,
+                                help="Maximum import time per entry point")
+
+    run_parser = subparsers.add_parser("run", help="Replay fixture pages through the scrapers")
+    run_parser.add_argument("--fixtures", default=harness.DEFAULT_FIXTURES_DIR, help="Fixture directory")
+    run_parser.add_argument("--results", default=harness.DEFAULT_RESULTS_DIR, help="Results directory")
+    run_parser.add_argument("--source", action="append", choices=["jupiter", "debank", "rabby"],
+                            help="Only run these sources (repeatable)")
+    run_parser.add_argument("--offline", action="store_true", help="Skip the browser, only run non-browser paths")
+    run_parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    run_parser.add_argument("--no-blocking", action="store_true",
+                            help="Disable resource blocking (results saved as <commit>-noblock.json)")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare results between two commits")
+    compare_parser.add_argument("base", help="Base commit (or results file)")
+    compare_parser.add_argument("head", nargs="?", help="Head commit (or results file), defaults to HEAD")
+    compare_parser.add_argument("--results", default=harness.DEFAULT_RESULTS_DIR, help="Results directory")
+
+    record_parser = subparsers.add_parser("record", help="Record a live wallet page as a fixture case")
+    record_parser.add_argument("source", choices=["jupiter", "debank"])
+    record_parser.add_argument("wallet_address")
+    record_parser.add_argument("name", help="Case name, e.g. small/medium/huge")
+    record_parser.add_argument("--fixtures", default=harness.DEFAULT_FIXTURES_DIR, help="Fixture directory")
+
+    generate_parser = subparsers.add_parser("generate", help="Generate synthetic fixture cases")
+    generate_parser.add_argument("--fixtures", default=harness.DEFAULT_FIXTURES_DIR, help="Fixture directory")
+    generate_parser.add_argument("--source", action="append", choices=sorted(synthetic.GENERATORS),
+                                 help="Only generate these sources (repeatable)")
+    generate_parser.add_argument("--preset", action="append", choices=list(synthetic.PRESETS),
+                                 help="Only generate these presets (repeatable)")
+    generate_parser.add_argument("--projects", type=int, help="Custom case: number of projects")
+    generate_parser.add_argument("--sections", type=int, default=1, help="Custom case: sections per project")
+    generate_parser.add_argument("--rows", type=int, default=2, help="Custom case: rows per section")
+    generate_parser.add_argument("--name", help="Custom case name (default synthetic_<projects>)")
+    generate_parser.add_argument("--seed", type=int, default=0, help="Random seed")
+
+    args = parser.parse_args()
+
+    if args.command == "parsing":
+        parsing_bench.print_report(parsing_bench.run(rows=args.rows))
+    elif args.command == "imports":
+        results = imports_bench.check(budget_ms=args.budget_ms)
+        imports_bench.print_report(results, budget_ms=args.budget_ms)
+        if not all(result["ok"] for result in results):
+            sys.exit(1)
+    elif args.command == "run":
+        document = harness.run_benchmark(
+            fixtures_dir=args.fixtures,
+            sources=args.source,
+            headless=not args.headed,
+            browser=not args.offline,
+            block_resources=False if args.no_blocking else None,
+            label="noblock" if args.no_blocking else None,
+        )
+        print(harness.format_results(document))
+        print(f"\nResults written to {harness.save_results(document, args.results)}")
+    elif args.command == "compare":
+        base = harness.load_results(args.base, args.results)
+        head = harness.load_results(args.head or harness.current_commit(), args.results)
+        print(harness.format_comparison(base, head))
+    elif args.command == "record":
+        harness.record_case(args.source, args.wallet_address, args.name, fixtures_dir=args.fixtures)
+    elif args.command == "generate":
+        if args.projects is not None:
+            name = args.name or f"synthetic_{args.projects}"
+            written = [
+                synthetic.write_case(args.fixtures, source, name, args.projects, args.sections, args.rows, seed=args.seed)
+                for source in args.source or sorted(synthetic.GENERATORS)
+            ]
+        else:
+            written = synthetic.write_presets(args.fixtures, args.source, args.preset, seed=args.seed)
+        for case_dir in written:
+            print(f"[Bench] ✓ Generated {case_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,10 +32,7 @@ def main() -> None:
     try:
         scheduler.scrape_and_cache()
     finally:
-        if scheduler.jupiter_scraper:
-            scheduler.jupiter_scraper.cleanup()
-        if scheduler.debank_scraper:
-            scheduler.debank_scraper.cleanup()
+        scheduler.cleanup()
 
 
 if __name__ == "__main__":
@@ -2,56 +2,58 @@
 Portfolio Scraper Package
 
 Modular scraper for Solana (Jupiter) and EVM (DeBank) portfolios
-"""
 
-from .config import (
-    SOLANA_ADDRESSES,
-    RABBY_PASSWORD,
-    EVM_ADDRESSES,
-    SCRAPE_INTERVAL_MINUTES,
-    CHROME_DEBUG_PORT,
-    CHROME_PROFILE,
-    FLASK_PORT,
-    FLASK_HOST,
-    OUTPUT_DIR,
-    NGROK_AUTHTOKEN,
-    RABBY_PASSWORD
-)
-
-from .utils import (
-    is_solana_address,
-    is_evm_address,
-    check_chrome_debug_port,
-    kill_all_chrome_processes
-)
-
-from .jupiter_scraper import JupiterScraper
-from .debank_scraper import DebankScraper
-from .chrome_manager import start_chrome_with_debug, cleanup_chrome
-from .scheduler import PortfolioScheduler
-from .flask_app import create_app, run_app
+Exports are loaded lazily: `import portfolio_scraper` is cheap, and
+selenium, undetected_chromedriver, Flask, APScheduler and pyngrok are only
+imported when something that needs them (e.g. JupiterScraper, run_app) is
+first accessed.
+"""
+import importlib
 
 __version__ = '1.0.0'
-__all__ = [
-    'SOLANA_ADDRESSES',
-    'RABBY_PASSWORD',
-    'EVM_ADDRESSES',
-    'SCRAPE_INTERVAL_MINUTES',
-    'CHROME_DEBUG_PORT',
-    'CHROME_PROFILE',
-    'FLASK_PORT',
-    'FLASK_HOST',
-    'OUTPUT_DIR',
-    'NGROK_AUTHTOKEN',
-    'is_solana_address',
-    'is_evm_address',
-    'check_chrome_debug_port',
-    'kill_all_chrome_processes',
-    'JupiterScraper',
-    'DebankScraper',
-    'PortfolioScheduler',
-    'start_chrome_with_debug',
-    'cleanup_chrome',
-    'create_app',
-    'run_app'
-]
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    'SOLANA_ADDRESSES': 'config',
+    'RABBY_PASSWORD': 'config',
+    'EVM_ADDRESSES': 'config',
+    'SCRAPE_INTERVAL_MINUTES': 'config',
+    'CHROME_DEBUG_PORT': 'config',
+    'CHROME_PROFILE': 'config',
+    'FLASK_PORT': 'config',
+    'FLASK_HOST': 'config',
+    'OUTPUT_DIR': 'config',
+    'NGROK_AUTHTOKEN': 'config',
+    'is_solana_address': 'utils',
+    'is_evm_address': 'utils',
+    'check_chrome_debug_port': 'utils',
+    'kill_all_chrome_processes': 'utils',
+    'JupiterScraper': 'jupiter_scraper',
+    'DebankScraper': 'debank_scraper',
+    'RabbyScraper': 'rabby_scraper',
+    'Scraper': 'scraper_base',
+    'Portfolio': 'model',
+    'Project': 'model',
+    'Section': 'model',
+    'Asset': 'model',
+    'PortfolioScheduler': 'scheduler',
+    'start_chrome_with_debug': 'chrome_manager',
+    'cleanup_chrome': 'chrome_manager',
+    'create_app': 'flask_app',
+    'run_app': 'flask_app',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Only resolve once
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,346 @@
+"""Offline scrape benchmark harness.
+
+Replays fixture pages (see bench/server.py) through the real scrapers in
+headless Chrome and measures, per case:
+
+- wall-clock scrape time
+- WebDriver calls and time spent in round-trips
+- Python peak memory during the scrape and browser RSS afterwards
+- bytes transferred for the page and its resources
+- equality of the output with the case's golden JSON
+
+The same golden JSON is also fed through the only non-browser path (model
+normalization + serialization) so regressions there show up without Chrome.
+Results are written per commit and can be compared as a table.
+"""
+import json
+import os
+import re
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import psutil
+
+from ..metrics import scrape_context
+from ..model import Portfolio
+from ..webdriver_profiler import profiler
+from ..browser import page_transfer_kb
+from .server import FixtureServer, discover_cases
+
+
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+DEFAULT_RESULTS_DIR = 'bench_results'
+
+# Metrics shown by the comparison table, with their formatting
+COMPARE_METRICS = (
+    ('scrape_seconds', '{:.2f}s'),
+    ('webdriver_calls', '{:.0f}'),
+    ('python_peak_kb', '{:.0f}KB'),
+    ('browser_rss_mb', '{:.0f}MB'),
+    ('page_kb', '{:.0f}KB'),
+    ('offline_ms', '{:.2f}ms'),
+)
+
+_SCRIPT_RE = re.compile(r'<script\b[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+
+
+def current_commit():
+    """Short hash of HEAD (with '-dirty' for uncommitted changes), or 'unknown'"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=no'],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def _strip_volatile(data):
+    """Drop fields that legitimately differ between runs"""
+    if data is None:
+        return None
+    data = dict(data)
+    data.pop('timestamp', None)
+    return data
+
+
+def diff_outputs(actual, expected, path='$'):
+    """Return the first difference between two JSON values, or None"""
+    if type(actual) != type(expected) and not (
+        isinstance(actual, (int, float)) and isinstance(expected, (int, float))
+    ):
+        return f"{path}: {type(expected).__name__} expected, got {type(actual).__name__}"
+    if isinstance(expected, dict):
+        for key in sorted(set(actual) | set(expected)):
+            if key not in actual:
+                return f"{path}.{key}: missing"
+            if key not in expected:
+                return f"{path}.{key}: unexpected"
+            diff = diff_outputs(actual[key], expected[key], f"{path}.{key}")
+            if diff:
+                return diff
+        return None
+    if isinstance(expected, list):
+        if len(actual) != len(expected):
+            return f"{path}: {len(expected)} items expected, got {len(actual)}"
+        for idx, (a, e) in enumerate(zip(actual, expected)):
+            diff = diff_outputs(a, e, f"{path}[{idx}]")
+            if diff:
+                return diff
+        return None
+    if isinstance(expected, float) or isinstance(actual, float):
+        return None if abs(actual - expected) <= 1e-9 * max(1.0, abs(expected)) else f"{path}: {expected} != {actual}"
+    return None if actual == expected else f"{path}: {expected!r} != {actual!r}"
+
+
+def _count_positions(golden):
+    if not golden:
+        return 0
+    count = 0
+    for project in golden.get('projects', []):
+        for section in project.get('sections', []):
+            for key in ('assets', 'supplied', 'borrowed'):
+                count += len(section.get(key) or [])
+    return count
+
+
+def _browser_rss_mb(driver):
+    """Resident memory of the browser process tree (MB), or None if unknown"""
+    pid = getattr(driver, 'browser_pid', None)
+    if pid is None:
+        service = getattr(driver, 'service', None)
+        process = getattr(service, 'process', None)
+        pid = getattr(process, 'pid', None)
+    if pid is None:
+        return None
+    try:
+        root = psutil.Process(pid)
+        total = root.memory_info().rss
+        for child in root.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return total / (1024 * 1024)
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
+
+def _make_scraper(source, server, user_data_dir, headless, block_resources=None):
+    """Create a scraper pointed at the fixture server"""
+    options = dict(user_data_dir=user_data_dir, headless=headless, block_resources=block_resources)
+    if source == 'jupiter':
+        from ..jupiter_scraper import JupiterScraper
+        return JupiterScraper(base_url=server.base_url('jupiter'), **options)
+    if source == 'debank':
+        from ..debank_scraper import DebankScraper
+        return DebankScraper(base_url=server.base_url('debank'), **options)
+    if source == 'rabby':
+        from ..rabby_scraper import RabbyScraper
+        return RabbyScraper(**options)
+    raise ValueError(f"Unknown source: {source}")
+
+
+def run_offline_case(case, repeat=20):
+    """Time model normalization + serialization of the golden output"""
+    golden = case.load_golden()
+    if golden is None:
+        return None, None
+    start = time.perf_counter()
+    for _ in range(repeat):
+        output = Portfolio.from_dict(golden).to_dict()
+    elapsed_ms = (time.perf_counter() - start) / repeat * 1000
+    return elapsed_ms, diff_outputs(_strip_volatile(output), _strip_volatile(golden)) is None
+
+
+def run_browser_case(case, scraper, server):
+    """Scrape one fixture case through the real scraper and measure it"""
+    if case.source == 'rabby':
+        scraper.desktop_url = f"{server.base_url('rabby')}/desktop/{case.wallet_address}"
+
+    profiler.reset()
+    profiler.attach(scraper.driver)
+    tracemalloc.start()
+    start = time.perf_counter()
+    with scrape_context(wallet=case.wallet_address):
+        portfolio = scraper.scrape_portfolio(case.wallet_address)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    profile = profiler.summary()
+    golden = case.load_golden()
+    output = portfolio.to_dict() if portfolio else None
+    diff = None
+    if golden is not None:
+        diff = diff_outputs(_strip_volatile(output), _strip_volatile(golden)) if output else "no output"
+
+    return {
+        "scrape_seconds": elapsed,
+        "webdriver_calls": profile["total_calls"],
+        "webdriver_seconds": profile["total_seconds"],
+        "python_peak_kb": peak / 1024,
+        "browser_rss_mb": _browser_rss_mb(scraper.driver),
+        "page_kb": page_transfer_kb(scraper.driver),
+        "golden_match": None if golden is None else diff is None,
+        "golden_diff": diff,
+    }
+
+
+def run_benchmark(fixtures_dir=DEFAULT_FIXTURES_DIR, sources=None, headless=True, browser=True,
+                  block_resources=None, label=None):
+    """Run all fixture cases and return the results document
+
+    block_resources overrides BLOCK_RESOURCES so both modes can be measured
+    on the same commit; label ends up in the results file name.
+    """
+    cases = discover_cases(fixtures_dir, sources)
+    if not cases:
+        print(f"[Bench] No fixture cases found in {fixtures_dir}")
+
+    results = []
+    for case in cases:
+        offline_ms, offline_match = run_offline_case(case)
+        golden = case.load_golden()
+        results.append({
+            "source": case.source,
+            "case": case.name,
+            "size": case.size,
+            "positions": _count_positions(golden),
+            "offline_ms": offline_ms,
+            "offline_match": offline_match,
+        })
+
+    if browser and cases:
+        scrapers = {}
+        with tempfile.TemporaryDirectory(prefix='portfolio_bench_') as profile_root, FixtureServer(cases) as server:
+            try:
+                for case, result in zip(cases, results):
+                    scraper = scrapers.get(case.source)
+                    if scraper is None:
+                        scraper = _make_scraper(
+                            case.source, server, os.path.join(profile_root, case.source), headless, block_resources
+                        )
+                        if not scraper.connect_to_chrome():
+                            print(f"[Bench] ✗ Could not start Chrome for {case.source}")
+                            break
+                        scrapers[case.source] = scraper
+                    print(f"[Bench] {case.source}/{case.name} ({result['positions']} positions)")
+                    result.update(run_browser_case(case, scraper, server))
+            finally:
+                for scraper in scrapers.values():
+                    scraper.cleanup()
+
+    return {
+        "commit": current_commit(),
+        "label": label,
+        "block_resources": block_resources,
+        "created_at": datetime.now().isoformat(),
+        "results": results,
+    }
+
+
+def save_results(document, results_dir=DEFAULT_RESULTS_DIR):
+    """Write results as <results_dir>/<commit>[-<label>].json and return the path"""
+    os.makedirs(results_dir, exist_ok=True)
+    name = document['commit'] + (f"-{document['label']}" if document.get('label') else '')
+    path = os.path.join(results_dir, f"{name}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2)
+    return path
+
+
+def load_results(path_or_commit, results_dir=DEFAULT_RESULTS_DIR):
+    """Load a results document by path or by commit hash"""
+    path = path_or_commit
+    if not os.path.exists(path):
+        path = os.path.join(results_dir, f"{path_or_commit}.json")
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _fmt(fmt, value):
+    return '-' if value is None else fmt.format(value)
+
+
+def format_results(document):
+    """Format a single results document as a table"""
+    lines = [f"Benchmark results @ {document['commit']}"]
+    header = f"{'case':<28} {'pos':>5} " + ' '.join(f"{name:>16}" for name, _ in COMPARE_METRICS) + '  golden'
+    lines.append(header)
+    for result in document['results']:
+        match = result.get('golden_match')
+        if match is None:
+            # No browser run (--offline): report the model round-trip instead
+            offline = result.get('offline_match')
+            golden = '-' if offline is None else ('ok (offline)' if offline else 'DIFF (offline)')
+        else:
+            golden = 'ok' if match else f"DIFF {result.get('golden_diff')}"
+        lines.append(
+            f"{result['source'] + '/' + result['case']:<28} {result['positions']:>5} "
+            + ' '.join(f"{_fmt(fmt, result.get(name)):>16}" for name, fmt in COMPARE_METRICS)
+            + f"  {golden}"
+        )
+    return '\n'.join(lines)
+
+
+def format_comparison(base, head):
+    """Format a comparison table between two results documents"""
+    lines = [f"Benchmark comparison {base['commit']} -> {head['commit']}"]
+    base_by_case = {(r['source'], r['case']): r for r in base['results']}
+    for result in head['results']:
+        key = (result['source'], result['case'])
+        previous = base_by_case.get(key)
+        lines.append(f"{key[0]}/{key[1]} ({result['positions']} positions)")
+        for name, fmt in COMPARE_METRICS:
+            new_value = result.get(name)
+            old_value = previous.get(name) if previous else None
+            if old_value and new_value is not None:
+                delta = f"{(new_value - old_value) / old_value * 100:+.1f}%"
+            else:
+                delta = '-'
+            lines.append(f"    {name:<18} {_fmt(fmt, old_value):>12} -> {_fmt(fmt, new_value):>12}  {delta:>8}")
+    return '\n'.join(lines)
+
+
+def record_case(source, wallet_address, name, size=None, fixtures_dir=DEFAULT_FIXTURES_DIR):
+    """Scrape a live wallet and save its rendered DOM and output as a fixture case"""
+    if source == 'jupiter':
+        from ..jupiter_scraper import JupiterScraper
+        scraper = JupiterScraper()
+    elif source == 'debank':
+        from ..debank_scraper import DebankScraper
+        scraper = DebankScraper()
+    else:
+        raise ValueError(f"Recording is supported for jupiter and debank, not {source}")
+
+    case_dir = os.path.join(fixtures_dir, source, name)
+    try:
+        if not scraper.connect_to_chrome():
+            return None
+        portfolio = scraper.scrape_portfolio(wallet_address)
+        if portfolio is None:
+            print("[Bench] ✗ Live scrape failed, nothing recorded")
+            return None
+        # Scripts would re-render (or phone home) when replayed; keep the static DOM
+        page = _SCRIPT_RE.sub('', scraper.driver.page_source)
+    finally:
+        scraper.cleanup()
+
+    os.makedirs(case_dir, exist_ok=True)
+    with open(os.path.join(case_dir, 'page.html'), 'w', encoding='utf-8') as f:
+        f.write(page)
+    with open(os.path.join(case_dir, 'golden.json'), 'w', encoding='utf-8') as f:
+        json.dump(portfolio.to_dict(), f, indent=2, ensure_ascii=False)
+    with open(os.path.join(case_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump({"wallet_address": wallet_address, "size": size or name}, f, indent=2)
+    print(f"[Bench] ✓ Recorded {source}/{name} in {case_dir}")
+    return case_dir
@@ -0,0 +1,79 @@
+"""Import-time budget check.
+
+Imports each lightweight entry point in a fresh interpreter with
+`-X importtime` and fails if it takes longer than the budget or drags in a
+heavy dependency (selenium, Flask, ...) it doesn't use.
+"""
+import os
+import subprocess
+import sys
+
+
+DEFAULT_BUDGET_MS = 150
+
+HEAVY_MODULES = ('selenium', 'undetected_chromedriver', 'flask', 'apscheduler', 'pyngrok', 'psutil')
+
+# name -> import statement; none of these may load a heavy module
+ENTRY_POINTS = {
+    'package': 'import portfolio_scraper',
+    'model': 'from portfolio_scraper import Portfolio',
+    'parsing': 'from portfolio_scraper.parsing import parse_numeric_value',
+    'metrics': 'from portfolio_scraper.metrics import render_prometheus',
+    'synthetic': 'from portfolio_scraper.bench import synthetic',
+}
+
+_SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def measure(statement):
+    """Return (import milliseconds, loaded top-level modules) for a statement"""
+    code = f"{statement}\nimport sys\nprint('\\n'.join(sorted({{m.split('.')[0] for m in sys.modules}})))"
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=_SCRIPTS_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else statement)
+
+    # Lines look like: "import time:  self [us] | cumulative | imported package"
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        try:
+            total_us += int(fields[0])
+        except ValueError:
+            continue  # header line
+    return total_us / 1000, set(result.stdout.split())
+
+
+def check(budget_ms=DEFAULT_BUDGET_MS):
+    """Measure all entry points; returns a list of result dicts"""
+    results = []
+    for name, statement in ENTRY_POINTS.items():
+        try:
+            elapsed_ms, modules = measure(statement)
+            heavy = sorted(m for m in HEAVY_MODULES if m in modules)
+            error = None
+        except RuntimeError as e:
+            elapsed_ms, heavy, error = None, [], str(e)
+        ok = error is None and not heavy and elapsed_ms <= budget_ms
+        results.append({
+            "entry_point": name,
+            "statement": statement,
+            "import_ms": elapsed_ms,
+            "heavy_modules": heavy,
+            "error": error,
+            "ok": ok,
+        })
+    return results
+
+
+def print_report(results, budget_ms=DEFAULT_BUDGET_MS):
+    print(f"Import budget: {budget_ms}ms, no {', '.join(HEAVY_MODULES)}")
+    for result in results:
+        status = 'ok' if result['ok'] else 'FAIL'
+        elapsed = '-' if result['import_ms'] is None else f"{result['import_ms']:.1f}ms"
+        detail = result['error'] or (f"loads {', '.join(result['heavy_modules'])}" if result['heavy_modules'] else '')
+        print(f"  {status:<4} {result['entry_point']:<10} {elapsed:>9}  {result['statement']}  {detail}")
@@ -0,0 +1,135 @@
+"""Microbenchmark for the shared numeric parsers.
+
+Compares the shared, memoized parsers (cell by cell and through
+parse_column) against the per-scraper implementations they replaced, on a
+column mix that resembles a real DeBank/Jupiter page (many repeated prices
+and '$0'/'<$0.01' cells). Memoized numbers are reported cold (cache cleared
+before every run) and warm.
+"""
+import random
+import re
+import timeit
+
+from ..parsing import parse_amount_value, parse_column, parse_numeric_value
+
+
+def _legacy_parse_numeric_value(text):
+    """Previous DeBank/Rabby implementation"""
+    text = text.strip()
+    if text.startswith('<') or text.startswith('>'):
+        return 0
+    text = text.replace('$', '').replace(',', '')
+    try:
+        return float(text)
+    except ValueError:
+        return 0
+
+
+def _legacy_parse_amount_value(text):
+    """Previous DeBank/Rabby implementation"""
+    parts = text.strip().split()
+    if not parts:
+        return 0
+    amount_text = parts[0].replace(',', '')
+    try:
+        return float(amount_text)
+    except ValueError:
+        return 0
+
+
+def _legacy_extract_balance_only(balance_text):
+    """Previous Jupiter implementation (uncompiled re.sub)"""
+    lines = balance_text.strip().split('\n')
+    if len(lines) >= 1:
+        balance_str = lines[0].strip().replace(',', '')
+        balance_str = re.sub(r'[^\d.-]', '', balance_str)
+        try:
+            return float(balance_str) if balance_str else 0
+        except ValueError:
+            return 0
+    return 0
+
+
+def build_sample_columns(rows=5000, seed=7):
+    """Build value/amount columns with a realistic amount of repetition"""
+    rng = random.Random(seed)
+    prices = [f"${rng.uniform(0.01, 4000):,.2f}" for _ in range(40)]
+    values = []
+    amounts = []
+    for _ in range(rows):
+        roll = rng.random()
+        if roll < 0.15:
+            values.append('<$0.01')
+        elif roll < 0.25:
+            values.append('$0')
+        elif roll < 0.75:
+            values.append(rng.choice(prices))
+        else:
+            values.append(f"${rng.uniform(0, 250000):,.2f}")
+        amounts.append(f"{rng.uniform(0, 100000):,.4f} TOKEN{rng.randint(0, 30)}")
+    return values, amounts
+
+
+def run(rows=5000, repeat=5, number=10):
+    """Run the microbenchmark and return timings (best of `repeat`, in ms per column)"""
+    values, amounts = build_sample_columns(rows)
+
+    def best(stmt):
+        return min(timeit.repeat(stmt, repeat=repeat, number=number)) / number * 1000
+
+    def best_cold(stmt):
+        # One run per repeat, so every run starts with an empty cache
+        runs = timeit.repeat(stmt, setup=parse_numeric_value.cache_clear, repeat=repeat * number, number=1)
+        return min(runs) * 1000
+
+    results = {
+        "rows": rows,
+        "legacy_numeric_ms": best(lambda: [_legacy_parse_numeric_value(v) for v in values]),
+        "shared_numeric_cold_ms": best_cold(lambda: [parse_numeric_value(v) for v in values]),
+        "shared_numeric_warm_ms": best(lambda: [parse_numeric_value(v) for v in values]),
+        "column_numeric_cold_ms": best_cold(lambda: parse_column(values)),
+        "column_numeric_warm_ms": best(lambda: parse_column(values)),
+        "legacy_amount_ms": best(lambda: [_legacy_parse_amount_value(a) for a in amounts]),
+        "legacy_jupiter_balance_ms": best(lambda: [_legacy_extract_balance_only(a) for a in amounts]),
+        "shared_amount_ms": best(lambda: [parse_amount_value(a) for a in amounts]),
+        "column_amount_ms": best(lambda: parse_column(amounts, parse_amount_value)),
+    }
+
+    results["numeric_mismatches"] = sum(
+        1 for v in values if _legacy_parse_numeric_value(v) != parse_numeric_value(v)
+    )
+    results["amount_mismatches"] = sum(
+        1 for a in amounts if _legacy_parse_amount_value(a) != parse_amount_value(a)
+    )
+    results["column_mismatches"] = (
+        sum(1 for v, p in zip(values, parse_column(values)) if p != parse_numeric_value(v))
+        + sum(1 for a, p in zip(amounts, parse_column(amounts, parse_amount_value)) if p != parse_amount_value(a))
+    )
+    return results
+
+
+def print_report(results):
+    """Print a human readable summary"""
+    print(f"Parsing microbenchmark ({results['rows']} cells per column)")
+    print(f"  numeric  legacy: {results['legacy_numeric_ms']:.3f} ms")
+    print(f"  numeric  shared: {results['shared_numeric_cold_ms']:.3f} ms cold, "
+          f"{results['shared_numeric_warm_ms']:.3f} ms warm")
+    print(f"  numeric  column: {results['column_numeric_cold_ms']:.3f} ms cold, "
+          f"{results['column_numeric_warm_ms']:.3f} ms warm")
+    print(f"  amount   legacy: {results['legacy_amount_ms']:.3f} ms")
+    print(f"  balance  legacy (Jupiter): {results['legacy_jupiter_balance_ms']:.3f} ms")
+    print(f"  amount   shared: {results['shared_amount_ms']:.3f} ms")
+    print(f"  amount   column: {results['column_amount_ms']:.3f} ms")
+    for label, legacy, shared in (
+        ("numeric cold", 'legacy_numeric_ms', 'shared_numeric_cold_ms'),
+        ("numeric warm", 'legacy_numeric_ms', 'shared_numeric_warm_ms'),
+        ("numeric column cold", 'legacy_numeric_ms', 'column_numeric_cold_ms'),
+        ("amount", 'legacy_amount_ms', 'shared_amount_ms'),
+        ("amount column", 'legacy_amount_ms', 'column_amount_ms'),
+        ("amount column vs Jupiter balance", 'legacy_jupiter_balance_ms', 'column_amount_ms'),
+    ):
+        speedup = results[legacy] / max(results[shared], 1e-9)
+        print(f"  {label} speedup (shared vs legacy): {speedup:.1f}x")
+    print(f"  numeric mismatches vs legacy: {results['numeric_mismatches']}")
+    print(f"  amount mismatches vs legacy: {results['amount_mismatches']}")
+    print(f"  column mismatches vs per-cell: {results['column_mismatches']}")
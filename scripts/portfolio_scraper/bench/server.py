@@ -0,0 +1,122 @@
+"""Local HTTP stand-in that serves recorded portfolio pages to Chrome.
+
+Fixture layout (one directory per case):
+
+    <fixtures_dir>/<source>/<case>/page.html     recorded/generated DOM
+    <fixtures_dir>/<source>/<case>/golden.json   expected scraper output
+    <fixtures_dir>/<source>/<case>/meta.json     {"wallet_address": ..., "size": ...}
+
+Any request whose last path segment is a case's wallet address gets that
+case's page, so the scrapers' own URL shapes work unchanged:
+
+    /jupiter/portfolio/<address>
+    /debank/profile/<address>
+    /rabby/desktop/<address>
+"""
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FixtureCase:
+    """A recorded page plus its expected output"""
+
+    def __init__(self, source, name, path):
+        self.source = source
+        self.name = name
+        self.path = path
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            self.meta = json.load(f)
+
+    @property
+    def wallet_address(self):
+        return self.meta['wallet_address']
+
+    @property
+    def size(self):
+        return self.meta.get('size', self.name)
+
+    @property
+    def page_path(self):
+        return os.path.join(self.path, 'page.html')
+
+    def load_golden(self):
+        """Return the expected scraper output, or None if not recorded"""
+        golden_path = os.path.join(self.path, 'golden.json')
+        if not os.path.exists(golden_path):
+            return None
+        with open(golden_path, encoding='utf-8') as f:
+            return json.load(f)
+
+
+def discover_cases(fixtures_dir, sources=None):
+    """Find all fixture cases, optionally restricted to some sources"""
+    cases = []
+    if not os.path.isdir(fixtures_dir):
+        return cases
+    for source in sorted(os.listdir(fixtures_dir)):
+        source_dir = os.path.join(fixtures_dir, source)
+        if not os.path.isdir(source_dir) or (sources and source not in sources):
+            continue
+        for name in sorted(os.listdir(source_dir)):
+            case_dir = os.path.join(source_dir, name)
+            if os.path.exists(os.path.join(case_dir, 'meta.json')):
+                cases.append(FixtureCase(source, name, case_dir))
+    return cases
+
+
+class FixtureServer:
+    """Serve fixture pages on 127.0.0.1 from a background thread"""
+
+    def __init__(self, cases, port=0):
+        self.pages = {(case.source, case.wallet_address.lower()): case.page_path for case in cases}
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._make_handler())
+        self._thread = None
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def base_url(self, source):
+        return f"http://127.0.0.1:{self.port}/{source}"
+
+    def _make_handler(self):
+        pages = self.pages
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parts = [p for p in self.path.split('?', 1)[0].split('/') if p]
+                page_path = None
+                if len(parts) >= 2:
+                    page_path = pages.get((parts[0], parts[-1].lower()))
+                if page_path is None:
+                    self.send_error(404)
+                    return
+                with open(page_path, 'rb') as f:
+                    body = f.read()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
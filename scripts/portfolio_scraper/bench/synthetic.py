@@ -0,0 +1,517 @@
+"""Synthetic portfolio page generator for scale testing.
+
+Builds DeBank-, Jupiter- and Rabby-style DOM pages using the same class names
+and layouts the scrapers select on, with configurable project, section and
+row counts, together with the golden output a correct scraper must produce.
+Cases are written in the fixture layout served by bench/server.py.
+
+Every few rows is dust (< $5): scrapers capture it like any other row and the
+golden output includes it, so it is there for the query-time min_usd filter
+to hide. DeBank projects are emitted as one flat list of titles and
+panels, like the real page.
+"""
+import json
+import os
+import random
+from html import escape
+
+# name -> (projects, sections per project, rows per section)
+PRESETS = {
+    'tiny': (1, 1, 1),
+    'small': (5, 1, 2),
+    'medium': (20, 2, 2),
+    'large': (50, 2, 2),
+    'huge': (125, 2, 2),
+}
+
+DEBANK_SECTION_TYPES = ('Deposit', 'Yield', 'Staked', 'Locked', 'Lending')
+RABBY_SECTION_TYPES = DEBANK_SECTION_TYPES
+JUPITER_SECTION_TYPES = ('Farming', 'LiquidityPool', 'Lending', 'Leverage')
+
+_CHAINS = ('eth', 'arb', 'base', 'op', 'bsc', 'matic')
+_SYMBOLS = ('USDC', 'USDT', 'ETH', 'WBTC', 'DAI', 'SOL', 'JUP', 'reUSDe', 'sUSDe', 'CASH', 'ONyc', 'PT-sNUSD')
+_MARKETS = ('Main Market', 'JLP Market', 'Ethena Market', 'Altcoins Market')
+
+
+def _address(rng, source):
+    if source == 'jupiter':
+        alphabet = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+        return ''.join(rng.choice(alphabet) for _ in range(44))
+    return '0x' + ''.join(rng.choice('0123456789abcdef') for _ in range(40))
+
+
+class _Row:
+    """Generated position with its display texts"""
+
+    def __init__(self, rng, idx, dust):
+        self.symbol = f"{rng.choice(_SYMBOLS)}{idx}"
+        self.pool = f"{self.symbol}+{rng.choice(_SYMBOLS)} Pool"
+        self.identifier = f"#{idx:05d}"
+        self.usd_value = round(rng.uniform(0.01, 4.99), 2) if dust else round(rng.uniform(5.5, 50000), 2)
+        self.price = round(rng.uniform(0.05, 4000), 2)
+        self.balance = round(self.usd_value / self.price, 4)
+        self.yield_ = round(rng.uniform(0.1, 35), 2)
+
+    @property
+    def usd_text(self):
+        return f"${self.usd_value:,.2f}"
+
+    @property
+    def price_text(self):
+        return f"${self.price:,.2f}"
+
+    @property
+    def balance_text(self):
+        return f"{self.balance:,.4f} {self.symbol}"
+
+    @property
+    def yield_text(self):
+        return f"+{self.yield_:.2f}%"
+
+class _RowFactory:
+    def __init__(self, rng, dust_every=7):
+        self.rng = rng
+        self.dust_every = dust_every
+        self.count = 0
+
+    def __call__(self):
+        self.count += 1
+        dust = self.dust_every and self.count % self.dust_every == 0
+        return _Row(self.rng, self.count, dust)
+
+    def many(self, n):
+        return [self() for _ in range(n)]
+
+
+def _page(title, body):
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+        f"<title>{escape(title)}</title></head>\n<body>\n{body}\n</body></html>\n"
+    )
+
+
+def _div(cls, inner='', **attrs):
+    attr_text = ''.join(f' {k.rstrip("_")}="{escape(str(v))}"' for k, v in attrs.items())
+    return f'<div class="{cls}"{attr_text}>{inner}</div>'
+
+
+def _lending_split(rows):
+    """Split a lending section's rows into supplied and borrowed"""
+    cut = max(1, (len(rows) + 1) // 2)
+    return rows[:cut], rows[cut:]
+
+
+def _net_value(section_type, rows):
+    if section_type in ('Lending', 'Leverage'):
+        supplied, borrowed = _lending_split(rows)
+        return sum(r.usd_value for r in supplied) - sum(r.usd_value for r in borrowed)
+    return sum(r.usd_value for r in rows)
+
+
+# ---------------------------------------------------------------------------
+# DeBank
+# ---------------------------------------------------------------------------
+
+def _debank_row(cells):
+    return _div('table_contentRow__Mi3k5', ''.join(f'<div>{c}</div>' for c in cells))
+
+
+def _debank_link(text):
+    return f'<a class="utils_detailLink__XnB7N">{escape(text)}</a>'
+
+
+def _debank_section(section_type, rows, four_columns):
+    """Return (panel html, golden section dict)"""
+    golden = {"section_type": section_type}
+    body = _div('BookMark_bookmark__UG5a4', section_type)
+
+    if section_type == 'Lending':
+        supplied, borrowed = _lending_split(rows)
+        health_rate = 1.75
+        golden.update({"health_rate": health_rate, "supplied": [], "borrowed": []})
+        body += f'<div class="KV"><span>Health Rate</span><span>{health_rate}</span></div>'
+        for header, table_rows, key in (("Supplied", supplied, "supplied"), ("Borrowed", borrowed, "borrowed")):
+            if not table_rows:
+                continue
+            table = _div('table_header__onfbK', header)
+            for r in table_rows:
+                table += _debank_row([_debank_link(r.symbol), escape(r.balance_text), r.usd_text])
+                golden[key].append({"token": r.symbol, "balance": r.balance, "usd_value": r.usd_value})
+            body += f'<div>{table}</div>'
+        return _div('Panel_container__Vltd1', body), golden
+
+    golden["assets"] = []
+    for r in rows:
+        if section_type in ('Yield', 'Staked') and four_columns:
+            cells = [escape(r.identifier), _debank_link(r.pool), escape(r.balance_text), r.usd_text]
+            asset = {"identifier": r.identifier, "pool": r.pool}
+        elif section_type == 'Yield':
+            cells = [_debank_link(r.pool), escape(r.balance_text), r.usd_text]
+            asset = {"identifier": "", "pool": r.pool}
+        elif section_type == 'Staked':
+            # The scraper only reads the 4-column Staked layout
+            cells = [escape(r.identifier), _debank_link(r.pool), escape(r.balance_text), r.usd_text]
+            asset = {"identifier": r.identifier, "pool": r.pool}
+        elif section_type == 'Locked' and four_columns:
+            cells = [_debank_link(r.pool), escape(r.balance_text), '2026/12/31', r.usd_text]
+            asset = {"pool": r.pool}
+        else:
+            cells = [_debank_link(r.pool), escape(r.balance_text), r.usd_text]
+            asset = {"pool": r.pool}
+        body += _debank_row(cells)
+        asset.update({"balance": r.balance, "usd_value": r.usd_value})
+        golden["assets"].append(asset)
+    return _div('Panel_container__Vltd1', body), golden
+
+
+def generate_debank(projects, sections, rows, seed=0, tokens=None):
+    """Build a DeBank-style profile page and its golden output"""
+    rng = random.Random(seed)
+    make_rows = _RowFactory(rng)
+    address = _address(rng, 'debank')
+
+    token_rows = make_rows.many(tokens if tokens is not None else max(1, rows * 2))
+    wallet_total = sum(r.usd_value for r in token_rows)
+    wallet_rows = ''.join(
+        _div('db-table-wrappedRow', ''.join([
+            _div('db-table-cell', f'<a class="TokenWallet_detailLink__goYJR">{escape(r.symbol)}</a>'),
+            _div('db-table-cell', r.price_text),
+            _div('db-table-cell', escape(r.balance_text)),
+            _div('db-table-cell', r.usd_text),
+        ]))
+        for r in token_rows
+    )
+    wallet_golden = {
+        "project_name": "Token",
+        "chain": "evm",
+        "total_value": round(wallet_total, 2),
+        "sections": [{
+            "section_type": "Token",
+            "assets": [
+                {"token": r.symbol, "price": r.price, "amount": r.balance, "usd_value": r.usd_value}
+                for r in token_rows
+            ],
+        }],
+    }
+
+    parts = [
+        _div('ProjectTitle_projectTitle__yC5VD', _div('projectTitle-number', f"${wallet_total:,.2f}"), id='Wallet'),
+        _div('Card_card__pSup9 TokenWallet_card__teb0g', wallet_rows),
+    ]
+    golden_projects = [wallet_golden]
+
+    for p in range(projects):
+        chain = _CHAINS[p % len(_CHAINS)]
+        name = f"Protocol {p + 1}"
+        panels = []
+        golden_sections = []
+        total = 0.0
+        for s in range(sections):
+            section_type = DEBANK_SECTION_TYPES[(p + s) % len(DEBANK_SECTION_TYPES)]
+            section_rows = make_rows.many(rows)
+            total += _net_value(section_type, section_rows)
+            panel, golden_section = _debank_section(section_type, section_rows, four_columns=(p % 2 == 0))
+            panels.append(panel)
+            golden_sections.append(golden_section)
+        title_inner = (
+            f'<span class="ProjectTitle_protocolLink__4Yqn3">{escape(name)}</span>'
+            + _div('projectTitle-number', f"${total:,.2f}")
+        )
+        parts.append(_div('ProjectTitle_projectTitle__yC5VD', title_inner, id=f"{chain}_protocol{p + 1}"))
+        parts.extend(panels)
+        golden_projects.append({
+            "project_name": name,
+            "chain": chain,
+            "total_value": float(f"{total:.2f}"),
+            "sections": golden_sections,
+        })
+
+    html = _page(f"DeBank {address}", _div('Portfolio_projectList', '\n'.join(parts)))
+    golden = {
+        "blockchain": "evm",
+        "timestamp": None,
+        "wallet_address": address,
+        "projects_count": len(golden_projects),
+        "projects": golden_projects,
+    }
+    return html, golden, make_rows.count
+
+
+# ---------------------------------------------------------------------------
+# Jupiter
+# ---------------------------------------------------------------------------
+
+def _jupiter_token_cell(symbol):
+    return f'<td><p class="text-sm">{escape(symbol)}</p></td>'
+
+
+def _jupiter_tr(cells):
+    return f'<tr class="transition-colors">{"".join(cells)}</tr>'
+
+
+def _jupiter_section(section_type, rows, market):
+    """Return (details html, golden section dict)"""
+    golden = {"section_type": section_type}
+    if section_type in ('Lending', 'Leverage'):
+        summary = (
+            f'<summary>{section_type}'
+            f'<div class="flex flex-row items-center text-sm"><p>{escape(market)}</p></div></summary>'
+        )
+        supplied, borrowed = _lending_split(rows)
+        golden.update({"market_name": market, "supplied": [], "borrowed": []})
+        table = ''
+        for header, table_rows, key in (("Supplied", supplied, "supplied"), ("Borrowed", borrowed, "borrowed")):
+            if not table_rows:
+                continue
+            body = ''
+            for r in table_rows:
+                body += _jupiter_tr([
+                    _jupiter_token_cell(r.symbol),
+                    f'<td>{escape(r.balance_text)}</td>',
+                    '<td>-</td>',
+                    f'<td><span>{r.yield_text}</span></td>',
+                    f'<td>{r.usd_text}</td>',
+                ])
+                golden[key].append({"token": r.symbol, "balance": r.balance, "yield": r.yield_, "value": r.usd_value})
+            table += f'<thead><tr><th>{header}</th></tr></thead><tbody>{body}</tbody>'
+        return f'<details class="group/inner" open="">{summary}<table>{table}</table></details>', golden
+
+    summary = f'<summary>{"Liquidity Pool" if section_type == "LiquidityPool" else section_type}</summary>'
+    golden["assets"] = []
+    body = ''
+    for r in rows:
+        if section_type == 'Wallet':
+            body += _jupiter_tr([
+                _jupiter_token_cell(r.symbol),
+                f'<td>{escape(r.balance_text)}</td>',
+                f'<td>{r.price_text}</td>',
+                f'<td>{r.usd_text}</td>',
+            ])
+            asset = {"token": r.symbol, "balance": r.balance, "value": r.usd_value}
+        else:
+            body += _jupiter_tr([
+                _jupiter_token_cell(r.symbol),
+                f'<td>{escape(r.balance_text)}</td>',
+                f'<td><span>{r.yield_text}</span></td>',
+                f'<td>{r.usd_text}</td>',
+            ])
+            asset = {"token": r.symbol, "balance": r.balance, "yield": r.yield_, "value": r.usd_value}
+        golden["assets"].append(asset)
+    table = f'<thead><tr><th>Asset</th></tr></thead><tbody>{body}</tbody>'
+    return f'<details class="group/inner" open="">{summary}<table>{table}</table></details>', golden
+
+
+def generate_jupiter(projects, sections, rows, seed=0, tokens=None):
+    """Build a Jupiter-style portfolio page and its golden output"""
+    rng = random.Random(seed)
+    make_rows = _RowFactory(rng)
+    address = _address(rng, 'jupiter')
+
+    # The first open details element is the wallet summary the scraper skips
+    parts = ['<details class="platform-detail" open=""><summary><p>Net Worth</p></summary></details>']
+    golden_projects = []
+
+    holdings_rows = make_rows.many(tokens if tokens is not None else max(1, rows * 2))
+    wallet_html, wallet_golden = _jupiter_section('Wallet', holdings_rows, None)
+    parts.append(
+        f'<details class="platform-detail" open=""><summary><p>Holdings</p></summary>{wallet_html}</details>'
+    )
+    golden_projects.append({"project_name": "Holdings", "sections": [wallet_golden]})
+
+    for p in range(projects):
+        name = f"Platform {p + 1}"
+        inner = ''
+        golden_sections = []
+        for s in range(sections):
+            section_type = JUPITER_SECTION_TYPES[(p + s) % len(JUPITER_SECTION_TYPES)]
+            section_html, golden_section = _jupiter_section(
+                section_type, make_rows.many(rows), _MARKETS[(p + s) % len(_MARKETS)]
+            )
+            inner += section_html
+            golden_sections.append(golden_section)
+        parts.append(
+            f'<details class="platform-detail" open=""><summary><p>{escape(name)}</p></summary>{inner}</details>'
+        )
+        golden_projects.append({"project_name": name, "sections": golden_sections})
+
+    html = _page(f"Jupiter {address}", '\n'.join(parts))
+    golden = {
+        "blockchain": "solana",
+        "timestamp": None,
+        "wallet_address": address,
+        "projects_count": len(golden_projects),
+        "projects": golden_projects,
+    }
+    return html, golden, make_rows.count
+
+
+# ---------------------------------------------------------------------------
+# Rabby
+# ---------------------------------------------------------------------------
+
+def _rabby_row(cells):
+    return _div('rabby-ContentRow-rabby--e2twba', ''.join(f'<div>{c}</div>' for c in cells))
+
+
+def _rabby_name(text):
+    return f'<span class="ml-2">{escape(text)}</span>'
+
+
+def _rabby_section(section_type, rows):
+    """Return (panel html, golden section dict)"""
+    golden = {"section_type": section_type}
+    bookmark = _div('rabby-Bookmark-rabby--1kwtxm2', section_type)
+
+    if section_type == 'Lending':
+        supplied, borrowed = _lending_split(rows)
+        health_rate = 2.1
+        golden.update({"health_rate": health_rate, "supplied": [], "borrowed": []})
+        body = f'<span class="rabby-KVValue-rabby--1n591ca">{health_rate}</span>'
+        for header, table_rows, key in (("Supplied", supplied, "supplied"), ("Borrowed", borrowed, "borrowed")):
+            if not table_rows:
+                continue
+            content = ''
+            for r in table_rows:
+                content += _rabby_row([_rabby_name(r.symbol), escape(r.balance_text), r.usd_text])
+                golden[key].append({"token": r.symbol, "balance": r.balance, "usd_value": r.usd_value})
+            body += _div('px-8', _div('rabby-HeaderRow-rabby--1yo6z9x', header) + _div('rabby-Content-rabby--fixjhz', content))
+        return _div('rabby-Container-rabby--1rr9ga5', bookmark + body), golden
+
+    golden["assets"] = []
+    content = ''
+    for r in rows:
+        if section_type in ('Yield', 'Staked'):
+            cells = [escape(r.identifier), _rabby_name(r.pool), escape(r.balance_text), r.usd_text]
+            asset = {"identifier": r.identifier, "pool": r.pool}
+        elif section_type == 'Locked':
+            cells = [_rabby_name(r.pool), escape(r.balance_text), '2026/12/31', r.usd_text]
+            asset = {"pool": r.pool}
+        else:
+            cells = [_rabby_name(r.pool), escape(r.balance_text), r.usd_text]
+            asset = {"pool": r.pool}
+        content += _rabby_row(cells)
+        asset.update({"balance": r.balance, "usd_value": r.usd_value})
+        golden["assets"].append(asset)
+    return _div('rabby-Container-rabby--1rr9ga5', bookmark + _div('rabby-Content-rabby--fixjhz', content)), golden
+
+
+def generate_rabby(projects, sections, rows, seed=0, tokens=None):
+    """Build a Rabby-desktop-style page (wallet list, tabs, tokens, DeFi) and its golden output"""
+    rng = random.Random(seed)
+    make_rows = _RowFactory(rng)
+    address = _address(rng, 'rabby')
+
+    account = _div('desktop-account-item', (
+        _div('truncate text-[16px]', 'Benchmark Wallet')
+        + _div('address-viewer-text', address[:6] + '...' + address[-4:], title=address)
+    ))
+    tabs = (
+        _div('ant-tabs-tab-btn', 'DeFi', id='rc-tabs-0-tab-difi')
+        + _div('ant-tabs-tab-btn', 'Tokens', id='rc-tabs-0-tab-token')
+    )
+
+    token_rows = make_rows.many(tokens if tokens is not None else max(1, rows * 2))
+    token_html = ''.join(
+        _div('rabby-TokenRowWrapper-rabby--1n616m8', ''.join([
+            f'<div>{_rabby_name(r.symbol)}</div>',
+            f'<div>{r.price_text}</div>',
+            f'<div>{escape(r.balance_text)}</div>',
+            f'<div>{r.usd_text}</div>',
+        ]))
+        for r in token_rows
+    )
+    golden_projects = [{
+        "project_name": "Token",
+        "chain": "evm",
+        "total_value": sum(r.usd_value for r in token_rows),
+        "sections": [{
+            "section_type": "Token",
+            "assets": [
+                {"token": r.symbol, "price": r.price, "amount": r.balance, "usd_value": r.usd_value}
+                for r in token_rows
+            ],
+        }],
+    }]
+
+    protocol_html = ''
+    for p in range(projects):
+        chain = _CHAINS[p % len(_CHAINS)]
+        name = f"Protocol {p + 1}"
+        panels = ''
+        golden_sections = []
+        total = 0.0
+        for s in range(sections):
+            section_type = RABBY_SECTION_TYPES[(p + s) % len(RABBY_SECTION_TYPES)]
+            section_rows = make_rows.many(rows)
+            total += _net_value(section_type, section_rows)
+            panel, golden_section = _rabby_section(section_type, section_rows)
+            panels += panel
+            golden_sections.append(golden_section)
+        title = _div('flex items-center justify-start', f'<span class="name">{escape(name)}</span>')
+        value = _div('flex items-center justify-end flex-1', f'<span>${total:,.2f}</span>')
+        protocol_html += _div(
+            'rabby-ProtocolItemWrapper-rabby--utb8ns',
+            _div('flex', title + value) + _div('rabby-PoolListContainer-rabby--yotgd0', panels),
+            id=f"{chain}_protocol{p + 1}",
+        )
+        golden_projects.append({
+            "project_name": name,
+            "chain": chain,
+            "total_value": float(f"{total:.2f}"),
+            "sections": golden_sections,
+        })
+
+    body = (
+        f'<div data-test-id="virtuoso-item-list">{account}</div>\n'
+        f'<div class="ant-tabs">{tabs}</div>\n'
+        f'{token_html}\n{protocol_html}'
+    )
+    html = _page(f"Rabby {address}", body)
+    golden = {
+        "blockchain": "evm",
+        "timestamp": None,
+        "wallet_address": address,
+        "projects_count": len(golden_projects),
+        "projects": golden_projects,
+    }
+    return html, golden, make_rows.count
+
+
+GENERATORS = {
+    'debank': generate_debank,
+    'jupiter': generate_jupiter,
+    'rabby': generate_rabby,
+}
+
+
+def write_case(fixtures_dir, source, name, projects, sections, rows, seed=0, tokens=None):
+    """Generate one case and write page.html, golden.json and meta.json"""
+    html, golden, positions = GENERATORS[source](projects, sections, rows, seed=seed, tokens=tokens)
+    case_dir = os.path.join(fixtures_dir, source, name)
+    os.makedirs(case_dir, exist_ok=True)
+    with open(os.path.join(case_dir, 'page.html'), 'w', encoding='utf-8') as f:
+        f.write(html)
+    with open(os.path.join(case_dir, 'golden.json'), 'w', encoding='utf-8') as f:
+        json.dump(golden, f, indent=2)
+    with open(os.path.join(case_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump({
+            "wallet_address": golden["wallet_address"],
+            "size": name,
+            "synthetic": True,
+            "projects": projects,
+            "sections_per_project": sections,
+            "rows_per_section": rows,
+            "positions": positions,
+            "seed": seed,
+        }, f, indent=2)
+    return case_dir
+
+
+def write_presets(fixtures_dir, sources=None, presets=None, seed=0):
+    """Write the small..huge preset cases for the given sources"""
+    written = []
+    for source in sources or sorted(GENERATORS):
+        for name in presets or PRESETS:
+            projects, sections, rows = PRESETS[name]
+            written.append(write_case(fixtures_dir, source, name, projects, sections, rows, seed=seed))
+    return written
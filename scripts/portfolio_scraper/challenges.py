@@ -0,0 +1,101 @@
+"""
+"Needs human" queue for wallets blocked by a captcha/challenge
+
+Instead of waiting for a captcha in the middle of a cycle, the scraper raises
+CaptchaChallenge, the scheduler parks the wallet here (notifying once) and
+carries on with the other wallets. Parked wallets are retried at the end of
+the cycle, giving whoever got notified a bounded window to solve it.
+"""
+import json
+import threading
+import urllib.request
+from datetime import datetime
+
+from .config import NOTIFY_WEBHOOK_URL
+
+
+class CaptchaChallenge(Exception):
+    """Raised by a scraper when a wallet page is behind a captcha"""
+
+    def __init__(self, wallet_address, source, url=None):
+        super().__init__(f"{source} captcha for {wallet_address}")
+        self.wallet_address = wallet_address
+        self.source = source
+        self.url = url
+
+
+def notify(title, message):
+    """Tell a human: console banner plus optional webhook (Slack/Discord/ntfy style JSON)"""
+    print("\n" + "!" * 70)
+    print(f"🙋 {title}")
+    print(f"   {message}")
+    print("!" * 70 + "\n")
+
+    if not NOTIFY_WEBHOOK_URL:
+        return
+    try:
+        body = json.dumps({"text": f"{title}: {message}"}).encode('utf-8')
+        request = urllib.request.Request(
+            NOTIFY_WEBHOOK_URL, data=body, headers={'Content-Type': 'application/json'}
+        )
+        urllib.request.urlopen(request, timeout=10).close()
+    except Exception as e:
+        print(f"[Challenges] ⚠️  Notification webhook failed: {e}")
+
+
+class NeedsHumanQueue:
+    """Wallets parked until someone solves their challenge"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._parked = {}
+
+    def park(self, challenge, slot=0):
+        """Park a challenged wallet; notifies only the first time it is parked
+
+        `slot` is the scraper slot whose window shows the captcha.
+        """
+        with self._lock:
+            entry = self._parked.get(challenge.wallet_address)
+            is_new = entry is None
+            if is_new:
+                entry = self._parked[challenge.wallet_address] = {
+                    "source": challenge.source,
+                    "url": challenge.url,
+                    "parked_at": datetime.now().isoformat(),
+                    "attempts": 0,
+                }
+            entry["attempts"] += 1
+            entry["slot"] = slot
+            entry["last_seen"] = datetime.now().isoformat()
+
+        if is_new:
+            short_addr = f"{challenge.wallet_address[:8]}...{challenge.wallet_address[-8:]}"
+            notify(
+                f"{challenge.source} captcha needs solving",
+                f"Wallet {short_addr} is parked. Solve the captcha in the Chrome window "
+                f"({challenge.url or 'see scraper host'}); it is retried at the end of the cycle.",
+            )
+        return is_new
+
+    def resolve(self, wallet_address):
+        """Remove a wallet from the queue after a successful scrape"""
+        with self._lock:
+            return self._parked.pop(wallet_address, None) is not None
+
+    def wallets(self, source=None, slot=None):
+        """Parked wallet addresses, optionally for one source (and scraper slot)"""
+        with self._lock:
+            return [
+                w for w, entry in self._parked.items()
+                if (source is None or entry["source"] == source) and (slot is None or entry["slot"] == slot)
+            ]
+
+    def snapshot(self):
+        """JSON-serializable view for /health"""
+        with self._lock:
+            return {wallet: dict(entry) for wallet, entry in self._parked.items()}
+
+    def __len__(self):
+        with self._lock:
+            return len(self._parked)
@@ -4,11 +4,12 @@ Chrome browser management for debugging
 import os
 import subprocess
 import time
-import shutil
 import atexit
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from .utils import check_chrome_debug_port, kill_all_chrome_processes
+from .utils import check_chrome_debug_port
+from .supervisor import supervisor
+from .profile_sync import sync_profile
 
 
 chrome_process = None
@@ -35,47 +36,44 @@ def get_chrome_binary():
     return None
 
 
+PROFILE_ITEMS = [
+    'Cookies',
+    'Local Storage',
+    'Session Storage',
+    'IndexedDB',
+    'Local Extension Settings',
+    'Preferences',
+    'Extensions',
+    'Extension State',
+    'Extension Rules',
+    'Sync Extension Settings',
+]
+
+
 def copy_profile_data(source_profile, dest_dir):
-    """Copy essential profile data to debug directory"""
-    items_to_copy = [
-        'Cookies',
-        'Local Storage',
-        'Session Storage',
-        'IndexedDB',
-        'Local Extension Settings',
-        'Preferences',
-        'Extensions',
-        'Extension State',
-        'Extension Rules',
-        'Sync Extension Settings',
-    ]
-    
-    print(f"   📋 Copying profile data from: {source_profile}")
-    print(f"   📋 Copying profile data to: {dest_dir}")
-    
-    copied_items = []
-    for item in items_to_copy:
-        src = os.path.join(source_profile, item)
-        dst = os.path.join(dest_dir, item)
-        
-        if os.path.exists(src):
-            try:
-                if os.path.isdir(src):
-                    if os.path.exists(dst):
-                        shutil.rmtree(dst)
-                    shutil.copytree(src, dst)
-                else:
-                    if os.path.exists(dst):
-                        os.remove(dst)
-                    shutil.copy2(src, dst)
-                copied_items.append(item)
-                print(f"      ✓ Copied: {item}")
-            except Exception as e:
-                print(f"      ⚠️  Warning: Could not copy {item}: {e}")
-        else:
+    """Incrementally sync essential profile data into the debug directory
+
+    Only files that changed since the last sync are copied (see profile_sync),
+    so restarting Chrome with an up-to-date debug profile is near-instant.
+    """
+    print(f"   📋 Syncing profile data from: {source_profile}")
+    print(f"   📋 Syncing profile data to: {dest_dir}")
+
+    start = time.time()
+    stats = sync_profile(source_profile, dest_dir, PROFILE_ITEMS)
+
+    for item in PROFILE_ITEMS:
+        if item not in stats["items"]:
             print(f"      ⚠️  Not found: {item}")
-    
-    return copied_items
+    print(
+        f"      ✓ {len(stats['items'])} items in {time.time() - start:.2f}s: "
+        f"{stats['copied']} copied ({stats['bytes'] / 1024 / 1024:.1f} MB), "
+        f"{stats['reflinked']} reflinked, {stats['unchanged']} unchanged, {stats['removed']} removed"
+    )
+    if stats["errors"]:
+        print(f"      ⚠️  {stats['errors']} files could not be synced")
+
+    return stats["items"]
 
 
 def test_selenium_connection(debug_port):
@@ -109,7 +107,11 @@ def start_chrome_with_debug(debug_port, chrome_profile, copy_profile=True, start
     print(f"🚀 STARTING CHROME WITH REMOTE DEBUGGING - {mode}")
     print("="*70)
     
-    kill_all_chrome_processes()
+    debug_data_dir = os.path.expanduser('~/.chrome_debug_profile')
+    
+    # Only our own debug Chrome: a previous instance, or one left over from a crash
+    supervisor.reap('debug-chrome')
+    supervisor.reap_profile(debug_data_dir)
     
     chrome_binary = get_chrome_binary()
     if not chrome_binary:
@@ -118,8 +120,6 @@ def start_chrome_with_debug(debug_port, chrome_profile, copy_profile=True, start
     
     print(f"✓ Found Chrome: {chrome_binary}")
     
-    debug_data_dir = os.path.expanduser('~/.chrome_debug_profile')
-    
     if copy_profile:
         main_chrome_dir = os.path.expanduser('~/.config/google-chrome')
         source_profile = os.path.join(main_chrome_dir, chrome_profile)
@@ -131,24 +131,12 @@ def start_chrome_with_debug(debug_port, chrome_profile, copy_profile=True, start
         if os.path.exists(source_profile):
             print(f"\n   ✓ Source profile exists")
             
-            # Clean destination directory for fresh copy
-            if os.path.exists(debug_data_dir):
-                print(f"   🗑️  Removing old debug profile...")
-                try:
-                    shutil.rmtree(debug_data_dir)
-                    print(f"      ✓ Old profile removed")
-                except Exception as e:
-                    print(f"      ⚠️  Warning: Could not remove old profile: {e}")
-            
-            # Create fresh destination
-            os.makedirs(debug_data_dir, exist_ok=True)
-            
-            # Copy profile data
+            # Sync into the existing debug profile; it doubles as a cached clone
             copied = copy_profile_data(source_profile, debug_data_dir)
             if copied:
-                print(f"\n   ✓ Profile copied successfully ({len(copied)} items)")
+                print(f"\n   ✓ Profile synced successfully ({len(copied)} items)")
             else:
-                print("   ⚠️  No profile data copied (starting fresh)")
+                print("   ⚠️  No profile data found (starting fresh)")
         else:
             print(f"\n   ❌ Source profile not found: {source_profile}")
             print("      Available profiles:")
@@ -203,6 +191,7 @@ def start_chrome_with_debug(debug_port, chrome_profile, copy_profile=True, start
                 preexec_fn=os.setsid
             )
         
+        supervisor.track(chrome_process.pid, 'debug-chrome', debug_data_dir)
         print(f"   Chrome process started (PID: {chrome_process.pid})")
         print(f"   Logs: {log_file}")
         
@@ -275,16 +264,12 @@ def cleanup_chrome():
     if chrome_process:
         print("\n🧹 Shutting down Chrome...")
         try:
-            chrome_process.terminate()
-            try:
-                chrome_process.wait(timeout=5)
-                print("   ✓ Chrome terminated gracefully")
-            except subprocess.TimeoutExpired:
-                chrome_process.kill()
-                chrome_process.wait()
-                print("   ✓ Chrome force killed")
+            # Browser plus its renderers/GPU/utility children, waiting for them to exit
+            count = supervisor.reap('debug-chrome')
+            print(f"   ✓ Chrome shut down ({count} processes)")
         except Exception as e:
             print(f"   Error during cleanup: {e}")
+        chrome_process = None
 
 
 # Register cleanup on module import
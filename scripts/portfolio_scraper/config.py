@@ -32,6 +32,26 @@ def _parse_int(env_var: str, default: int) -> int:
         return default
 
 
+def _parse_float(env_var: str, default: float) -> float:
+    """Parse a non-negative number from environment variable"""
+    value = os.getenv(env_var, '')
+    if not value.strip():
+        return default
+    try:
+        number = float(value)
+    except ValueError:
+        return default
+    return number if number >= 0 else default
+
+
+def _parse_bool(env_var: str, default: bool) -> bool:
+    """Parse boolean flag (1/true/yes/on) from environment variable"""
+    value = os.getenv(env_var, '')
+    if not value.strip():
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
 # Wallet addresses to scrape automatically
 SOLANA_ADDRESSES = _parse_list('SOLANA_ADDRESSES', default=[])
 EVM_ADDRESSES = _parse_list('EVM_ADDRESSES', default=[])
@@ -56,3 +76,62 @@ NGROK_AUTHTOKEN = os.getenv('NGROK_AUTHTOKEN')
 
 # Output directory for JSON files
 OUTPUT_DIR = os.getenv('OUTPUT_DIR', '/home/ivo/code/defi-yields/feeds/temp')
+
+# WebDriver round-trip profiling (counts/times every driver command)
+WEBDRIVER_PROFILE = _parse_bool('WEBDRIVER_PROFILE', default=False)
+WEBDRIVER_PROFILE_FILE = os.getenv('WEBDRIVER_PROFILE_FILE', os.path.join(OUTPUT_DIR, 'webdriver_profile.json'))
+
+# Browser resource usage: block images/fonts/analytics via CDP and use a lean launch profile
+BLOCK_RESOURCES = _parse_bool('BLOCK_RESOURCES', default=True)
+BLOCKED_URL_PATTERNS = _parse_list('BLOCKED_URL_PATTERNS', default=[])  # Extra patterns, e.g. *.svg
+LEAN_BROWSER = _parse_bool('LEAN_BROWSER', default=True)
+
+# Run Jupiter/DeBank Chrome headless; Jupiter switches to a visible window only to solve a captcha
+HEADLESS = _parse_bool('HEADLESS', default=True)
+
+# Captcha handling: challenged wallets are parked and retried at the end of the cycle
+CAPTCHA_WAIT_SECONDS = _parse_int('CAPTCHA_WAIT_SECONDS', default=120)  # Wait per retry at cycle end
+NOTIFY_WEBHOOK_URL = os.getenv('NOTIFY_WEBHOOK_URL')  # Optional JSON webhook ({"text": ...})
+
+# Retry/backoff for failed wallets and per-source circuit breakers
+RETRY_ATTEMPTS = _parse_int('RETRY_ATTEMPTS', default=3)  # Attempts per wallet per cycle
+RETRY_BASE_SECONDS = _parse_int('RETRY_BASE_SECONDS', default=5)  # Doubled after each failed attempt
+RETRY_MAX_SECONDS = _parse_int('RETRY_MAX_SECONDS', default=60)
+BREAKER_FAILURE_THRESHOLD = _parse_int('BREAKER_FAILURE_THRESHOLD', default=3)  # Consecutive failures to open
+BREAKER_RESET_SECONDS = _parse_int('BREAKER_RESET_SECONDS', default=600)  # Open time before a probe
+
+# Enabled scraper sources in priority order (see registry.py): jupiter, debank, rabby
+SCRAPER_SOURCES = _parse_list('SCRAPER_SOURCES', default=['jupiter', 'debank'])
+
+# Race all enabled sources for a wallet (e.g. debank and rabby for EVM): the first
+# result is served, later ones are cross-checked against it
+FANOUT = _parse_bool('FANOUT', default=False)
+CROSSCHECK_TOLERANCE_PCT = _parse_int('CROSSCHECK_TOLERANCE_PCT', default=5)  # Flag totals differing by more
+
+# Drift detection: scrapes whose structure departs from the wallet's recent history
+# (or whose rows don't add up to the page's project totals) don't replace the cache
+DRIFT_HISTORY = _parse_int('DRIFT_HISTORY', default=10)  # Accepted scrapes kept per wallet and source
+DRIFT_TOLERANCE_PCT = _parse_int('DRIFT_TOLERANCE_PCT', default=50)  # Flag counts/totals off by more
+DRIFT_CONFIRMATIONS = _parse_int('DRIFT_CONFIRMATIONS', default=3)  # Suspicious scrapes in a row accepted as the new normal
+
+# DeBank/Rabby projects whose rows don't add up to the total shown on the page
+# (within this percentage, or $1) are extracted again once
+RECONCILE_TOLERANCE_PCT = _parse_int('RECONCILE_TOLERANCE_PCT', default=1)
+
+# Scrapers capture every row; rows worth less than this many dollars are hidden
+# when serving /portfolio (override per request with ?min_usd=)
+MIN_USD_VALUE = _parse_float('MIN_USD_VALUE', default=5.0)
+
+# Run Jupiter and DeBank as tabs of one shared Chrome instead of one Chrome each
+SHARED_BROWSER = _parse_bool('SHARED_BROWSER', default=False)
+
+# Chrome process trees using more resident memory than this are flagged as bloated,
+# and the memory watchdog recycles a driver between wallets above either limit
+CHROME_MAX_RSS_MB = _parse_int('CHROME_MAX_RSS_MB', default=2048)
+JS_HEAP_MAX_MB = _parse_int('JS_HEAP_MAX_MB', default=768)
+
+# Cached data older than this is served with stale=true and refreshed in the background
+STALE_AFTER_SECONDS = _parse_int('STALE_AFTER_SECONDS', default=2 * SCRAPE_INTERVAL_MINUTES * 60)
+# Smallest ?max_age= a client may ask for: lower values would let any request
+# start a browser re-scrape
+MIN_MAX_AGE_SECONDS = _parse_int('MIN_MAX_AGE_SECONDS', default=300)
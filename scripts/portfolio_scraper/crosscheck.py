@@ -0,0 +1,77 @@
+"""
+Cross-validation of the same wallet scraped by two sources
+
+DeBank and Rabby name and group things differently ("Aave V3" vs "Aave v3",
+a project split over several sections), so both portfolios are first reduced
+to a common summary: net USD per normalized project name (assets + supplied -
+borrowed) and the wallet total. compare() then flags a discrepancy when the
+totals, or a project's value, differ by more than the tolerance.
+"""
+import re
+
+from .config import CROSSCHECK_TOLERANCE_PCT
+
+# Differences below this many dollars are never flagged (dust, rounding)
+MIN_ABSOLUTE_DIFF = 1.0
+
+
+def normalize_name(name):
+    """'Aave V3 (Arbitrum)' -> 'aavev3arbitrum'"""
+    return re.sub(r'[^a-z0-9]', '', (name or '').lower())
+
+
+def net_value(section):
+    """Net USD of a section: supplied and plain assets count positive, borrowed negative"""
+    value = sum(a.usd_value for a in section.assets or [])
+    value += sum(a.usd_value for a in section.supplied or [])
+    value -= sum(abs(a.usd_value) for a in section.borrowed or [])
+    return value
+
+
+def summarize(portfolio):
+    """Common schema for comparison: {"total_usd", "projects": {name: net usd}}"""
+    projects = {}
+    for project in portfolio.projects:
+        name = normalize_name(project.project_name)
+        projects[name] = projects.get(name, 0.0) + sum(net_value(s) for s in project.sections)
+    return {
+        "total_usd": round(sum(projects.values()), 2),
+        "projects": {name: round(value, 2) for name, value in projects.items()},
+    }
+
+
+def _differs(a, b, tolerance_pct):
+    diff = abs(a - b)
+    if diff < MIN_ABSOLUTE_DIFF:
+        return False
+    return diff > max(abs(a), abs(b)) * tolerance_pct / 100
+
+
+def compare(primary, secondary, primary_source, secondary_source, tolerance_pct=None):
+    """Compare two portfolios of one wallet; returns a JSON-serializable report"""
+    tolerance_pct = CROSSCHECK_TOLERANCE_PCT if tolerance_pct is None else tolerance_pct
+    a, b = summarize(primary), summarize(secondary)
+
+    mismatches = []
+    for name in sorted(set(a["projects"]) | set(b["projects"])):
+        value_a = a["projects"].get(name)
+        value_b = b["projects"].get(name)
+        if value_a is None or value_b is None:
+            # Only flag missing projects that matter (0.0 is a value, not a miss)
+            value = value_a if value_a is not None else value_b
+            if abs(value) >= MIN_ABSOLUTE_DIFF:
+                mismatches.append({"project": name, primary_source: value_a, secondary_source: value_b})
+        elif _differs(value_a, value_b, tolerance_pct):
+            mismatches.append({"project": name, primary_source: value_a, secondary_source: value_b})
+
+    total_diff = round(a["total_usd"] - b["total_usd"], 2)
+    base = max(abs(a["total_usd"]), abs(b["total_usd"]))
+    return {
+        "sources": [primary_source, secondary_source],
+        "totals": {primary_source: a["total_usd"], secondary_source: b["total_usd"]},
+        "total_diff_usd": total_diff,
+        "total_diff_pct": round(abs(total_diff) / base * 100, 2) if base else 0.0,
+        "tolerance_pct": tolerance_pct,
+        "project_mismatches": mismatches,
+        "consistent": not _differs(a["total_usd"], b["total_usd"], tolerance_pct),
+    }
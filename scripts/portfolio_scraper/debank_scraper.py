@@ -5,63 +5,153 @@ import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-import time
+from selenium.common.exceptions import TimeoutException
 import os
+import time
 from datetime import datetime
 from .utils import get_chrome_major_version
+from .model import Portfolio
+from .metrics import span, inc, DRIFT_METRIC
+from .config import HEADLESS
+from .webdriver_profiler import maybe_attach
+from .supervisor import supervisor
+from .scraper_base import Scraper
+from .browser import build_chrome_options, apply_request_blocking
+from .scroll_harvest import harvest
+from .parsing import parse_numeric_value
+from .section_specs import (
+    DEBANK, EXTRACTOR_JS, compile_spec, healed_spec, prefix_selector, build_token_project,
+)
+from .reconcile import build_reconciled, project_report, wallet_report
+
+
+# Project titles and panels are siblings in one flat list, so each panel is
+# assigned to the closest preceding (non-Wallet) project title; nested panels
+# belong to their parent. Leaves [[title, panel, panel, ...], ...] in `groups`.
+GROUP_PROJECT_PANELS_JS = """
+const spec = arguments[0];
+const nodes = document.querySelectorAll(spec.project.title + ', ' + spec.project.panels);
+const groups = [];
+let current = null;
+for (const node of nodes) {
+    if (node.matches(spec.project.title)) {
+        current = node.id === 'Wallet' ? null : [node];
+        if (current) groups.push(current);
+    } else if (current && !node.parentElement.closest(spec.project.panels)) {
+        current.push(node);
+    }
+}
+"""
+
+# Reads the whole profile page in one script call
+EXTRACT_PORTFOLIO_JS = EXTRACTOR_JS + GROUP_PROJECT_PANELS_JS + """
+const wallet = document.querySelector(spec.project.title + '#Wallet');
+return {
+    wallet: wallet && {
+        total: text(wallet.querySelector(spec.project.total)),
+        rows: extractTokens(spec.token_table),
+    },
+    projects: groups.map(group => extractProject(group[0], group.slice(1), spec)),
+};
+"""
+
+# Reads the project whose title has id arguments[1] again
+EXTRACT_ONE_PROJECT_JS = EXTRACTOR_JS + GROUP_PROJECT_PANELS_JS + """
+const group = groups.find(group => group[0].id === arguments[1]);
+return group ? extractProject(group[0], group.slice(1), spec) : null;
+"""
+
+# Seconds for a project scrolled into view to finish rendering before it is re-extracted
+REEXTRACT_SETTLE_SECONDS = 1
+
+DEBANK_JS_SPEC = compile_spec(DEBANK)
+DEBANK_HEALED_JS_SPEC = compile_spec(healed_spec(DEBANK))  # Fallback after DeBank re-hashes its classes
+
+# Project titles under either naming, for the readiness wait and lazy loading
+TITLE_SELECTOR = f"{DEBANK['project']['title']}, {prefix_selector(DEBANK['project']['title'])}"
+
+
+def page_gaps(page):
+    """Parts of an extracted page that were expected but not found"""
+    if not page:
+        return 3
+    gaps = 0
+    wallet = page["wallet"]
+    if wallet is None:
+        gaps += 2
+    elif wallet["rows"] is None:
+        gaps += 1
+    if not page["projects"]:
+        gaps += 1
+    for project in page["projects"]:
+        if not project["panels"]:
+            gaps += 1
+        for panel in project["panels"]:
+            if panel is None or not (panel.get("rows") or any(t["rows"] for t in panel.get("tables", []))):
+                gaps += 1
+    return gaps
 
 
-class DebankScraper:
+class DebankScraper(Scraper):
     """Scraper for DeBank portfolio with anti-bot detection"""
     
-    def __init__(self, debug_port=None, user_data_dir=None):
+    name = 'debank'
+    tag = 'DeBank'
+    
+    BASE_URL = "https://debank.com"
+    
+    def __init__(self, debug_port=None, user_data_dir=None, base_url=None, headless=None, block_resources=None, session=None, slot=0):
         self.driver = None
+        self.slot = slot  # Concurrency slot: own profile and supervisor label
         self.debug_port = debug_port  # Not used anymore, kept for compatibility
-        self.user_data_dir = user_data_dir or os.path.expanduser('~/.chrome_debank_scraper')
-        self.min_usd_value = 5  # Minimum USD value threshold
-    
-    def is_driver_alive(self):
-        """Check if the driver is still responsive"""
-        if not self.driver:
-            return False
-        try:
-            # Try a simple command to check if driver is responsive
-            _ = self.driver.current_url
-            return True
-        except Exception:
-            return False
+        self.user_data_dir = user_data_dir or self.slot_profile(os.path.expanduser('~/.chrome_debank_scraper'))
+        self.base_url = base_url or self.BASE_URL  # Overridden by the offline benchmark
+        self.session = session  # Shared BrowserSession: run in its 'debank' tab
+        if session:
+            headless = session.headless
+        self.headless = HEADLESS if headless is None else headless
+        self.block_resources = block_resources  # None -> BLOCK_RESOURCES from config
+        self.js_spec = DEBANK_JS_SPEC
+        self.selector_fallback = False  # Switched to prefix-match selectors
+        self.reconciliation = {}  # wallet -> reconciliation report of its last scrape
     
     def connect_to_chrome(self):
         """Start Chrome with undetected-chromedriver for anti-detection"""
+        if self.session:
+            # Also switches the shared browser back to our tab
+            return self.attach_session()
+        
         print("[DeBank] Starting Chrome with anti-detection...")
         print(f"[DeBank] Profile directory: {self.user_data_dir}")
         
         try:
+            # A Chrome left over from a crash would still hold the profile lock
+            supervisor.reap_profile(self.user_data_dir)
+            
             # undetected-chromedriver options
-            options = uc.ChromeOptions()
-            options.add_argument(f'--user-data-dir={self.user_data_dir}')
-            options.add_argument('--no-first-run')
-            options.add_argument('--no-default-browser-check')
+            options = build_chrome_options(uc.ChromeOptions(), self.user_data_dir, headless=self.headless)
             options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-software-rasterizer')
             
             # Start Chrome with anti-detection
-            version_main = get_chrome_major_version()
-            if version_main:
-                print(f"[DeBank] ℹ Using detected Chrome major version: {version_main}")
-                self.driver = uc.Chrome(
-                    options=options,
-                    version_main=version_main,
-                    use_subprocess=False  # Avoid port conflicts
-                )
-            else:
-                print("[DeBank] ℹ Chrome version unknown; using auto-detection")
-                self.driver = uc.Chrome(
-                    options=options,
-                    use_subprocess=False  # Avoid port conflicts
-                )
+            with span('connect', source='debank'):
+                version_main = get_chrome_major_version()
+                if version_main:
+                    print(f"[DeBank] ℹ Using detected Chrome major version: {version_main}")
+                    self.driver = uc.Chrome(
+                        options=options,
+                        version_main=version_main,
+                        use_subprocess=False  # Avoid port conflicts
+                    )
+                else:
+                    print("[DeBank] ℹ Chrome version unknown; using auto-detection")
+                    self.driver = uc.Chrome(
+                        options=options,
+                        use_subprocess=False  # Avoid port conflicts
+                    )
+            
+            supervisor.track_driver(self.driver, self.label, self.user_data_dir)
+            maybe_attach(self.driver)
+            apply_request_blocking(self.driver, self.block_resources, label="DeBank")
             
             print(f"[DeBank] ✓ Chrome started with anti-detection")
             print(f"[DeBank] ℹ Profile persists at: {self.user_data_dir}")
@@ -74,618 +164,118 @@ class DebankScraper:
     
     def navigate_to_debank(self, wallet_address):
         """Navigate to DeBank profile page for given address"""
-        url = f"https://debank.com/profile/{wallet_address}"
+        if self.session and not self.connect_to_chrome():
+            return False
+        
+        url = f"{self.base_url}/profile/{wallet_address}"
         print(f"[DeBank] Navigating to {url}...")
-        self.driver.get(url)
+        with span('navigate', source='debank'):
+            self.driver.get(url)
         
         try:
             # Wait for page to load - look for the Wallet section
-            WebDriverWait(self.driver, 20).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.ProjectTitle_projectTitle__yC5VD"))
-            )
+            with span('readiness_wait', source='debank'):
+                WebDriverWait(self.driver, 20).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, TITLE_SELECTOR))
+                )
             print("[DeBank] ✓ Profile page loaded")
-            time.sleep(3)  # Give extra time for dynamic content
             
-            # Scroll to trigger lazy loading
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            # Scroll through the project list until no new projects render
+            with span('lazy_load', source='debank'):
+                harvest(self.driver, TITLE_SELECTOR, label="DeBank")
             
             return True
         except TimeoutException:
             print("[DeBank] ✗ Failed to load profile page")
             return False
     
-    def parse_numeric_value(self, text):
-        """Parse numeric value from text (remove $ and commas)"""
-        text = text.strip()
-        if text.startswith('<') or text.startswith('>'):
-            return 0
-        text = text.replace('$', '').replace(',', '')
-        try:
-            return float(text)
-        except ValueError:
-            return 0
-
-    def parse_amount_value(self, text):
-        """Parse numeric amount from text like '19,033.70 reUSDe'"""
-        parts = text.strip().split()
-        if not parts:
-            return 0
-        amount_text = parts[0].replace(',', '')
-        try:
-            return float(amount_text)
-        except ValueError:
-            return 0
-    
-    def extract_balance_value(self, balance_text):
-        """Extract numeric balance from text like '99,453.1873 PT-sNUSD-5MAR2026' -> '99,453.1873'"""
-        parts = balance_text.strip().split()
-        if parts:
-            return parts[0]
-        return balance_text
-    
-    def scrape_wallet_section(self):
-        """Scrape Wallet section (equivalent to Token tab in Rabby)"""
+    def build_wallet_project(self, wallet):
+        """Wallet section (equivalent to Token tab in Rabby) as the "Token" project"""
         print("[DeBank] Scraping Wallet section...")
-        
-        wallet_data = {
-            "project_name": "Token",
-            "chain": "evm",
-            "total_value": 0,
-            "sections": [
-                {
-                    "section_type": "Token",
-                    "assets": []
-                }
-            ]
-        }
-        
-        try:
-            # Find Wallet section
-            wallet_section = self.driver.find_element(By.CSS_SELECTOR, "div.ProjectTitle_projectTitle__yC5VD#Wallet")
-            
-            # Extract total value from Wallet header
-            try:
-                total_value_elem = wallet_section.find_element(By.CSS_SELECTOR, "div.projectTitle-number")
-                total_value_text = total_value_elem.text.strip()
-                wallet_data["total_value"] = self.parse_numeric_value(total_value_text)
-                print(f"[DeBank]   Wallet total value: ${wallet_data['total_value']}")
-            except NoSuchElementException:
-                print("[DeBank]   Warning: Could not find wallet total value")
-            
-            # Find the wallet table
-            wallet_card = self.driver.find_element(By.CSS_SELECTOR, "div.Card_card__pSup9.TokenWallet_card__teb0g")
-            
-            # Find all asset rows
-            asset_rows = wallet_card.find_elements(By.CSS_SELECTOR, "div.db-table-wrappedRow")
-            print(f"[DeBank]   Found {len(asset_rows)} wallet assets")
-            
-            for row in asset_rows:
-                try:
-                    # Get all cells in the row
-                    cells = row.find_elements(By.CSS_SELECTOR, "div.db-table-cell")
-                    
-                    if len(cells) >= 4:
-                        # Extract token name
-                        token = None
-                        try:
-                            token_elem = cells[0].find_element(By.CSS_SELECTOR, "a.TokenWallet_detailLink__goYJR")
-                            token = token_elem.text.strip()
-                        except NoSuchElementException:
-                            token = cells[0].text.strip()
-                        
-                        # Extract price
-                        price_text = cells[1].text.strip()
-                        price = self.parse_numeric_value(price_text)
-                        
-                        # Extract amount
-                        amount_text = cells[2].text.strip()
-                        amount = self.parse_amount_value(amount_text)
-                        
-                        # Extract USD value
-                        usd_text = cells[3].text.strip()
-                        usd_value = self.parse_numeric_value(usd_text)
-                        
-                        # Filter by minimum USD value
-                        if token and usd_value >= self.min_usd_value:
-                            wallet_data["sections"][0]["assets"].append({
-                                "token": token,
-                                "price": price,
-                                "amount": amount,
-                                "usd_value": usd_value
-                            })
-                            print(f"[DeBank]     ✓ {token}: ${usd_value}")
-                        elif usd_value < self.min_usd_value:
-                            print(f"[DeBank]     ⊘ Skipped (< ${self.min_usd_value}): {token} - ${usd_value}")
-                
-                except Exception as e:
-                    print(f"[DeBank]     Warning: Failed to parse wallet asset: {e}")
-                    continue
-        
-        except NoSuchElementException:
+        if wallet is None:
             print("[DeBank]   ⚠ Wallet section not found")
-        except Exception as e:
-            print(f"[DeBank]   Error scraping wallet section: {e}")
-        
-        return wallet_data
-    
-    def scrape_lending_section(self, section_elem):
-        """Scrape Lending section"""
-        lending_data = {
-            "section_type": "Lending",
-            "health_rate": None,
-            "supplied": [],
-            "borrowed": []
-        }
+            return build_token_project([], DEBANK, total_value=0)
         
-        try:
-            # Extract Health Rate if present (look for it in the section)
-            try:
-                # Health rate might be in a KV display or similar element
-                # This selector may need adjustment based on actual DeBank HTML
-                health_rate_elem = section_elem.find_element(By.XPATH, ".//span[contains(text(), 'Health')]/..//span[not(contains(text(), 'Health'))]")
-                health_rate_text = health_rate_elem.text.strip()
-                try:
-                    lending_data["health_rate"] = float(health_rate_text)
-                except ValueError:
-                    lending_data["health_rate"] = health_rate_text
-            except NoSuchElementException:
-                pass
-            
-            # Find all tables within this section (Supplied and Borrowed)
-            tables = section_elem.find_elements(By.CSS_SELECTOR, "div.table_header__onfbK")
-            
-            for table_idx, table_header in enumerate(tables):
-                try:
-                    # Get header text to determine if it's Supplied or Borrowed
-                    header_text = table_header.text.lower()
-                    
-                    # Find the parent container and then get content rows
-                    table_container = table_header.find_element(By.XPATH, "./..")
-                    content_rows = table_container.find_elements(By.CSS_SELECTOR, "div.table_contentRow__Mi3k5")
-                    
-                    print(f"[DeBank]         Table '{header_text}': {len(content_rows)} rows")
-                    
-                    for row in content_rows:
-                        try:
-                            cells = row.find_elements(By.XPATH, "./div")
-                            
-                            if len(cells) >= 3:
-                                # Extract token name
-                                token = None
-                                try:
-                                    token_elem = cells[0].find_element(By.CSS_SELECTOR, "a.utils_detailLink__XnB7N")
-                                    token = token_elem.text.strip()
-                                except NoSuchElementException:
-                                    token = cells[0].text.strip()
-                                
-                                # Extract balance (numeric value only)
-                                balance_text = cells[1].text.strip()
-                                balance_value = self.extract_balance_value(balance_text)
-                                
-                                # Extract USD value (numeric only)
-                                usd_text = cells[2].text.strip()
-                                usd_value = self.parse_numeric_value(usd_text)
-                                
-                                # Filter by minimum USD value
-                                if token and balance_value and usd_value >= self.min_usd_value:
-                                    asset_info = {
-                                        "token": token,
-                                        "balance": balance_value,
-                                        "usd_value": usd_value
-                                    }
-                                    
-                                    if "supplied" in header_text or "supply" in header_text:
-                                        lending_data["supplied"].append(asset_info)
-                                        print(f"[DeBank]           ✓ Supplied: {token} - ${usd_value}")
-                                    elif "borrowed" in header_text or "borrow" in header_text:
-                                        lending_data["borrowed"].append(asset_info)
-                                        print(f"[DeBank]           ✓ Borrowed: {token} - ${usd_value}")
-                                elif usd_value < self.min_usd_value:
-                                    print(f"[DeBank]           ⊘ Skipped (< ${self.min_usd_value}): {token} - ${usd_value}")
-                        
-                        except Exception as e:
-                            print(f"[DeBank]           Warning: Failed to parse row: {e}")
-                            continue
-                
-                except Exception as e:
-                    print(f"[DeBank]         Warning: Failed to parse table: {e}")
-                    continue
-        
-        except Exception as e:
-            print(f"[DeBank]       Error scraping lending section: {e}")
-        
-        return lending_data
-    
-    def scrape_deposit_section(self, section_elem):
-        """Scrape Deposit section"""
-        deposit_data = {
-            "section_type": "Deposit",
-            "assets": []
-        }
-        
-        try:
-            # Find content rows (they're inside the panel)
-            content_rows = section_elem.find_elements(By.CSS_SELECTOR, "div.table_contentRow__Mi3k5")
-            
-            print(f"[DeBank]         Found {len(content_rows)} deposit rows")
-            
-            for row in content_rows:
-                try:
-                    cells = row.find_elements(By.XPATH, "./div")
-                    
-                    if len(cells) >= 3:
-                        # Extract pool name
-                        pool = None
-                        try:
-                            pool_elem = cells[0].find_element(By.CSS_SELECTOR, "a.utils_detailLink__XnB7N")
-                            pool = pool_elem.text.strip()
-                        except NoSuchElementException:
-                            pool = cells[0].text.strip()
-                        
-                        # Extract balance (numeric value only)
-                        balance_text = cells[1].text.strip()
-                        balance_value = self.extract_balance_value(balance_text)
-                        
-                        # Extract USD value (numeric only)
-                        usd_text = cells[2].text.strip()
-                        usd_value = self.parse_numeric_value(usd_text)
-                        
-                        # Filter by minimum USD value
-                        if pool and balance_value and usd_value >= self.min_usd_value:
-                            asset_info = {
-                                "pool": pool,
-                                "balance": balance_value,
-                                "usd_value": usd_value
-                            }
-                            deposit_data["assets"].append(asset_info)
-                            print(f"[DeBank]         ✓ Parsed deposit: {pool} - ${usd_value}")
-                        elif usd_value < self.min_usd_value:
-                            print(f"[DeBank]         ⊘ Skipped (< ${self.min_usd_value}): {pool} - ${usd_value}")
-                
-                except Exception as e:
-                    print(f"[DeBank]         Warning: Failed to parse deposit row: {e}")
-                    continue
-        
-        except Exception as e:
-            print(f"[DeBank]       Error scraping deposit section: {e}")
-        
-        return deposit_data
-    
-    def scrape_yield_section(self, section_elem):
-        """Scrape Yield section"""
-        yield_data = {
-            "section_type": "Yield",
-            "assets": []
-        }
-        
-        try:
-            # Find content rows
-            content_rows = section_elem.find_elements(By.CSS_SELECTOR, "div.table_contentRow__Mi3k5")
-            
-            print(f"[DeBank]         Found {len(content_rows)} yield rows")
-            
-            for row in content_rows:
-                try:
-                    cells = row.find_elements(By.XPATH, "./div")
-                    
-                    # Handle both 3-column and 4-column layouts
-                    if len(cells) >= 4:
-                        # 4 columns: identifier, pool, balance, usd_value
-                        identifier = cells[0].text.strip()
-                        
-                        pool = None
-                        try:
-                            pool_elem = cells[1].find_element(By.CSS_SELECTOR, "a.utils_detailLink__XnB7N")
-                            pool = pool_elem.text.strip()
-                        except NoSuchElementException:
-                            pool = cells[1].text.strip()
-                        
-                        balance_text = cells[2].text.strip()
-                        balance_value = self.extract_balance_value(balance_text)
-                        
-                        usd_text = cells[3].text.strip()
-                        usd_value = self.parse_numeric_value(usd_text)
-                        
-                    elif len(cells) >= 3:
-                        # 3 columns: pool, balance, usd_value (no identifier)
-                        identifier = ""
-                        
-                        pool = None
-                        try:
-                            pool_elem = cells[0].find_element(By.CSS_SELECTOR, "a.utils_detailLink__XnB7N")
-                            pool = pool_elem.text.strip()
-                        except NoSuchElementException:
-                            pool = cells[0].text.strip()
-                        
-                        balance_text = cells[1].text.strip()
-                        balance_value = self.extract_balance_value(balance_text)
-                        
-                        usd_text = cells[2].text.strip()
-                        usd_value = self.parse_numeric_value(usd_text)
-                    else:
-                        continue
-                    
-                    # Filter by minimum USD value
-                    if pool and balance_value and usd_value >= self.min_usd_value:
-                        asset_info = {
-                            "identifier": identifier,
-                            "pool": pool,
-                            "balance": balance_value,
-                            "usd_value": usd_value
-                        }
-                        yield_data["assets"].append(asset_info)
-                        print(f"[DeBank]         ✓ Parsed yield: {pool} - ${usd_value}")
-                    elif usd_value < self.min_usd_value:
-                        print(f"[DeBank]         ⊘ Skipped (< ${self.min_usd_value}): {pool} - ${usd_value}")
-                
-                except Exception as e:
-                    print(f"[DeBank]         Warning: Failed to parse yield row: {e}")
-                    continue
-        
-        except Exception as e:
-            print(f"[DeBank]       Error scraping yield section: {e}")
+        total_value = 0
+        if wallet["total"] is not None:
+            total_value = parse_numeric_value(wallet["total"])
+            print(f"[DeBank]   Wallet total value: ${total_value}")
+        else:
+            print("[DeBank]   Warning: Could not find wallet total value")
         
-        return yield_data
+        rows = wallet["rows"]
+        if rows is None:
+            print("[DeBank]   ⚠ Wallet table not found")
+            rows = []
+        print(f"[DeBank]   Found {len(rows)} wallet assets")
+        return build_token_project(rows, DEBANK, total_value=total_value)
     
-    def scrape_staked_section(self, section_elem):
-        """Scrape Staked section"""
-        staked_data = {
-            "section_type": "Staked",
-            "assets": []
-        }
-        
-        try:
-            # Find content rows
-            content_rows = section_elem.find_elements(By.CSS_SELECTOR, "div.table_contentRow__Mi3k5")
-            
-            print(f"[DeBank]         Found {len(content_rows)} staked rows")
-            
-            for row in content_rows:
-                try:
-                    cells = row.find_elements(By.XPATH, "./div")
-                    
-                    if len(cells) >= 4:
-                        # Extract identifier
-                        identifier = cells[0].text.strip()
-                        
-                        # Extract pool name
-                        pool = None
-                        try:
-                            pool_elem = cells[1].find_element(By.CSS_SELECTOR, "a.utils_detailLink__XnB7N")
-                            pool = pool_elem.text.strip()
-                        except NoSuchElementException:
-                            pool = cells[1].text.strip()
-                        
-                        # Extract balance (numeric value only)
-                        balance_text = cells[2].text.strip()
-                        balance_value = self.extract_balance_value(balance_text)
-                        
-                        # Extract USD value (numeric only)
-                        usd_text = cells[3].text.strip()
-                        usd_value = self.parse_numeric_value(usd_text)
-                        
-                        # Filter by minimum USD value
-                        if pool and balance_value and usd_value >= self.min_usd_value:
-                            asset_info = {
-                                "identifier": identifier,
-                                "pool": pool,
-                                "balance": balance_value,
-                                "usd_value": usd_value
-                            }
-                            staked_data["assets"].append(asset_info)
-                            print(f"[DeBank]         ✓ Parsed staked: {pool} - ${usd_value}")
-                        elif usd_value < self.min_usd_value:
-                            print(f"[DeBank]         ⊘ Skipped (< ${self.min_usd_value}): {pool} - ${usd_value}")
-                
-                except Exception as e:
-                    print(f"[DeBank]         Warning: Failed to parse staked row: {e}")
-                    continue
+    def extract_page(self):
+        """Raw wallet table and DeFi projects of the loaded profile page, in one script call
         
-        except Exception as e:
-            print(f"[DeBank]       Error scraping staked section: {e}")
+        When parts of the page are missing, the page is read again with
+        prefix-match selectors; if those find more, DeBank has re-hashed its
+        class names and the fallback is kept for this scraper's lifetime.
+        """
+        page = self.driver.execute_script(EXTRACT_PORTFOLIO_JS, self.js_spec)
+        gaps = page_gaps(page)
+        if not gaps or self.selector_fallback:
+            return page
         
-        return staked_data
+        healed = self.driver.execute_script(EXTRACT_PORTFOLIO_JS, DEBANK_HEALED_JS_SPEC)
+        if page_gaps(healed) < gaps:
+            print("[DeBank] ⚠ Selector drift: exact class names missing, switching to prefix-match selectors")
+            inc(DRIFT_METRIC, source='debank', kind='selector_fallback')
+            self.js_spec = DEBANK_HEALED_JS_SPEC
+            self.selector_fallback = True
+            return healed
+        return page
     
-    def scrape_locked_section(self, section_elem):
-        """Scrape Locked section"""
-        locked_data = {
-            "section_type": "Locked",
-            "assets": []
-        }
-        
-        try:
-            # Find content rows
-            content_rows = section_elem.find_elements(By.CSS_SELECTOR, "div.table_contentRow__Mi3k5")
-            
-            print(f"[DeBank]         Found {len(content_rows)} locked rows")
-            
-            for row in content_rows:
-                try:
-                    cells = row.find_elements(By.XPATH, "./div")
-                    
-                    if len(cells) >= 4:
-                        # 4 columns: pool, balance, unlock_time, usd_value
-                        # Extract pool name
-                        pool = None
-                        try:
-                            pool_elem = cells[0].find_element(By.CSS_SELECTOR, "a.utils_detailLink__XnB7N")
-                            pool = pool_elem.text.strip()
-                        except NoSuchElementException:
-                            pool = cells[0].text.strip()
-                        
-                        # Extract balance (numeric value only)
-                        balance_text = cells[1].text.strip()
-                        balance_value = self.extract_balance_value(balance_text)
-                        
-                        # Skip unlock_time at cells[2]
-                        
-                        # Extract USD value (numeric only) from cells[3]
-                        usd_text = cells[3].text.strip()
-                        usd_value = self.parse_numeric_value(usd_text)
-                        
-                        # Filter by minimum USD value
-                        if pool and balance_value and usd_value >= self.min_usd_value:
-                            asset_info = {
-                                "pool": pool,
-                                "balance": balance_value,
-                                "usd_value": usd_value
-                            }
-                            locked_data["assets"].append(asset_info)
-                            print(f"[DeBank]         ✓ Parsed locked: {pool} - ${usd_value}")
-                        elif usd_value < self.min_usd_value:
-                            print(f"[DeBank]         ⊘ Skipped (< ${self.min_usd_value}): {pool} - ${usd_value}")
-                    
-                    elif len(cells) >= 3:
-                        # 3 columns: pool, balance, usd_value (no unlock_time)
-                        # Extract pool name
-                        pool = None
-                        try:
-                            pool_elem = cells[0].find_element(By.CSS_SELECTOR, "a.utils_detailLink__XnB7N")
-                            pool = pool_elem.text.strip()
-                        except NoSuchElementException:
-                            pool = cells[0].text.strip()
-                        
-                        # Extract balance (numeric value only)
-                        balance_text = cells[1].text.strip()
-                        balance_value = self.extract_balance_value(balance_text)
-                        
-                        # Extract USD value (numeric only) from cells[2]
-                        usd_text = cells[2].text.strip()
-                        usd_value = self.parse_numeric_value(usd_text)
-                        
-                        # Filter by minimum USD value
-                        if pool and balance_value and usd_value >= self.min_usd_value:
-                            asset_info = {
-                                "pool": pool,
-                                "balance": balance_value,
-                                "usd_value": usd_value
-                            }
-                            locked_data["assets"].append(asset_info)
-                            print(f"[DeBank]         ✓ Parsed locked: {pool} - ${usd_value}")
-                        elif usd_value < self.min_usd_value:
-                            print(f"[DeBank]         ⊘ Skipped (< ${self.min_usd_value}): {pool} - ${usd_value}")
-                
-                except Exception as e:
-                    print(f"[DeBank]         Warning: Failed to parse locked row: {e}")
-                    continue
-        
-        except Exception as e:
-            print(f"[DeBank]       Error scraping locked section: {e}")
-        
-        return locked_data
+    def reextract_project(self, project_id):
+        """Scroll a project into view and extract it again (None if it can't be found)"""
+        if not project_id:
+            return None
+        found = self.driver.execute_script(
+            "const title = document.getElementById(arguments[0]);"
+            "if (title) title.scrollIntoView({block: 'start'});"
+            "return title !== null;",
+            project_id,
+        )
+        if not found:
+            return None
+        time.sleep(REEXTRACT_SETTLE_SECONDS)
+        return self.driver.execute_script(EXTRACT_ONE_PROJECT_JS, self.js_spec, project_id)
     
     def scrape_current_portfolio(self, wallet_address):
         """Scrape portfolio for currently loaded wallet"""
         print(f"\n[DeBank] Scraping portfolio for {wallet_address[:10]}...{wallet_address[-6:]}")
-        print(f"[DeBank] Filtering assets with USD value >= ${self.min_usd_value}")
         
         try:
-            # First scrape Wallet section
-            wallet_project = self.scrape_wallet_section()
+            with span('extract', source='debank'):
+                page = self.extract_page()
             
-            # Find all project containers (exclude Wallet which has id="Wallet")
-            # Each project is in a div.ProjectTitle_projectTitle__yC5VD that's NOT the Wallet
-            all_project_titles = self.driver.find_elements(By.CSS_SELECTOR, "div.ProjectTitle_projectTitle__yC5VD")
+            # Wallet section first
+            with span('section', source='debank', section='Wallet'):
+                wallet_project = self.build_wallet_project(page["wallet"])
             
-            # Filter out the Wallet section
-            project_containers = [p for p in all_project_titles if p.get_attribute("id") != "Wallet"]
+            reports = []
+            if page["wallet"] and page["wallet"]["total"] is not None:
+                reports.append(project_report(wallet_project))
             
-            print(f"[DeBank] Found {len(project_containers)} DeFi projects")
+            print(f"[DeBank] Found {len(page['projects'])} DeFi projects")
             
             projects = []
             
-            for idx, project_title_elem in enumerate(project_containers, 1):
+            for idx, raw_project in enumerate(page["projects"], 1):
+                print(f"[DeBank] [{idx}/{len(page['projects'])}]")
                 try:
-                    # Extract project name
-                    project_name = "Unknown"
-                    try:
-                        project_name_elem = project_title_elem.find_element(By.CSS_SELECTOR, "span.ProjectTitle_protocolLink__4Yqn3")
-                        project_name = project_name_elem.text.strip()
-                    except NoSuchElementException:
-                        # Try alternative - just get the name div
-                        try:
-                            project_name_elem = project_title_elem.find_element(By.CSS_SELECTOR, "div.ProjectTitle_name__x2ZNR")
-                            project_name = project_name_elem.text.strip()
-                        except NoSuchElementException:
-                            pass
-                    
-                    print(f"[DeBank] [{idx}] Processing: {project_name}")
-                    
-                    # Extract total value
-                    total_value = 0
-                    try:
-                        total_value_elem = project_title_elem.find_element(By.CSS_SELECTOR, "div.projectTitle-number")
-                        total_value = self.parse_numeric_value(total_value_elem.text.strip())
-                    except NoSuchElementException:
-                        pass
-                    
-                    # Extract chain from ID if available
-                    chain = "evm"
-                    project_id = project_title_elem.get_attribute("id") or ""
-                    if "_" in project_id:
-                        chain = project_id.split("_")[0]
-                    
-                    project_data = {
-                        "project_name": project_name,
-                        "chain": chain,
-                        "total_value": total_value,
-                        "sections": []
-                    }
-                    
-                    # Find Panel containers that follow this project title
-                    # Structure: ProjectTitle -> (sibling) Panel_container__Vltd1 (one for each section)
-                    try:
-                        # Find all Panel_container elements that are siblings following the project title
-                        # Use XPath to get following-sibling panels
-                        panel_containers = project_title_elem.find_elements(By.XPATH, "./following-sibling::div[contains(@class, 'Panel_container')]")
-                        
-                        print(f"[DeBank]     Found {len(panel_containers)} panel containers")
-                        
-                        for panel in panel_containers:
-                            try:
-                                # Find the BookMark (section type) within this panel
-                                bookmark_elem = panel.find_element(By.CSS_SELECTOR, "div.BookMark_bookmark__UG5a4")
-                                section_type = bookmark_elem.text.strip()
-                                
-                                print(f"[DeBank]       Processing section: {section_type}")
-                                
-                                # The panel itself is the container with the table data
-                                if section_type == "Lending":
-                                    section_data = self.scrape_lending_section(panel)
-                                    project_data["sections"].append(section_data)
-                                elif section_type == "Yield":
-                                    section_data = self.scrape_yield_section(panel)
-                                    project_data["sections"].append(section_data)
-                                elif section_type == "Deposit":
-                                    section_data = self.scrape_deposit_section(panel)
-                                    project_data["sections"].append(section_data)
-                                elif section_type == "Staked":
-                                    section_data = self.scrape_staked_section(panel)
-                                    project_data["sections"].append(section_data)
-                                elif section_type == "Locked":
-                                    section_data = self.scrape_locked_section(panel)
-                                    project_data["sections"].append(section_data)
-                                else:
-                                    print(f"[DeBank]       Skipping unknown section type: {section_type}")
-                            
-                            except NoSuchElementException:
-                                # Panel might not have a bookmark (unusual but handle it)
-                                print(f"[DeBank]       Warning: Panel without BookMark found")
-                                continue
-                            except Exception as e:
-                                print(f"[DeBank]       Error processing panel: {e}")
-                                import traceback
-                                traceback.print_exc()
-                                continue
-                    
-                    except Exception as e:
-                        print(f"[DeBank]     Error finding panels: {e}")
-                    
-                    projects.append(project_data)
-                
+                    # Rows not adding up to the project total: re-extract just this project
+                    project, report = build_reconciled(
+                        raw_project, DEBANK,
+                        reextract=lambda: self.reextract_project(raw_project["id"]),
+                    )
+                    projects.append(project)
+                    reports.append(report)
                 except Exception as e:
                     print(f"[DeBank]     Error processing project: {e}")
                     import traceback
@@ -704,8 +294,15 @@ class DebankScraper:
                 "projects": projects
             }
             
+            self.reconciliation[wallet_address] = report = wallet_report(reports)
+            if not report["reconciled"]:
+                print(f"[DeBank] ⚠ Rows differ from the page totals by ${report['diff_usd']:,.2f} "
+                      f"({len(report['mismatches'])} project(s) off)")
+            
             print(f"[DeBank] ✓ Scraping completed! Found {len(projects)} projects")
-            return portfolio_data
+            with span('normalize', source='debank'):
+                portfolio = Portfolio.from_dict(portfolio_data)
+            return portfolio
         
         except Exception as e:
             print(f"[DeBank] ✗ Fatal error during scraping: {e}")
@@ -720,7 +317,7 @@ class DebankScraper:
             wallet_addresses: Single address (str) or list of addresses to scrape
             
         Returns:
-            Single portfolio dict if one address provided, list of dicts if multiple
+            Single Portfolio if one address provided, list of Portfolios if multiple
         """
         print(f"\n{'='*60}")
         print("[DeBank] SCRAPING EVM PORTFOLIO")
@@ -768,12 +365,3 @@ class DebankScraper:
             import traceback
             traceback.print_exc()
             return None
-    
-    def cleanup(self):
-        """Clean up resources"""
-        if self.driver:
-            try:
-                self.driver.quit()
-                print("[DeBank] ✓ Driver cleaned up")
-            except:
-                pass
\ No newline at end of file
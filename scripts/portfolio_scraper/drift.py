@@ -0,0 +1,152 @@
+"""
+Drift detection for scraped portfolios
+
+When a site renames its (hashed) class names, a scrape still "succeeds" but
+comes back empty or with whole sections missing. Each scrape is reduced to a
+structural signature (project, section and asset counts, the project header
+totals and the sum of the parsed rows) and compared with the recent accepted
+signatures of the same wallet and source. A scrape is suspicious when its rows
+do not add up to the project totals shown on the page (further than in the
+last accepted scrape), or when its counts or total drop (or its total jumps)
+by more than DRIFT_TOLERANCE_PCT against the history.
+
+A change that persists for DRIFT_CONFIRMATIONS scrapes in a row is accepted
+as the wallet's new baseline (positions really do get closed).
+"""
+import statistics
+import threading
+from collections import deque
+from datetime import datetime
+
+from .config import DRIFT_HISTORY, DRIFT_TOLERANCE_PCT, DRIFT_CONFIRMATIONS
+from .crosscheck import net_value, MIN_ABSOLUTE_DIFF
+from .metrics import inc, DRIFT_METRIC
+
+
+def signature(portfolio):
+    """Structural summary of a Portfolio"""
+    projects = portfolio.projects
+    totals = [p for p in projects if p.total_value is not None]
+    return {
+        "projects": len(projects),
+        "sections": sum(len(p.sections) for p in projects),
+        "assets": sum(sum(1 for _ in s.iter_assets()) for p in projects for s in p.sections),
+        # Header totals vs parsed rows, over the projects that show a total
+        "total_usd": round(sum(p.total_value for p in totals), 2),
+        "rows_usd": round(sum(net_value(s) for p in totals for s in p.sections), 2),
+        "empty_projects": sum(1 for p in totals if p.total_value >= MIN_ABSOLUTE_DIFF and not p.sections),
+    }
+
+
+def _off_by(value, expected, tolerance_pct):
+    return abs(value - expected) >= MIN_ABSOLUTE_DIFF and abs(value - expected) > abs(expected) * tolerance_pct / 100
+
+
+def anomalies(sig, history, tolerance_pct=None):
+    """Reasons a signature looks wrong, given earlier accepted signatures (may be empty)
+
+    Projects without sections and rows not adding up to the totals are
+    measured against the latest accepted signature: a wallet holding section
+    types SECTIONS doesn't cover shows them on every scrape, and once
+    accepted that is its normal.
+    """
+    tolerance_pct = DRIFT_TOLERANCE_PCT if tolerance_pct is None else tolerance_pct
+    baseline = history[-1] if history else None
+    found = []
+    usual_empty = baseline["empty_projects"] if baseline else 0
+    if sig["empty_projects"] > usual_empty:
+        found.append(f"{sig['empty_projects']} project(s) with a total but no sections")
+    usual_gap = baseline["total_usd"] - baseline["rows_usd"] if baseline else 0
+    if sig["total_usd"] and _off_by(sig["rows_usd"] + usual_gap, sig["total_usd"], tolerance_pct):
+        found.append(f"rows sum to ${sig['rows_usd']:,.2f} but project totals to ${sig['total_usd']:,.2f}")
+
+    if history:
+        for key in ("projects", "sections", "assets"):
+            usual = statistics.median(h[key] for h in history)
+            if usual and sig[key] < usual * (1 - tolerance_pct / 100):
+                found.append(f"{sig[key]} {key} (usually {usual:g})")
+        usual = statistics.median(h["total_usd"] for h in history)
+        if usual and _off_by(sig["total_usd"], usual, tolerance_pct):
+            found.append(f"total ${sig['total_usd']:,.2f} (usually ${usual:,.2f})")
+    return found
+
+
+class DriftDetector:
+    """Per (source, wallet) history of accepted scrape signatures"""
+
+    def __init__(self, history=None, confirmations=None, tolerance_pct=None):
+        self.history_size = max(1, history or DRIFT_HISTORY)
+        self.confirmations = max(1, confirmations or DRIFT_CONFIRMATIONS)
+        self.tolerance_pct = DRIFT_TOLERANCE_PCT if tolerance_pct is None else tolerance_pct
+        self._lock = threading.Lock()
+        self._history = {}  # (source, wallet) -> deque of signatures
+        self._suspects = {}  # (source, wallet) -> last suspicious result
+
+    def _history_for(self, key):
+        return self._history.setdefault(key, deque(maxlen=self.history_size))
+
+    def seed(self, source, wallet_address, portfolio):
+        """Start the history from a known-good portfolio (e.g. a disk snapshot)"""
+        with self._lock:
+            self._history_for((source, wallet_address)).append(signature(portfolio))
+
+    def accept(self, source, wallet_address, portfolio):
+        """Record a portfolio cached despite its anomalies as the new baseline"""
+        key = (source, wallet_address)
+        with self._lock:
+            history = self._history_for(key)
+            history.clear()
+            history.append(signature(portfolio))
+            self._suspects.pop(key, None)
+
+    def check(self, source, wallet_address, portfolio):
+        """Check a new scrape; returns its anomalies ([] = plausible, recorded as history)"""
+        key = (source, wallet_address)
+        sig = signature(portfolio)
+        with self._lock:
+            history = self._history_for(key)
+            found = anomalies(sig, list(history), self.tolerance_pct)
+            if not found:
+                history.append(sig)
+                self._suspects.pop(key, None)
+                return []
+
+            suspect = self._suspects.get(key)
+            streak = suspect["streak"] + 1 if suspect else 1
+            if streak >= self.confirmations:
+                # Persistent change: the wallet itself changed, make it the new baseline
+                print(f"[Drift] {source} {wallet_address[:8]}...: accepting new baseline after {streak} scrapes ({'; '.join(found)})")
+                history.clear()
+                history.append(sig)
+                self._suspects.pop(key, None)
+                inc(DRIFT_METRIC, source=source, kind='rebaselined')
+                return []
+
+            self._suspects[key] = {
+                "streak": streak,
+                "anomalies": found,
+                "signature": sig,
+                "at": datetime.now().isoformat(),
+            }
+        inc(DRIFT_METRIC, source=source, kind='suspect')
+        return found
+
+    def suspects(self, wallet_address):
+        """{source: suspicious result} of a wallet whose latest scrape was rejected"""
+        with self._lock:
+            return {source: dict(suspect) for (source, wallet), suspect in self._suspects.items()
+                    if wallet == wallet_address}
+
+    def snapshot(self):
+        """JSON-serializable state for /health: {source: {wallet: {...}}}"""
+        with self._lock:
+            state = {}
+            for (source, wallet), history in self._history.items():
+                entry = state.setdefault(source, {})[wallet] = {
+                    "history": len(history),
+                    "last": history[-1] if history else None,
+                    "suspect": None,
+                }
+                if (source, wallet) in self._suspects:
+                    entry["suspect"] = dict(self._suspects[(source, wallet)])
+            return state
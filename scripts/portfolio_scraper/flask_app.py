@@ -1,8 +1,7 @@
 """
 Flask API for portfolio scraping
 """
-from flask import Flask, request, jsonify
-from pyngrok import ngrok
+from flask import Flask, Response, request, jsonify
 import os
 import atexit
 from .config import (
@@ -13,11 +12,14 @@ from .config import (
     CHROME_PROFILE,
     FLASK_HOST,
     FLASK_PORT,
-    NGROK_AUTHTOKEN
+    NGROK_AUTHTOKEN,
+    MIN_USD_VALUE,
+    MIN_MAX_AGE_SECONDS
 )
 from .chrome_manager import start_chrome_with_debug, cleanup_chrome
 from .scheduler import PortfolioScheduler
 from .utils import is_solana_address, check_chrome_debug_port
+from .metrics import render_prometheus
 
 
 def create_app():
@@ -32,6 +34,36 @@ def create_app():
         
         wallet_address = request.args.get('address')
         
+        # Optional freshness bound in seconds; older data is served but refreshed
+        max_age = request.args.get('max_age')
+        if max_age is not None:
+            try:
+                max_age = int(max_age)
+                if max_age < 0:
+                    raise ValueError
+            except ValueError:
+                return jsonify({
+                    "error": "Invalid 'max_age' parameter",
+                    "message": "max_age must be a non-negative number of seconds."
+                }), 400
+            # Clamped so clients can't turn every request into a re-scrape
+            max_age = max(max_age, MIN_MAX_AGE_SECONDS)
+        
+        # Optional dust threshold in USD; the cache keeps every row
+        min_usd = request.args.get('min_usd')
+        if min_usd is not None:
+            try:
+                min_usd = float(min_usd)
+                if not min_usd >= 0:
+                    raise ValueError
+            except ValueError:
+                return jsonify({
+                    "error": "Invalid 'min_usd' parameter",
+                    "message": "min_usd must be a non-negative number of dollars."
+                }), 400
+        else:
+            min_usd = MIN_USD_VALUE
+        
         if not wallet_address:
             all_addresses = SOLANA_ADDRESSES + EVM_ADDRESSES
             return jsonify({
@@ -41,15 +73,32 @@ def create_app():
             }), 400
         
         # Return cached data
-        data = scheduler.get_cached_data(wallet_address)
+        data = scheduler.get_cached_data(wallet_address, min_usd)
         if data:
+            # Stale-while-revalidate: answer now, refresh old data in the background
             response_data = data.copy()
+            response_data['min_usd'] = min_usd
             response_data['cached_at'] = scheduler.last_update_time.isoformat() if scheduler.last_update_time else None
             response_data['scrape_interval_minutes'] = SCRAPE_INTERVAL_MINUTES
+            response_data.update(scheduler.get_freshness(wallet_address, max_age))
+            response_data['source'] = scheduler.source_of.get(wallet_address)
+            if wallet_address in scheduler.cross_checks:
+                response_data['cross_check'] = scheduler.cross_checks[wallet_address]
+            if wallet_address in scheduler.reconciliations:
+                response_data['reconciliation'] = scheduler.reconciliations[wallet_address]
+            suspects = scheduler.drift.suspects(wallet_address)
+            if suspects:
+                # The latest scrape looked wrong; this is the last plausible one
+                response_data['drift_suspect'] = suspects
+            response_data['refreshing'] = False
+            if response_data['stale']:
+                scheduler.refresh_in_background(wallet_address)
+                response_data['refreshing'] = True
             return jsonify(response_data), 200
         else:
             all_addresses = SOLANA_ADDRESSES + EVM_ADDRESSES
             if wallet_address in all_addresses:
+                scheduler.refresh_in_background(wallet_address)
                 return jsonify({
                     "error": "Data not yet available",
                     "message": "This wallet is configured but data is still being scraped. Please try again in a moment.",
@@ -70,7 +119,9 @@ def create_app():
         scheduler = current_app.scheduler
         
         status = scheduler.get_status()
-        status['status'] = 'ok'
+        breakers_open = any(b['state'] != 'closed' for b in status['circuit_breakers'].values())
+        bloated = any(tree['bloated'] for tree in status['processes']['trees'].values())
+        status['status'] = 'degraded' if breakers_open or bloated else 'ok'
         return jsonify(status), 200
     
     @app.route('/refresh', methods=['POST'])
@@ -82,11 +133,18 @@ def create_app():
         scheduler.scrape_and_cache()
         return jsonify({"message": "Refresh triggered"}), 200
     
+    @app.route('/metrics', methods=['GET'])
+    def metrics():
+        """Scrape timing metrics in Prometheus text format"""
+        return Response(render_prometheus(), mimetype='text/plain; version=0.0.4')
+    
     return app
 
 
 def setup_ngrok():
     """Set up ngrok tunnel"""
+    from pyngrok import ngrok  # Only needed when serving, keep it out of import time
+    
     ngrok_token = os.environ.get('NGROK_AUTHTOKEN') or NGROK_AUTHTOKEN
     
     if ngrok_token:
@@ -110,7 +168,9 @@ def setup_ngrok():
         print()
         print("API Endpoints:")
         print(f"  {public_url}/portfolio?address=YOUR_WALLET")
+        print(f"  {public_url}/portfolio?address=YOUR_WALLET&min_usd=0  (every row)")
         print(f"  {public_url}/health")
+        print(f"  {public_url}/metrics")
         print("="*70)
         print()
     except Exception as e:
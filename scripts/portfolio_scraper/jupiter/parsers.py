@@ -1,20 +1,8 @@
 """Parsing helpers for Jupiter scraper."""
-import re
-
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
 
-
-def parse_numeric_value(text):
-    """Parse numeric value from text."""
-    text = text.strip()
-    if text.startswith('<'):
-        return 0
-    text = text.replace('$', '').replace(',', '')
-    try:
-        return float(text)
-    except ValueError:
-        return 0
+from ..parsing import parse_amount_value, parse_numeric_value, parse_percent
 
 
 def extract_token_info(cell):
@@ -27,46 +15,25 @@ def extract_token_info(cell):
         return text if text else "Unknown"
 
 
-def _parse_float(text):
-    """Parse float from already sanitized string."""
-    try:
-        return float(text) if text else 0
-    except ValueError:
-        return 0
-
-
-def _sanitize_numeric(text):
-    """Strip non-numeric characters except decimal and minus."""
-    return re.sub(r'[^\d.-]', '', text)
+def _first_line(text):
+    """Return the first line of a multi-line cell."""
+    return text.strip().split('\n', 1)[0]
 
 
 def extract_balance_only(balance_text):
     """Parse balance text (numeric only, no token name)."""
-    lines = balance_text.strip().split('\n')
-    if len(lines) >= 1:
-        balance_str = lines[0].strip().replace(',', '')
-        balance_str = _sanitize_numeric(balance_str)
-        return _parse_float(balance_str)
-    return 0
+    return parse_amount_value(_first_line(balance_text))
 
 
 def extract_balance_and_token(balance_text):
     """Parse balance text like '46,172 CASH' into numeric balance."""
-    lines = balance_text.strip().split('\n')
-    if len(lines) >= 1:
-        parts = lines[0].strip().rsplit(' ', 1)
-        if len(parts) == 2:
-            balance_str = parts[0].replace(',', '')
-            return _parse_float(balance_str)
-        return extract_balance_only(balance_text)
-    return 0
+    return parse_amount_value(_first_line(balance_text))
 
 
 def extract_yield_value(cell):
     """Extract yield percentage as numeric value."""
     try:
         yield_elem = cell.find_element(By.CSS_SELECTOR, "span")
-        yield_text = yield_elem.text.strip().replace('%', '').replace('+', '')
-        return float(yield_text) if yield_text else 0
-    except (NoSuchElementException, ValueError):
+        return parse_percent(yield_elem.text)
+    except NoSuchElementException:
         return 0
@@ -10,8 +10,6 @@ from .parsers import (
     parse_numeric_value,
 )
 
-# Minimum USD value threshold
-MIN_USD_VALUE = 5
 
 def _get_primary_rows(section_elem):
     """Return rows from ALL tbody elements in the section table."""
@@ -31,7 +29,7 @@ def _get_primary_rows(section_elem):
 
 
 def _parse_lending_rows(rows, target_list, balance_idx=1, yield_idx=3, value_idx=4):
-    """Parse lending rows into the provided list (filtered by USD value)."""
+    """Parse lending rows into the provided list."""
     for row in rows:
         try:
             cells = row.find_elements(By.TAG_NAME, "td")
@@ -41,17 +39,13 @@ def _parse_lending_rows(rows, target_list, balance_idx=1, yield_idx=3, value_idx
                 yield_val = extract_yield_value(cells[yield_idx])
                 value = parse_numeric_value(cells[value_idx].text.strip())
                 
-                # Filter by minimum USD value
-                if value >= MIN_USD_VALUE:
-                    target_list.append({
-                        "token": token,
-                        "balance": balance,
-                        "yield": yield_val,
-                        "value": value
-                    })
-                    print(f"[Jupiter]         ✓ Added: {token} - ${value}")
-                else:
-                    print(f"[Jupiter]         ⊘ Skipped (< ${MIN_USD_VALUE}): {token} - ${value}")
+                target_list.append({
+                    "token": token,
+                    "balance": balance,
+                    "yield": yield_val,
+                    "value": value
+                })
+                print(f"[Jupiter]         ✓ Added: {token} - ${value}")
         except Exception as e:
             print(f"[Jupiter] Warning: Failed to parse lending row: {e}")
 
@@ -106,7 +100,7 @@ def _scrape_lending_like_section(section_elem, section_type, market_name):
 
 
 def scrape_wallet_section(section_elem):
-    """Scrape wallet section data (filtered by USD value)."""
+    """Scrape wallet section data."""
     wallet_data = {
         "section_type": "Wallet",
         "assets": []
@@ -133,16 +127,12 @@ def scrape_wallet_section(section_elem):
                         f"Balance: {balance}, Value: ${value}"
                     )
 
-                    # Filter by minimum USD value
-                    if value >= MIN_USD_VALUE:
-                        wallet_data["assets"].append({
-                            "token": token,
-                            "balance": balance,
-                            "value": value
-                        })
-                        print(f"[Jupiter]       ✓ Added to output")
-                    else:
-                        print(f"[Jupiter]       ⊘ Skipped (< ${MIN_USD_VALUE})")
+                    wallet_data["assets"].append({
+                        "token": token,
+                        "balance": balance,
+                        "value": value
+                    })
+                    print(f"[Jupiter]       ✓ Added to output")
             except Exception as e:
                 print(f"[Jupiter] Warning: Failed to parse wallet asset row {row_idx+1}: {e}")
                 import traceback
@@ -156,7 +146,7 @@ def scrape_wallet_section(section_elem):
 
 
 def scrape_farming_section(section_elem):
-    """Scrape farming section data (filtered by USD value)."""
+    """Scrape farming section data."""
     farming_data = {
         "section_type": "Farming",
         "assets": []
@@ -175,17 +165,13 @@ def scrape_farming_section(section_elem):
                     yield_val = extract_yield_value(cells[2])
                     value = parse_numeric_value(cells[3].text.strip())
                     
-                    # Filter by minimum USD value
-                    if value >= MIN_USD_VALUE:
-                        farming_data["assets"].append({
-                            "token": token,
-                            "balance": balance,
-                            "yield": yield_val,
-                            "value": value
-                        })
-                        print(f"[Jupiter]       ✓ Added: {token} - ${value}")
-                    else:
-                        print(f"[Jupiter]       ⊘ Skipped (< ${MIN_USD_VALUE}): {token} - ${value}")
+                    farming_data["assets"].append({
+                        "token": token,
+                        "balance": balance,
+                        "yield": yield_val,
+                        "value": value
+                    })
+                    print(f"[Jupiter]       ✓ Added: {token} - ${value}")
             except Exception as e:
                 print(f"[Jupiter] Warning: Failed to parse farming asset row: {e}")
     except Exception as e:
@@ -223,17 +209,13 @@ def scrape_liquidity_pool_section(section_elem):
                     yield_val = extract_yield_value(cells[2])
                     value = parse_numeric_value(cells[3].text.strip())
                     
-                    # Filter by minimum USD value
-                    if value >= MIN_USD_VALUE:
-                        liquidity_pool_data["assets"].append({
-                            "token": token,
-                            "balance": balance,
-                            "yield": yield_val,
-                            "value": value
-                        })
-                        print(f"[Jupiter]       ✓ Added: {token} - ${value}")
-                    else:
-                        print(f"[Jupiter]       ⊘ Skipped (< ${MIN_USD_VALUE}): {token} - ${value}")
+                    liquidity_pool_data["assets"].append({
+                        "token": token,
+                        "balance": balance,
+                        "yield": yield_val,
+                        "value": value
+                    })
+                    print(f"[Jupiter]       ✓ Added: {token} - ${value}")
             except Exception as e:
                 print(f"[Jupiter] Warning: Failed to parse liquidity pool asset row: {e}")
     except Exception as e:
@@ -10,6 +10,14 @@ import time
 import os
 from datetime import datetime
 from .utils import get_chrome_major_version
+from .model import Portfolio
+from .metrics import span
+from .config import HEADLESS, CAPTCHA_WAIT_SECONDS
+from .challenges import CaptchaChallenge
+from .webdriver_profiler import maybe_attach
+from .supervisor import supervisor
+from .scraper_base import Scraper
+from .browser import build_chrome_options, apply_request_blocking
 
 from .jupiter.sections import (
     scrape_farming_section,
@@ -19,56 +27,66 @@ from .jupiter.sections import (
     scrape_wallet_section,
 )
 
-class JupiterScraper:
+class JupiterScraper(Scraper):
     """Scraper for Jupiter (Solana) portfolio with anti-bot detection"""
     
-    def __init__(self, debug_port=None, user_data_dir=None):
+    name = 'jupiter'
+    tag = 'Jupiter'
+    waits_for_captcha = True
+    
+    BASE_URL = "https://jup.ag"
+    
+    def __init__(self, debug_port=None, user_data_dir=None, base_url=None, headless=None, block_resources=None, session=None, slot=0):
         self.driver = None
+        self.slot = slot  # Concurrency slot: own profile and supervisor label
         self.debug_port = debug_port  # Not used anymore, kept for compatibility
-        self.user_data_dir = user_data_dir or os.path.expanduser('~/.chrome_jupiter_scraper')
-        self.min_usd_value = 5  # Minimum USD value threshold
+        self.user_data_dir = user_data_dir or self.slot_profile(os.path.expanduser('~/.chrome_jupiter_scraper'))
+        self.base_url = base_url or self.BASE_URL  # Overridden by the offline benchmark
+        self.session = session  # Shared BrowserSession: run in its 'jupiter' tab
+        if session:
+            headless = session.headless
+        self.headless = HEADLESS if headless is None else headless
+        self.prefer_headless = self.headless  # Mode to return to after a headed captcha fallback
+        self.block_resources = block_resources  # None -> BLOCK_RESOURCES from config
+        self.awaiting_human = False  # A parked captcha is waiting in the visible window
 
-    def is_driver_alive(self):
-        """Check if the driver is still responsive"""
-        if not self.driver:
-            return False
-        try:
-            # Try a simple command to check if driver is responsive
-            _ = self.driver.current_url
-            return True
-        except Exception:
-            return False
-    
     def connect_to_chrome(self):
         """Start Chrome with undetected-chromedriver for anti-detection"""
+        if self.session:
+            # Also switches the shared browser back to our tab
+            return self.attach_session()
+        
         print(f"[Jupiter] Starting Chrome with anti-detection...")
         print(f"[Jupiter] Profile directory: {self.user_data_dir}")
         
         try:
+            # A Chrome left over from a crash would still hold the profile lock
+            supervisor.reap_profile(self.user_data_dir)
+            
             # undetected-chromedriver options
-            options = uc.ChromeOptions()
-            options.add_argument(f'--user-data-dir={self.user_data_dir}')
-            options.add_argument('--no-first-run')
-            options.add_argument('--no-default-browser-check')
+            options = build_chrome_options(uc.ChromeOptions(), self.user_data_dir, headless=self.headless)
             options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-software-rasterizer')
             
             # Start Chrome with anti-detection
-            version_main = get_chrome_major_version()
-            if version_main:
-                print(f"[Jupiter] ℹ Using detected Chrome major version: {version_main}")
-                self.driver = uc.Chrome(
-                    options=options,
-                    version_main=version_main,
-                    use_subprocess=False  # Avoid port conflicts
-                )
-            else:
-                print("[Jupiter] ℹ Chrome version unknown; using auto-detection")
-                self.driver = uc.Chrome(
-                    options=options,
-                    use_subprocess=False  # Avoid port conflicts
-                )
+            with span('connect', source='jupiter'):
+                version_main = get_chrome_major_version()
+                if version_main:
+                    print(f"[Jupiter] ℹ Using detected Chrome major version: {version_main}")
+                    self.driver = uc.Chrome(
+                        options=options,
+                        version_main=version_main,
+                        use_subprocess=False  # Avoid port conflicts
+                    )
+                else:
+                    print("[Jupiter] ℹ Chrome version unknown; using auto-detection")
+                    self.driver = uc.Chrome(
+                        options=options,
+                        use_subprocess=False  # Avoid port conflicts
+                    )
+            
+            supervisor.track_driver(self.driver, self.label, self.user_data_dir)
+            maybe_attach(self.driver)
+            apply_request_blocking(self.driver, self.block_resources, label="Jupiter")
             
             print(f"[Jupiter] ✓ Chrome started with anti-detection")
             print(f"[Jupiter] ℹ Profile persists at: {self.user_data_dir}")
@@ -80,11 +98,48 @@ class JupiterScraper:
             traceback.print_exc()
             return False
     
-    def navigate_to_portfolio(self, wallet_address):
-        """Navigate to portfolio page"""
-        url = f"https://jup.ag/portfolio/{wallet_address}"
+    def relaunch(self, headless):
+        """Restart Chrome on the same profile (cookies included) in the given mode"""
+        print(f"[Jupiter] Relaunching Chrome {'headless' if headless else 'headed'}...")
+        if self.session:
+            # Changes the mode for every site in the shared browser
+            self.session.relaunch(headless)
+            return self.connect_to_chrome()
+        self.cleanup()
+        self.driver = None
+        self.headless = headless
+        return self.connect_to_chrome()
+    
+    def resume_headless(self):
+        """Go back to headless after a headed captcha fallback
+        
+        Called by the scheduler once no wallet is parked behind the captcha.
+        """
+        self.awaiting_human = False
+        if self.prefer_headless and not self.headless:
+            return self.relaunch(headless=True)
+        return True
+    
+    def _has_captcha(self):
+        return bool(self.driver.find_elements(By.CSS_SELECTOR, "iframe[src*='captcha'], iframe[title*='captcha']"))
+    
+    def navigate_to_portfolio(self, wallet_address, wait_for_captcha=False):
+        """Navigate to portfolio page
+        
+        A captcha raises CaptchaChallenge (leaving the visible window open for a
+        human) unless wait_for_captcha is set, in which case it waits up to
+        CAPTCHA_WAIT_SECONDS for it to be solved.
+        """
+        # Keep the visible window while a parked captcha waits in it
+        if not wait_for_captcha and not self.awaiting_human and not self.resume_headless():
+            return False
+        if self.session and not self.connect_to_chrome():
+            return False
+        
+        url = f"{self.base_url}/portfolio/{wallet_address}"
         print(f"[Jupiter] Navigating to {url}...")
-        self.driver.get(url)
+        with span('navigate', source='jupiter'):
+            self.driver.get(url)
         
         # Check for captcha
         print("[Jupiter] Checking for captcha...")
@@ -92,41 +147,60 @@ class JupiterScraper:
         
         try:
             # Look for captcha iframe
-            captcha_frames = self.driver.find_elements(By.CSS_SELECTOR, "iframe[src*='captcha'], iframe[title*='captcha']")
-            if captcha_frames:
+            captcha = self._has_captcha()
+            if captcha and self.headless:
+                # Nobody can solve it headless: hand the profile to a visible Chrome
+                print("[Jupiter] ⚠️  CAPTCHA DETECTED in headless mode, switching to a visible window")
+                if not self.relaunch(headless=False):
+                    return False
+                with span('navigate', source='jupiter'):
+                    self.driver.get(url)
+                time.sleep(3)
+                captcha = self._has_captcha()
+            
+            if captcha and not wait_for_captcha:
+                print("[Jupiter] ⚠️  CAPTCHA DETECTED! Parking wallet for a human")
+                self.awaiting_human = True
+                raise CaptchaChallenge(wallet_address, 'jupiter', url)
+            
+            if captcha:
                 print("[Jupiter] ⚠️  CAPTCHA DETECTED!")
                 print("[Jupiter] Please solve the captcha in the Chrome window...")
-                print("[Jupiter] Waiting up to 120 seconds for you to complete it...")
+                print(f"[Jupiter] Waiting up to {CAPTCHA_WAIT_SECONDS} seconds for you to complete it...")
                 
                 # Wait longer for captcha to be solved
-                wait_time = 120
+                wait_time = CAPTCHA_WAIT_SECONDS
                 start_time = time.time()
                 
-                while time.time() - start_time < wait_time:
-                    try:
-                        # Check if portfolio elements are present (captcha solved)
-                        WebDriverWait(self.driver, 5).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, "details.platform-detail"))
-                        )
-                        print("[Jupiter] ✓ Captcha solved! Page loaded successfully")
-                        return True
-                    except TimeoutException:
-                        remaining = int(wait_time - (time.time() - start_time))
-                        if remaining > 0 and remaining % 10 == 0:
-                            print(f"[Jupiter]    Still waiting... {remaining}s remaining")
-                        time.sleep(2)
-                        continue
+                with span('captcha_wait', source='jupiter'):
+                    while time.time() - start_time < wait_time:
+                        try:
+                            # Check if portfolio elements are present (captcha solved)
+                            WebDriverWait(self.driver, 5).until(
+                                EC.presence_of_element_located((By.CSS_SELECTOR, "details.platform-detail"))
+                            )
+                            print("[Jupiter] ✓ Captcha solved! Page loaded successfully")
+                            return True
+                        except TimeoutException:
+                            remaining = int(wait_time - (time.time() - start_time))
+                            if remaining > 0 and remaining % 10 == 0:
+                                print(f"[Jupiter]    Still waiting... {remaining}s remaining")
+                            time.sleep(2)
+                            continue
                 
                 print("[Jupiter] ✗ Captcha timeout - please solve faster next time")
                 return False
+        except CaptchaChallenge:
+            raise
         except Exception as e:
             print(f"[Jupiter] Captcha check error: {e}")
         
         # Normal page load (no captcha)
         try:
-            WebDriverWait(self.driver, 30).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "details.platform-detail"))
-            )
+            with span('readiness_wait', source='jupiter'):
+                WebDriverWait(self.driver, 30).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "details.platform-detail"))
+                )
             print("[Jupiter] ✓ Page loaded")
             return True
         except TimeoutException:
@@ -159,14 +233,18 @@ class JupiterScraper:
             except NoSuchElementException:
                 return "Unknown Market"
     
-    def scrape_portfolio(self, wallet_address):
-        """Main scraping function"""
+    def scrape_portfolio(self, wallet_address, wait_for_captcha=False):
+        """Main scraping function
+        
+        Raises CaptchaChallenge if the page is behind a captcha and
+        wait_for_captcha is not set.
+        """
         print(f"\n{'='*60}")
         print("[Jupiter] SCRAPING SOLANA PORTFOLIO")
         print(f"{'='*60}")
         
         try:
-            if not self.navigate_to_portfolio(wallet_address):
+            if not self.navigate_to_portfolio(wallet_address, wait_for_captcha=wait_for_captcha):
                 return None
             
             time.sleep(3)
@@ -208,25 +286,30 @@ class JupiterScraper:
                             
                             if "wallet" in summary_text:
                                 print(f"[Jupiter]   Processing Wallet section")
-                                section_data = scrape_wallet_section(section)
+                                with span('section', source='jupiter', section='Wallet'):
+                                    section_data = scrape_wallet_section(section)
                                 project_info["sections"].append(section_data)
                             elif "farming" in summary_text:
                                 print(f"[Jupiter]   Processing Farming section")
-                                section_data = scrape_farming_section(section)
+                                with span('section', source='jupiter', section='Farming'):
+                                    section_data = scrape_farming_section(section)
                                 project_info["sections"].append(section_data)
                             elif "liquiditypool" in summary_text or "liquidity pool" in summary_text:
                                 print(f"[Jupiter]   Processing LiquidityPool section")
-                                section_data = scrape_liquidity_pool_section(section)
+                                with span('section', source='jupiter', section='LiquidityPool'):
+                                    section_data = scrape_liquidity_pool_section(section)
                                 project_info["sections"].append(section_data)
                             elif "lending" in summary_text:
                                 print(f"[Jupiter]   Processing Lending section")
                                 market_name = self._extract_market_name(summary_elem)
-                                section_data = scrape_lending_section(section, market_name)
+                                with span('section', source='jupiter', section='Lending'):
+                                    section_data = scrape_lending_section(section, market_name)
                                 project_info["sections"].append(section_data)
                             elif "leverage" in summary_text:
                                 print(f"[Jupiter]   Processing Leverage section")
                                 market_name = self._extract_market_name(summary_elem)
-                                section_data = scrape_leverage_section(section, market_name)
+                                with span('section', source='jupiter', section='Leverage'):
+                                    section_data = scrape_leverage_section(section, market_name)
                                 project_info["sections"].append(section_data)
                             else:
                                 print(f"[Jupiter]   Skipping unknown section: {summary_text}")
@@ -252,18 +335,13 @@ class JupiterScraper:
             }
             
             print(f"[Jupiter] ✓ Scraping completed! Found {len(projects)} projects")
-            return portfolio_data
+            with span('normalize', source='jupiter'):
+                portfolio = Portfolio.from_dict(portfolio_data)
+            return portfolio
+        except CaptchaChallenge:
+            raise
         except Exception as e:
             print(f"[Jupiter] ✗ Fatal error: {e}")
             import traceback
             traceback.print_exc()
             return None
-    
-    def cleanup(self):
-        """Clean up resources"""
-        if self.driver:
-            try:
-                self.driver.quit()
-                print("[Jupiter] ✓ Driver cleaned up")
-            except:
-                pass
@@ -0,0 +1,199 @@
+"""
+Lightweight scrape instrumentation
+
+Timing spans are aggregated into in-process histograms and, together with
+counters and gauges (e.g. browser memory), rendered in the Prometheus text
+format for the /metrics endpoint.
+"""
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Histogram of per-phase durations: connect, navigate, captcha_wait, ...
+PHASE_METRIC = 'portfolio_scrape_phase_seconds'
+
+# Counter of scrape outcomes per source
+RESULT_METRIC = 'portfolio_scrape_results_total'
+
+# Gauges of the last browser memory sample per source
+BROWSER_RSS_METRIC = 'portfolio_browser_rss_bytes'
+BROWSER_JS_HEAP_METRIC = 'portfolio_browser_js_heap_bytes'
+
+# Counter of drivers recycled by the memory watchdog
+RECYCLE_METRIC = 'portfolio_browser_recycles_total'
+
+# Counter of fan-out cross-checks by outcome (consistent / discrepancy)
+CROSSCHECK_METRIC = 'portfolio_crosscheck_total'
+
+# Counter of drift events per source: suspect results, baseline changes, selector fallbacks
+DRIFT_METRIC = 'portfolio_drift_total'
+
+# Counter of project total reconciliations by outcome (reconciled / mismatch)
+RECONCILE_METRIC = 'portfolio_reconcile_total'
+
+# Scrapes span from sub-second parsing to multi-minute captcha waits
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+_HELP = {
+    PHASE_METRIC: 'Time spent per scrape phase',
+    RESULT_METRIC: 'Scrape results per source',
+    BROWSER_RSS_METRIC: 'Resident memory of the browser process tree',
+    BROWSER_JS_HEAP_METRIC: 'Used JS heap of the browser page',
+    RECYCLE_METRIC: 'Drivers recycled for exceeding memory limits',
+    CROSSCHECK_METRIC: 'Cross-checks of a wallet scraped by two sources',
+    DRIFT_METRIC: 'Scrapes flagged by drift detection and selector fallbacks',
+    RECONCILE_METRIC: 'Project row sums checked against the page total',
+}
+
+_lock = threading.Lock()
+_histograms = {}
+_counters = {}
+_gauges = {}
+
+# Labels of the enclosing scrape context (wallet, source, phase, section),
+# read by the WebDriver profiler to attribute calls
+_context_labels = contextvars.ContextVar('scrape_context', default={})
+
+
+class Histogram:
+    """Cumulative histogram for a single label set"""
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for idx, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[idx] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _label_key(labels):
+    return tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None))
+
+
+def observe(name, seconds, **labels):
+    """Record a duration (in seconds) in the named histogram"""
+    key = (name, _label_key(labels))
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = Histogram()
+        histogram.observe(seconds)
+
+
+def inc(name, amount=1, **labels):
+    """Increment the named counter"""
+    key = (name, _label_key(labels))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+def set_gauge(name, value, **labels):
+    """Set the named gauge to its current value"""
+    key = (name, _label_key(labels))
+    with _lock:
+        _gauges[key] = value
+
+
+@contextmanager
+def scrape_context(**labels):
+    """Attach labels (e.g. wallet) to everything that runs inside the block"""
+    token = _context_labels.set({**_context_labels.get(), **labels})
+    try:
+        yield
+    finally:
+        _context_labels.reset(token)
+
+
+def current_context():
+    """Return the labels of the innermost scrape context"""
+    return _context_labels.get()
+
+
+@contextmanager
+def span(phase, **labels):
+    """Time a block of code as a scrape phase
+
+    Example:
+        with span('navigate', source='debank'):
+            driver.get(url)
+    """
+    start = time.perf_counter()
+    try:
+        with scrape_context(phase=phase, **labels):
+            yield
+    finally:
+        observe(PHASE_METRIC, time.perf_counter() - start, phase=phase, **labels)
+
+
+def reset():
+    """Drop all collected metrics"""
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
+        _gauges.clear()
+
+
+def _format_labels(label_key, extra=()):
+    pairs = list(label_key) + list(extra)
+    if not pairs:
+        return ''
+    body = ','.join(f'{k}="{_escape(v)}"' for k, v in pairs)
+    return '{' + body + '}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_bound(bound):
+    return '+Inf' if bound == float('inf') else repr(float(bound))
+
+
+def render_prometheus():
+    """Render all metrics in the Prometheus text exposition format"""
+    with _lock:
+        histograms = sorted(_histograms.items())
+        counters = sorted(_counters.items())
+        gauges = sorted(_gauges.items())
+        histogram_snapshot = [
+            (key, list(h.buckets), list(h.counts), h.sum, h.count) for key, h in histograms
+        ]
+
+    lines = []
+    seen = set()
+    for (name, label_key), buckets, counts, total, count in histogram_snapshot:
+        if name not in seen:
+            lines.append(f'# HELP {name} {_HELP.get(name, name)}')
+            lines.append(f'# TYPE {name} histogram')
+            seen.add(name)
+        for bound, bucket_count in zip(buckets, counts):
+            lines.append(f'{name}_bucket{_format_labels(label_key, [("le", _format_bound(bound))])} {bucket_count}')
+        lines.append(f'{name}_bucket{_format_labels(label_key, [("le", "+Inf")])} {count}')
+        lines.append(f'{name}_sum{_format_labels(label_key)} {total}')
+        lines.append(f'{name}_count{_format_labels(label_key)} {count}')
+
+    for (name, label_key), value in counters:
+        if name not in seen:
+            lines.append(f'# HELP {name} {_HELP.get(name, name)}')
+            lines.append(f'# TYPE {name} counter')
+            seen.add(name)
+        lines.append(f'{name}{_format_labels(label_key)} {value}')
+
+    for (name, label_key), value in gauges:
+        if name not in seen:
+            lines.append(f'# HELP {name} {_HELP.get(name, name)}')
+            lines.append(f'# TYPE {name} gauge')
+            seen.add(name)
+        lines.append(f'{name}{_format_labels(label_key)} {value}')
+
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,224 @@
+"""
+Compact in-memory portfolio model shared by all scrapers
+
+Scrapers emit Portfolio objects; the cache holds them and they are serialized
+back to the existing JSON shape (Jupiter uses 'value', EVM sources use
+'usd_value') only when a consumer asks for it. Portfolios hold every scraped
+row; dust is hidden at serialization time with min_usd.
+"""
+import sys
+
+from .parsing import parse_amount_value
+
+
+# Key used for the USD value of an asset, per blockchain
+VALUE_KEYS = {
+    "solana": "value",
+    "evm": "usd_value",
+}
+
+
+def _intern(text):
+    """Intern repeated names (tokens, projects, chains) to share memory"""
+    if text is None:
+        return None
+    return sys.intern(str(text))
+
+
+def _to_float(value):
+    """Normalize a number that may arrive as text like '99,453.1873 PT-sNUSD'"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    return float(parse_amount_value(str(value)))
+
+
+class Asset:
+    """Single row of a section (token holding, pool position, ...)"""
+
+    __slots__ = ('token', 'pool', 'identifier', 'price', 'amount', 'balance', 'yield_', 'usd_value')
+
+    def __init__(self, token=None, pool=None, identifier=None, price=None,
+                 amount=None, balance=None, yield_=None, usd_value=0.0):
+        self.token = _intern(token)
+        self.pool = _intern(pool)
+        self.identifier = _intern(identifier)
+        self.price = price
+        self.amount = amount
+        self.balance = balance
+        self.yield_ = yield_
+        self.usd_value = usd_value
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build an asset from a raw scraper row (either value key)"""
+        usd_value = data.get('usd_value', data.get('value', 0))
+        return cls(
+            token=data.get('token'),
+            pool=data.get('pool'),
+            identifier=data.get('identifier'),
+            price=_to_float(data.get('price')),
+            amount=_to_float(data.get('amount')),
+            balance=_to_float(data.get('balance')),
+            yield_=_to_float(data.get('yield')),
+            usd_value=_to_float(usd_value) or 0.0,
+        )
+
+    def to_dict(self, value_key):
+        """Serialize to the JSON row shape, omitting fields the source doesn't have"""
+        row = {}
+        if self.identifier is not None:
+            row['identifier'] = self.identifier
+        if self.token is not None:
+            row['token'] = self.token
+        if self.pool is not None:
+            row['pool'] = self.pool
+        if self.price is not None:
+            row['price'] = self.price
+        if self.amount is not None:
+            row['amount'] = self.amount
+        if self.balance is not None:
+            row['balance'] = self.balance
+        if self.yield_ is not None:
+            row['yield'] = self.yield_
+        row[value_key] = self.usd_value
+        return row
+
+    def is_dust(self, min_usd):
+        """Worth less than min_usd either way (borrowed rows may be negative)"""
+        return bool(min_usd) and abs(self.usd_value) < min_usd
+
+
+class Section:
+    """Section of a project (Wallet, Lending, Yield, ...)"""
+
+    __slots__ = ('section_type', 'market_name', 'health_rate', 'assets', 'supplied', 'borrowed')
+
+    def __init__(self, section_type, market_name=None, health_rate=None,
+                 assets=None, supplied=None, borrowed=None):
+        self.section_type = _intern(section_type)
+        self.market_name = _intern(market_name)
+        self.health_rate = health_rate
+        self.assets = assets
+        self.supplied = supplied
+        self.borrowed = borrowed
+
+    @property
+    def is_lending(self):
+        """Lending-like sections split rows into supplied/borrowed"""
+        return self.supplied is not None or self.borrowed is not None
+
+    def iter_assets(self):
+        """Iterate over all rows regardless of section layout"""
+        for rows in (self.assets, self.supplied, self.borrowed):
+            if rows:
+                yield from rows
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a section from a raw scraper section dict"""
+        def _rows(key):
+            rows = data.get(key)
+            if rows is None:
+                return None
+            return [Asset.from_dict(row) for row in rows]
+
+        return cls(
+            section_type=data.get('section_type'),
+            market_name=data.get('market_name'),
+            health_rate=data.get('health_rate'),
+            assets=_rows('assets'),
+            supplied=_rows('supplied'),
+            borrowed=_rows('borrowed'),
+        )
+
+    def to_dict(self, value_key, blockchain, min_usd=None):
+        """Serialize to the JSON section shape, leaving out rows below min_usd"""
+        def _rows(rows):
+            return [a.to_dict(value_key) for a in rows or [] if not a.is_dust(min_usd)]
+
+        section = {"section_type": self.section_type}
+        if self.market_name is not None:
+            section['market_name'] = self.market_name
+        if self.is_lending:
+            if blockchain == 'evm':
+                section['health_rate'] = self.health_rate
+            section['supplied'] = _rows(self.supplied)
+            section['borrowed'] = _rows(self.borrowed)
+        else:
+            section['assets'] = _rows(self.assets)
+        return section
+
+
+class Project:
+    """Protocol/project entry with its sections"""
+
+    __slots__ = ('project_name', 'chain', 'total_value', 'sections')
+
+    def __init__(self, project_name, chain=None, total_value=None, sections=None):
+        self.project_name = _intern(project_name)
+        self.chain = _intern(chain)
+        self.total_value = total_value
+        self.sections = sections if sections is not None else []
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a project from a raw scraper project dict"""
+        return cls(
+            project_name=data.get('project_name'),
+            chain=data.get('chain'),
+            total_value=_to_float(data.get('total_value')),
+            sections=[Section.from_dict(s) for s in data.get('sections', [])],
+        )
+
+    def to_dict(self, value_key, blockchain, min_usd=None):
+        """Serialize to the JSON project shape (total_value still includes dust)"""
+        project = {"project_name": self.project_name}
+        if self.chain is not None:
+            project['chain'] = self.chain
+        if self.total_value is not None:
+            project['total_value'] = self.total_value
+        project['sections'] = [s.to_dict(value_key, blockchain, min_usd) for s in self.sections]
+        return project
+
+
+class Portfolio:
+    """Normalized portfolio snapshot for a single wallet"""
+
+    __slots__ = ('blockchain', 'timestamp', 'wallet_address', 'projects')
+
+    def __init__(self, blockchain, timestamp, wallet_address, projects=None):
+        self.blockchain = _intern(blockchain)
+        self.timestamp = timestamp
+        self.wallet_address = _intern(wallet_address)
+        self.projects = projects if projects is not None else []
+
+    @property
+    def projects_count(self):
+        return len(self.projects)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Normalize a raw scraper dict (or a saved JSON snapshot) into the model"""
+        return cls(
+            blockchain=data.get('blockchain'),
+            timestamp=data.get('timestamp'),
+            wallet_address=data.get('wallet_address'),
+            projects=[Project.from_dict(p) for p in data.get('projects', [])],
+        )
+
+    def to_dict(self, min_usd=None):
+        """Serialize to the JSON shape served by the API and written to OUTPUT_DIR
+
+        Rows worth less than min_usd are left out; snapshots are written
+        with every row (min_usd=None).
+        """
+        value_key = VALUE_KEYS.get(self.blockchain, 'usd_value')
+        return {
+            "blockchain": self.blockchain,
+            "timestamp": self.timestamp,
+            "wallet_address": self.wallet_address,
+            "projects_count": len(self.projects),
+            "projects": [p.to_dict(value_key, self.blockchain, min_usd) for p in self.projects],
+        }
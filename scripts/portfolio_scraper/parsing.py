@@ -0,0 +1,185 @@
+"""
+Shared numeric parsers for scraped text
+
+Used by the Jupiter, DeBank and Rabby scrapers. Patterns are compiled once and
+results for repeated strings (prices, '$0', '<$0.01', ...) are memoized.
+parse_column() parses a whole table column at once.
+"""
+import re
+from functools import lru_cache
+
+
+# Unicode minus/dash variants -> ASCII minus, and characters we never need
+_TRANSLATE = str.maketrans({
+    '\u2212': '-',  # minus sign
+    '\u2012': '-',  # figure dash
+    '\u2013': '-',  # en dash
+    '\ufe63': '-',  # small hyphen-minus
+    '\uff0d': '-',  # fullwidth hyphen-minus
+    '$': None,
+    '+': None,
+    '%': None,
+    ' ': None,
+    '\u00a0': None,  # no-break space (thousands separator in some locales)
+    '\u202f': None,  # narrow no-break space
+    '\u2009': None,  # thin space
+    "'": None,  # Swiss thousands separator
+})
+
+_DIGITS = '0123456789'
+_NUMBER_RE = re.compile(r'^(-?)(\d[\d.,]*|\.\d+)([kmbt])?$', re.IGNORECASE)
+_COMMA_THOUSANDS_RE = re.compile(r'^\d{1,3}(,\d{3})+$')
+_DOT_THOUSANDS_RE = re.compile(r'^\d{1,3}(\.\d{3}){2,}$')
+# A '1,234.5' cell: the column groups thousands with commas
+_GROUPED_RE = re.compile(r',\d{3}\.')
+# Deletes everything a plain en-US amount column (joined with '\x00') may hold
+_PLAIN_COLUMN = str.maketrans('', '', '0123456789.,-\x00')
+
+_SUFFIX_MULTIPLIERS = {
+    'k': 1e3,
+    'm': 1e6,
+    'b': 1e9,
+    't': 1e12,
+}
+
+PARSE_CACHE_SIZE = 4096
+
+
+def _normalize_separators(digits):
+    """Turn '1,234.56', '1.234,56', '0,5' or '1.234.567' into a float-parsable string"""
+    has_comma = ',' in digits
+    has_dot = '.' in digits
+    if has_comma and has_dot:
+        # Whichever separator comes last is the decimal separator
+        if digits.rfind(',') > digits.rfind('.'):
+            return digits.replace('.', '').replace(',', '.')
+        return digits.replace(',', '')
+    if has_comma:
+        if _COMMA_THOUSANDS_RE.match(digits):
+            return digits.replace(',', '')
+        return digits.replace(',', '.')
+    if has_dot and _DOT_THOUSANDS_RE.match(digits):
+        return digits.replace('.', '')
+    return digits
+
+
+def _parse_number(text):
+    """Uncached core of parse_numeric_value"""
+    if not text:
+        return 0
+    text = text.strip()
+    # Fast path for the common '$1,234.56' / '-12.5' shape; a comma after the
+    # last dot means a locale decimal comma (or comma-only text) -> slow path
+    if text and text[-1].isdigit() and text.rfind(',') <= text.rfind('.'):
+        try:
+            return float(text.replace('$', '').replace(',', ''))
+        except ValueError:
+            pass
+    if text.startswith('<') or text.startswith('>'):
+        return 0
+    match = _NUMBER_RE.match(text.translate(_TRANSLATE))
+    if not match:
+        return 0
+    sign, digits, suffix = match.groups()
+    try:
+        value = float(_normalize_separators(digits))
+    except ValueError:
+        return 0
+    if suffix:
+        value *= _SUFFIX_MULTIPLIERS[suffix.lower()]
+    return -value if sign else value
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_numeric_value(text):
+    """Parse a money/number cell like '$1,234.56', '-$1.2K', '1.234,56' or '<$0.01'
+
+    Values shown as bounds ('<$0.01', '>$1M') are reported as 0, as before.
+    Returns 0 when the text is not a number.
+    """
+    return _parse_number(text)
+
+
+def parse_amount_value(text):
+    """Parse the leading amount from text like '19,033.70 reUSDe' or '46,172 CASH'"""
+    try:
+        amount = text.split(None, 1)[0]
+    except (AttributeError, IndexError):
+        return 0
+    # Fast path for plain '0.5' / '19,033.70' amounts (no comma after the last
+    # dot): amount columns are large and rarely repeated
+    if amount[-1] in _DIGITS and ',' not in amount.rpartition('.')[2]:
+        try:
+            return float(amount.replace(',', ''))
+        except ValueError:
+            pass
+    # Amounts are rarely repeated, so skip the cache to keep prices in it
+    return _parse_number(amount)
+
+
+def extract_balance_value(balance_text):
+    """Extract numeric balance from text like '99,453.1873 PT-sNUSD-5MAR2026' -> 99453.1873
+
+    Returns None when the cell is empty so callers can skip incomplete rows.
+    """
+    if not balance_text or not balance_text.strip():
+        return None
+    return parse_amount_value(balance_text)
+
+
+def parse_percent(text):
+    """Parse a yield/APY cell like '+12.5%' into 12.5"""
+    return parse_numeric_value(text)
+
+
+
+def _parse_amount_column(texts, parser):
+    """Column path for amount/balance cells: the separator locale is inferred
+    once per column instead of per cell
+
+    A column mixes no locales, so when one cell reads '1,234.5' every comma in
+    it groups thousands and the amounts convert in one pass. Any other column
+    falls back to `parser` cell by cell.
+    """
+    try:
+        column = '\x00'.join([text.split(None, 1)[0] for text in texts])
+    except (AttributeError, IndexError):
+        column = ''
+    if column and not column.translate(_PLAIN_COLUMN) and (',' not in column or _GROUPED_RE.search(column)):
+        try:
+            values = list(map(float, column.replace(',', '').split('\x00')))
+        except ValueError:
+            values = None
+        if values is not None and len(values) == len(texts):
+            return values
+    return [parser(text) for text in texts]
+
+
+def _parse_numeric_column(texts, parser):
+    """Column path for money cells: each distinct text is parsed once"""
+    unique = set(texts)
+    values = dict(zip(unique, map(parser, unique)))
+    return list(map(values.__getitem__, texts))
+
+
+_COLUMN_PARSERS = {
+    parse_amount_value: _parse_amount_column,
+    extract_balance_value: _parse_amount_column,
+    parse_numeric_value: _parse_numeric_column,
+    parse_percent: _parse_numeric_column,
+}
+
+
+def parse_column(texts, parser=parse_numeric_value):
+    """Parse a whole column of cell texts with one of the parsers above
+
+    Args:
+        texts: cell texts of one table column
+        parser: the per-cell parser the column would otherwise use
+
+    Returns: list of parsed values, in input order
+    """
+    column_parser = _COLUMN_PARSERS.get(parser)
+    if column_parser is None:
+        return [parser(text) for text in texts]
+    return column_parser(texts, parser)
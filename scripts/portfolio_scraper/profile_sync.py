@@ -0,0 +1,162 @@
+"""
+Incremental Chrome profile sync
+
+Mirrors the profile items we need (cookies, storage, extensions) from the
+user's Chrome profile into the debug profile without wiping it first. A
+manifest in the destination records the size and mtime of every file on both
+sides after it was copied; on the next start only files that changed on
+either side are copied again, and destination files not in the source (gone
+from it, or created by the debug Chrome) are removed.
+A browser restart with an unchanged source profile copies nothing.
+
+Copies use a reflink (FICLONE) where the filesystem supports it (btrfs, XFS,
+bcachefs), which is a constant-time copy-on-write clone, and fall back to a
+regular copy. Hardlinks are deliberately NOT used: Chrome rewrites files such
+as `Cookies` (SQLite) and the LevelDB logs in place, so a hardlinked debug
+profile would write straight into the user's real profile.
+"""
+import errno
+import json
+import os
+import shutil
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+MANIFEST_NAME = '.profile_sync_manifest.json'
+
+# _IOW(0x94, 9, int) from linux/fs.h
+FICLONE = 0x40049409
+
+_reflink_supported = None
+
+# ioctl errors meaning the filesystem can't clone at all (not just this file)
+_REFLINK_UNSUPPORTED = {
+    errno.EOPNOTSUPP, getattr(errno, 'ENOTSUP', errno.EOPNOTSUPP), errno.EXDEV, errno.EINVAL, errno.ENOTTY,
+}
+
+
+def _reflink(src, dst):
+    """Clone src to dst with FICLONE; returns False if the filesystem can't"""
+    global _reflink_supported
+    if fcntl is None or _reflink_supported is False:
+        return False
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        shutil.copystat(src, dst)
+        _reflink_supported = True
+        return True
+    except OSError as e:
+        # Different fs or no CoW support: stop trying; anything else (a file
+        # Chrome is rotating, ENOSPC, ...) only affects this file
+        if e.errno in _REFLINK_UNSUPPORTED and _reflink_supported is None:
+            _reflink_supported = False
+        return False
+
+
+def copy_file(src, dst):
+    """Copy one file, reflinking when possible; returns 'reflink' or 'copy'"""
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    if os.path.lexists(dst) and not os.path.isfile(dst):
+        shutil.rmtree(dst) if os.path.isdir(dst) else os.remove(dst)
+    if _reflink(src, dst):
+        return 'reflink'
+    shutil.copy2(src, dst)
+    return 'copy'
+
+
+def _stat_key(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _walk_files(root, item):
+    """Relative paths of all regular files under root/item (item may be a file)"""
+    path = os.path.join(root, item)
+    if os.path.isfile(path):
+        return [item]
+    files = []
+    for dirpath, _dirnames, filenames in os.walk(path):
+        for name in filenames:
+            full = os.path.join(dirpath, name)
+            if os.path.isfile(full) and not os.path.islink(full):
+                files.append(os.path.relpath(full, root))
+    return files
+
+
+def load_manifest(dest_dir):
+    try:
+        with open(os.path.join(dest_dir, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(dest_dir, manifest):
+    path = os.path.join(dest_dir, MANIFEST_NAME)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, path)
+
+
+def sync_profile(source_profile, dest_dir, items):
+    """Bring dest_dir/<item> in line with source_profile/<item> for each item
+
+    Returns a stats dict: synced items, copied/reflinked/unchanged/removed
+    file counts and bytes copied.
+    """
+    os.makedirs(dest_dir, exist_ok=True)
+    manifest = load_manifest(dest_dir)
+    new_manifest = {}
+    stats = {"items": [], "copied": 0, "reflinked": 0, "unchanged": 0, "removed": 0, "bytes": 0, "errors": 0}
+
+    source_files = set()
+    for item in items:
+        if not os.path.exists(os.path.join(source_profile, item)):
+            continue
+        for rel_path in _walk_files(source_profile, item):
+            source_files.add(rel_path)
+            src = os.path.join(source_profile, rel_path)
+            dst = os.path.join(dest_dir, rel_path)
+            try:
+                src_key = _stat_key(src)
+                entry = manifest.get(rel_path)
+                if entry and entry.get('src') == src_key and os.path.isfile(dst) and _stat_key(dst) == entry.get('dst'):
+                    # Neither our source nor the debug Chrome touched it
+                    new_manifest[rel_path] = entry
+                    stats["unchanged"] += 1
+                    continue
+                method = copy_file(src, dst)
+                new_manifest[rel_path] = {"src": src_key, "dst": _stat_key(dst)}
+                stats["reflinked" if method == 'reflink' else "copied"] += 1
+                if method == 'copy':
+                    stats["bytes"] += src_key[0]
+            except OSError as e:
+                # Chrome may be rotating a file under us; retry next start
+                stats["errors"] += 1
+                print(f"      ⚠️  Could not sync {rel_path}: {e}")
+        stats["items"].append(item)
+
+    # Files we previously synced that no longer exist in the source, and files
+    # the debug Chrome created under our items that were never in it
+    stale = set(manifest) - source_files
+    for item in items:
+        if os.path.exists(os.path.join(dest_dir, item)):
+            stale.update(rel_path for rel_path in _walk_files(dest_dir, item) if rel_path not in source_files)
+    for rel_path in stale:
+        try:
+            os.remove(os.path.join(dest_dir, rel_path))
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            print(f"      ⚠️  Could not remove {rel_path}: {e}")
+            continue
+        stats["removed"] += 1
+
+    save_manifest(dest_dir, new_manifest)
+    return stats
@@ -0,0 +1,97 @@
+"""
+Reconciliation of extracted rows against the totals shown on the page
+
+DeBank and Rabby print each project's net value next to its name (DeBank also
+the Wallet total). The rows captured for a project should add up to it; when
+they don't, rows were missed (a panel still rendering, an unrecognized table)
+and just that project is extracted again instead of re-scraping the whole
+wallet.
+"""
+from datetime import datetime
+
+from .config import RECONCILE_TOLERANCE_PCT
+from .crosscheck import MIN_ABSOLUTE_DIFF
+from .metrics import inc, RECONCILE_METRIC
+from .section_specs import build_project
+
+
+def reconciles(total, rows_usd, tolerance_pct=None):
+    """True when the row sum matches the page total within the tolerance"""
+    tolerance_pct = RECONCILE_TOLERANCE_PCT if tolerance_pct is None else tolerance_pct
+    diff = abs(total - rows_usd)
+    return diff < MIN_ABSOLUTE_DIFF or diff <= abs(total) * tolerance_pct / 100
+
+
+def rows_usd(project):
+    """Net USD of the rows of a project dict, borrowed counting negative"""
+    value = 0.0
+    for section in project["sections"]:
+        value += sum(row["usd_value"] for row in section.get("assets") or [])
+        value += sum(row["usd_value"] for row in section.get("supplied") or [])
+        value -= sum(abs(row["usd_value"]) for row in section.get("borrowed") or [])
+    return value
+
+
+def project_report(project):
+    """Reconciliation of one project dict"""
+    total = project["total_value"]
+    value = rows_usd(project)
+    return {
+        "project": project["project_name"],
+        "total_usd": round(total, 2),
+        "rows_usd": round(value, 2),
+        "diff_usd": round(value - total, 2),
+        "reconciled": reconciles(total, value),
+        "reextracted": False,
+    }
+
+
+def build_reconciled(raw, spec, reextract=None):
+    """Build a project and reconcile its rows with its total
+
+    reextract() returns the project extracted again (or None); it is called
+    once when the first extraction doesn't reconcile, and the closer of the
+    two is kept. Returns (project dict, report or None without a page total).
+    """
+    project = build_project(raw, spec)
+    if raw["total"] is None:
+        return project, None
+
+    report = project_report(project)
+    if report["reconciled"]:
+        inc(RECONCILE_METRIC, source=spec["source"], result='reconciled')
+        return project, report
+
+    print(f"[{spec['tag']}]     ⚠ Rows add up to ${report['rows_usd']:,.2f}, total is ${report['total_usd']:,.2f} - re-extracting {project['project_name']}")
+    retry = reextract() if reextract else None
+    if retry is not None:
+        retry_project = build_project(retry, spec)
+        retry_report = project_report(retry_project)
+        if abs(retry_report["diff_usd"]) < abs(report["diff_usd"]):
+            project, report = retry_project, retry_report
+        report["reextracted"] = True
+
+    inc(RECONCILE_METRIC, source=spec["source"], result='reconciled' if report["reconciled"] else 'mismatch')
+    if report["reconciled"]:
+        print(f"[{spec['tag']}]     ✓ Reconciled after re-extracting")
+    else:
+        print(f"[{spec['tag']}]     ⚠ Still off by ${report['diff_usd']:,.2f}")
+    return project, report
+
+
+def wallet_report(reports):
+    """Wallet-level reconciliation from the project reports (None entries are skipped)"""
+    reports = [r for r in reports if r]
+    total = sum(r["total_usd"] for r in reports)
+    rows = sum(r["rows_usd"] for r in reports)
+    mismatches = [r for r in reports if not r["reconciled"]]
+    return {
+        "total_usd": round(total, 2),
+        "rows_usd": round(rows, 2),
+        "diff_usd": round(rows - total, 2),
+        "reconciled": reconciles(total, rows) and not mismatches,
+        "projects_checked": len(reports),
+        "reextracted": sum(1 for r in reports if r["reextracted"]),
+        "mismatches": mismatches,
+        "checked_at": datetime.now().isoformat(),
+    }
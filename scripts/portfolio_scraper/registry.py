@@ -0,0 +1,82 @@
+"""
+Scraper registry
+
+Each source declares which addresses it handles, how many wallets it may
+scrape at once and whether it can run in the shared browser. The scheduler
+routes wallets through here, so a new source (e.g. Rabby) is added with one
+register() call and enabled via SCRAPER_SOURCES, without touching the
+scheduler.
+
+Factories import their scraper lazily, keeping selenium out of import time.
+"""
+from .config import SCRAPER_SOURCES
+from .utils import is_solana_address, is_evm_address
+
+
+class SourceSpec:
+    """Registration of one scraper source"""
+
+    __slots__ = ('name', 'factory', 'handles', 'max_concurrency', 'shares_session')
+
+    def __init__(self, name, factory, handles, max_concurrency=1, shares_session=False):
+        self.name = name
+        self.factory = factory  # factory(slot=0, **options) -> Scraper
+        self.handles = handles  # handles(address) -> bool
+        self.max_concurrency = max(1, max_concurrency)  # Scraper instances (one driver and profile each)
+        self.shares_session = shares_session  # May run as a tab of the shared browser
+
+    def create(self, slot=0, **options):
+        """New scraper instance for a concurrency slot (0 .. max_concurrency-1)"""
+        return self.factory(slot=slot, **options)
+
+
+_sources = {}
+
+
+def register(name, factory, handles, max_concurrency=1, shares_session=False):
+    """Register (or replace) a scraper source"""
+    spec = _sources[name] = SourceSpec(name, factory, handles, max_concurrency, shares_session)
+    return spec
+
+
+def get(name):
+    try:
+        return _sources[name]
+    except KeyError:
+        raise ValueError(f"Unknown scraper source: {name} (registered: {', '.join(_sources)})") from None
+
+
+def enabled_sources():
+    """Specs of the sources enabled in SCRAPER_SOURCES, in priority order"""
+    return [get(name) for name in SCRAPER_SOURCES]
+
+
+def sources_for(address):
+    """Enabled sources that can scrape an address, in priority order"""
+    return [spec for spec in enabled_sources() if spec.handles(address)]
+
+
+def route(address):
+    """The enabled source that scrapes an address, or None"""
+    candidates = sources_for(address)
+    return candidates[0] if candidates else None
+
+
+def _jupiter(slot=0, **options):
+    from .jupiter_scraper import JupiterScraper
+    return JupiterScraper(slot=slot, **options)
+
+
+def _debank(slot=0, **options):
+    from .debank_scraper import DebankScraper
+    return DebankScraper(slot=slot, **options)
+
+
+def _rabby(slot=0, session=None, **options):
+    from .rabby_scraper import RabbyScraper
+    return RabbyScraper(slot=slot, **options)  # Own Chrome: needs the extension and relaxed site isolation
+
+
+register('jupiter', _jupiter, is_solana_address, shares_session=True)
+register('debank', _debank, is_evm_address, shares_session=True)
+register('rabby', _rabby, is_evm_address)
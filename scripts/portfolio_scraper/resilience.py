@@ -0,0 +1,125 @@
+"""
+Retry policy with exponential backoff and per-source circuit breakers
+
+RetryPolicy retries a failed wallet within the same cycle after an
+exponentially growing, jittered delay and keeps per-wallet failure counts.
+CircuitBreaker stops sending wallets to a source (Jupiter, DeBank, Rabby)
+after consecutive failures and lets a single probe through once the reset
+timeout has passed.
+"""
+import random
+import threading
+import time
+from datetime import datetime
+
+from .config import (
+    RETRY_ATTEMPTS,
+    RETRY_BASE_SECONDS,
+    RETRY_MAX_SECONDS,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_SECONDS,
+)
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter, plus per-wallet failure bookkeeping"""
+
+    def __init__(self, max_attempts=None, base_delay=None, max_delay=None, jitter=0.5):
+        self.max_attempts = max(1, max_attempts or RETRY_ATTEMPTS)
+        self.base_delay = RETRY_BASE_SECONDS if base_delay is None else base_delay
+        self.max_delay = RETRY_MAX_SECONDS if max_delay is None else max_delay
+        self.jitter = jitter
+        self._lock = threading.Lock()
+        self._wallets = {}
+
+    def backoff(self, attempt):
+        """Delay before retry number `attempt` (1-based), jittered by +/- jitter"""
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def record_success(self, wallet_address):
+        with self._lock:
+            state = self._wallets.setdefault(wallet_address, {})
+            state.update(consecutive_failures=0, last_success=datetime.now().isoformat(), last_error=None)
+
+    def record_failure(self, wallet_address, error):
+        with self._lock:
+            state = self._wallets.setdefault(wallet_address, {"consecutive_failures": 0})
+            state["consecutive_failures"] = state.get("consecutive_failures", 0) + 1
+            state["last_failure"] = datetime.now().isoformat()
+            state["last_error"] = error
+
+    def snapshot(self):
+        """JSON-serializable per-wallet retry state for /health"""
+        with self._lock:
+            return {wallet: dict(state) for wallet, state in self._wallets.items()}
+
+
+class CircuitBreaker:
+    """Closed -> open after consecutive failures -> half-open probe after a timeout"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name, failure_threshold=None, reset_timeout=None):
+        self.name = name
+        self.failure_threshold = failure_threshold or BREAKER_FAILURE_THRESHOLD
+        self.reset_timeout = BREAKER_RESET_SECONDS if reset_timeout is None else reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Whether a request may go to this source right now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.time() - self.opened_at >= self.reset_timeout:
+                # Let exactly one probe through
+                self.state = self.HALF_OPEN
+                print(f"[Breaker] {self.name}: probing after {self.reset_timeout}s open")
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                print(f"[Breaker] ✓ {self.name}: closed again")
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    print(f"[Breaker] ⛔ {self.name}: open after {self.consecutive_failures} consecutive failures")
+                self.state = self.OPEN
+                self.opened_at = time.time()
+
+    def abandon_probe(self):
+        """The half-open probe ended without an outcome (e.g. a captcha): wait for the next one"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+                self.opened_at = time.time()
+
+    def seconds_until_probe(self):
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0
+            return max(0.0, self.reset_timeout - (time.time() - self.opened_at))
+
+    def snapshot(self):
+        """JSON-serializable state for /health"""
+        probe_in = self.seconds_until_probe()
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "opened_at": datetime.fromtimestamp(self.opened_at).isoformat() if self.opened_at else None,
+                "next_probe_in_seconds": round(probe_in) if self.state == self.OPEN else None,
+            }
@@ -5,11 +5,24 @@ from apscheduler.schedulers.background import BackgroundScheduler
 import json
 import time
 import atexit
+import threading
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
-from .jupiter_scraper import JupiterScraper
-from .debank_scraper import DebankScraper
+from . import registry, crosscheck
 from .utils import is_solana_address
-from .config import OUTPUT_DIR
+from .config import OUTPUT_DIR, WEBDRIVER_PROFILE, CAPTCHA_WAIT_SECONDS, STALE_AFTER_SECONDS, SHARED_BROWSER, FANOUT, MIN_USD_VALUE
+from .metrics import span, inc, observe, scrape_context, PHASE_METRIC, RESULT_METRIC, RECYCLE_METRIC, CROSSCHECK_METRIC
+from .webdriver_profiler import profiler
+from .model import Portfolio
+from .challenges import CaptchaChallenge, NeedsHumanQueue
+from .resilience import RetryPolicy, CircuitBreaker
+from .supervisor import supervisor
+from .watchdog import MemoryWatchdog
+from .session_broker import BrowserSession
+from .drift import DriftDetector
 
 
 class PortfolioScheduler:
@@ -22,117 +35,471 @@ class PortfolioScheduler:
         self.chrome_debug_port = chrome_debug_port
         
         self.cached_portfolio_data = {}
+        self.scraped_at = {}  # wallet -> datetime of its last successful scrape
+        self.source_of = {}  # wallet -> source that produced the cached data
+        self.cross_checks = {}  # wallet -> last fan-out cross-check report
+        self.reconciliations = {}  # wallet -> rows vs page totals of its last scrape
+        self._race = {}  # wallet -> (source, Portfolio) of the fan-out winner
+        self._race_lock = threading.Lock()
+        self.restored = set()  # Wallets served from a disk snapshot until re-scraped
         self.last_update_time = None
-        self.jupiter_scraper = None
-        self.debank_scraper = None
+        self._scrape_lock = threading.Lock()  # One cycle or single-wallet scrape at a time; sources run in parallel inside it
+        self._refreshing = set()  # Wallets with a background refresh queued
+        self._refreshing_lock = threading.Lock()
+        self.scrapers = {}  # (source, slot) -> Scraper, see registry
         self.scheduler = None
+        self.needs_human = NeedsHumanQueue()  # Wallets parked behind a captcha
+        self.retry_policy = RetryPolicy()
+        self.breakers = {spec.name: CircuitBreaker(spec.name) for spec in registry.enabled_sources()}
+        self.memory_watchdog = MemoryWatchdog()
+        self.drift = DriftDetector()  # Keeps suspicious scrapes from replacing good cache entries
+        self.browser_session = BrowserSession() if SHARED_BROWSER else None  # One Chrome, a tab per site
     
-    def get_jupiter_scraper(self):
-        """Get or create Jupiter scraper instance with health check"""
+    def get_scraper(self, source, slot=0):
+        """Get or create the scraper of a source (and concurrency slot) with health check"""
+        key = (source, slot)
+        scraper = self.scrapers.get(key)
+        
         # Check if existing scraper is alive
-        if self.jupiter_scraper is not None:
-            if not self.jupiter_scraper.is_driver_alive():
-                print("[Scheduler] ⚠️ Jupiter driver is stale, reconnecting...")
-                try:
-                    self.jupiter_scraper.cleanup()
-                except:
-                    pass
-                self.jupiter_scraper = None
+        if scraper is not None and not scraper.is_driver_alive():
+            print(f"[Scheduler] ⚠️ {scraper.tag} driver is stale, reconnecting...")
+            try:
+                scraper.cleanup()
+            except:
+                pass
+            scraper = None
         
         # Create new scraper if needed
-        if self.jupiter_scraper is None:
-            self.jupiter_scraper = JupiterScraper(debug_port=self.chrome_debug_port)
-            if not self.jupiter_scraper.connect_to_chrome():
+        if scraper is None:
+            spec = registry.get(source)
+            # One tab per site: extra slots run their own Chrome
+            session = self.browser_session if spec.shares_session and slot == 0 else None
+            scraper = self.scrapers[key] = spec.create(slot=slot, debug_port=self.chrome_debug_port, session=session)
+            if not scraper.connect_to_chrome():
                 return None
         
-        return self.jupiter_scraper
+        return scraper
     
-    def get_debank_scraper(self):
-        """Get or create DeBank scraper instance with health check"""
-        # Check if existing scraper is alive
-        if self.debank_scraper is not None:
-            if not self.debank_scraper.is_driver_alive():
-                print("[Scheduler] ⚠️ DeBank driver is stale, reconnecting...")
-                try:
-                    self.debank_scraper.cleanup()
-                except:
-                    pass
-                self.debank_scraper = None
+    def _turn(self, source):
+        """Lock a source must hold while driving its browser: sites of the shared browser take turns"""
+        if self.browser_session and registry.get(source).shares_session:
+            return self.browser_session.lock
+        return nullcontext()
+    
+    def cleanup(self):
+        """Shut down all scraper drivers (and the shared browser)"""
+        for scraper in list(self.scrapers.values()):
+            try:
+                scraper.cleanup()
+            except Exception as e:
+                print(f"[Scheduler] ⚠️  Cleanup of {scraper.tag} failed: {e}")
+        self.scrapers.clear()
+        if self.browser_session:
+            self.browser_session.shutdown()
+    
+    @staticmethod
+    def _snapshot_path(wallet_address):
+        file_prefix = "solana" if is_solana_address(wallet_address) else "evm"
+        return f"{OUTPUT_DIR}/{file_prefix}_portfolio_{wallet_address[:8]}.json"
+    
+    def load_snapshots(self):
+        """Warm-start the cache from the JSON snapshots of the last run
         
-        # Create new scraper if needed
-        if self.debank_scraper is None:
-            self.debank_scraper = DebankScraper(debug_port=self.chrome_debug_port)
-            if not self.debank_scraper.connect_to_chrome():
+        Restored wallets are reported stale until they are scraped again.
+        Returns the number of wallets restored.
+        """
+        restored = 0
+        for wallet_address in self.solana_addresses + self.evm_addresses:
+            path = self._snapshot_path(wallet_address)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+                # Snapshot names only use the first 8 characters of the address
+                if (data.get('wallet_address') or '').lower() != wallet_address.lower():
+                    continue
+                portfolio = Portfolio.from_dict(data)
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"   ⚠️  Could not restore {path}: {e}")
+                continue
+            
+            try:
+                scraped_at = datetime.fromisoformat(portfolio.timestamp)
+            except (TypeError, ValueError):
+                scraped_at = datetime.fromtimestamp(os.path.getmtime(path))
+            
+            self.cached_portfolio_data[wallet_address] = portfolio
+            self.scraped_at[wallet_address] = scraped_at
+            self.restored.add(wallet_address)
+            spec = registry.route(wallet_address)
+            if spec:
+                self.drift.seed(spec.name, wallet_address, portfolio)
+            restored += 1
+        
+        if restored:
+            self.last_update_time = max(self.scraped_at.values())
+        return restored
+    
+    def _store_portfolio(self, wallet_address, portfolio_data, source):
+        """Cache a scraped portfolio and write its JSON snapshot"""
+        self.cached_portfolio_data[wallet_address] = portfolio_data
+        self.scraped_at[wallet_address] = datetime.now()
+        self.source_of[wallet_address] = source
+        self.restored.discard(wallet_address)
+        output_file = self._snapshot_path(wallet_address)
+        with span('serialize', source=source):
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(portfolio_data.to_dict(), f, indent=2, ensure_ascii=False)
+        
+        print(f"      ✓ Scraped successfully - {portfolio_data.projects_count} projects")
+        inc(RESULT_METRIC, source=source, result='success')
+    
+    def _plausible(self, source, wallet_address, portfolio_data):
+        """Drift check before caching: a suspicious result only fills an empty cache entry"""
+        anomalies = self.drift.check(source, wallet_address, portfolio_data)
+        if not anomalies:
+            return True
+        print(f"      ⚠️  Suspicious {source} result: {'; '.join(anomalies)}")
+        if wallet_address not in self.cached_portfolio_data:
+            # Nothing better to serve: this is the baseline now
+            self.drift.accept(source, wallet_address, portfolio_data)
+            return True
+        print(f"      ↷ Keeping the cached portfolio")
+        inc(RESULT_METRIC, source=source, result='suspect')
+        return False
+    
+    def _recycle_if_bloated(self, source, slot=0):
+        """Replace a source's driver between wallets if it exceeds the memory limits"""
+        scraper = self.scrapers.get((source, slot))
+        if scraper is None or not scraper.driver:
+            return False
+        # Keep the window a captcha is waiting in (any site's, if the browser is shared)
+        if self.needs_human.wallets(None if scraper.session else source):
+            return False
+        
+        reason = self.memory_watchdog.over_limit(scraper.process_label, scraper.driver)
+        if not reason:
+            return False
+        print(f"[Scheduler] ♻️  Recycling {source} driver: {reason}")
+        try:
+            scraper.cleanup()
+        except Exception as e:
+            print(f"[Scheduler] ⚠️  Cleanup during recycle failed: {e}")
+        if scraper.session:
+            # Releasing a tab frees little; restart the browser, the other tab reopens on demand
+            scraper.session.shutdown()
+        self.scrapers.pop((source, slot), None)  # get_scraper() starts a fresh one
+        self.memory_watchdog.record_recycle(scraper.process_label, reason)
+        inc(RECYCLE_METRIC, source=source)
+        return True
+    
+    def _scrape_with_retry(self, source, wallet_address, slot=0):
+        """Scrape one wallet, retrying with backoff, unless the source's circuit is open
+        
+        A page that loads but yields no projects is retried too, and accepted
+        after the last attempt (the wallet may really be empty). Returns the
+        Portfolio or None; CaptchaChallenge propagates to the caller.
+        """
+        breaker = self.breakers[source]
+        portfolio_data = None
+        turn = self._turn(source)
+        with turn:
+            self._recycle_if_bloated(source, slot)
+        
+        for attempt in range(1, self.retry_policy.max_attempts + 1):
+            if not breaker.allow():
+                print(f"      ⛔ {source} circuit open - skipping (next probe in {breaker.seconds_until_probe():.0f}s)")
+                inc(RESULT_METRIC, source=source, result='skipped')
                 return None
+            
+            portfolio_data = None
+            with turn:
+                try:
+                    # get_scraper() also replaces a stale driver
+                    scraper = self.get_scraper(source, slot)
+                    if scraper:
+                        with scrape_context(wallet=wallet_address), span('wallet', source=source):
+                            portfolio_data = scraper.scrape_portfolio(wallet_address)
+                except BaseException:
+                    # Don't leave a half-open breaker waiting for an outcome forever
+                    breaker.abandon_probe()
+                    raise
+                if scraper and scraper.reconciliation and wallet_address in scraper.reconciliation:
+                    self.reconciliations[wallet_address] = scraper.reconciliation.pop(wallet_address)
+            
+            if portfolio_data is not None:
+                breaker.record_success()
+                if portfolio_data.projects_count > 0 or attempt == self.retry_policy.max_attempts:
+                    self.retry_policy.record_success(wallet_address)
+                    return portfolio_data
+                error = "empty result"
+            else:
+                breaker.record_failure()
+                error = "scraper could not start" if scraper is None else "scrape failed"
+            
+            self.retry_policy.record_failure(wallet_address, error)
+            inc(RESULT_METRIC, source=source, result='failure')
+            
+            if attempt < self.retry_policy.max_attempts and breaker.state != breaker.OPEN:
+                delay = self.retry_policy.backoff(attempt)
+                print(f"      ↻ {error}, retrying in {delay:.0f}s (attempt {attempt + 1}/{self.retry_policy.max_attempts})")
+                time.sleep(delay)
         
-        return self.debank_scraper
+        return portfolio_data
+    
+    def retry_parked(self):
+        """Retry wallets parked behind a captcha
+        
+        The first retry per source waits up to CAPTCHA_WAIT_SECONDS for a human
+        to solve the captcha in the visible window; once solved the others load
+        normally. Returns the number of wallets scraped.
+        """
+        success_count = 0
+        parked_slots = {(entry["source"], entry["slot"]) for entry in self.needs_human.snapshot().values()}
+        for source, slot in sorted(parked_slots):
+            parked = self.needs_human.wallets(source, slot)
+            with self._turn(source):
+                # The captcha is in the window of the slot that hit it
+                scraper = self.get_scraper(source, slot)
+                if not scraper or not scraper.waits_for_captcha:
+                    continue
+                
+                print(f"\n   ⏸ Retrying {len(parked)} parked {source} wallet(s), waiting up to {CAPTCHA_WAIT_SECONDS}s for the captcha")
+                for wallet_address in parked:
+                    try:
+                        with scrape_context(wallet=wallet_address), span('wallet', source=source):
+                            portfolio_data = scraper.scrape_portfolio(wallet_address, wait_for_captcha=True)
+                    except Exception as e:
+                        # Keep the wallet parked; one failing retry must not end the cycle
+                        print(f"      ⚠️  Retry of {wallet_address[:8]}... failed: {e}")
+                        portfolio_data = None
+                    
+                    if not portfolio_data:
+                        # Still unsolved: the rest would only wait again, keep them parked
+                        inc(RESULT_METRIC, source=source, result='failure')
+                        print(f"      ✗ {wallet_address[:8]}... still blocked, keeping {len(self.needs_human.wallets(source))} wallet(s) parked")
+                        break
+                    
+                    self.needs_human.resolve(wallet_address)
+                    if self._plausible(source, wallet_address, portfolio_data):
+                        self._store_portfolio(wallet_address, portfolio_data, source)
+                        success_count += 1
+                
+                if not self.needs_human.wallets(source, slot) and hasattr(scraper, 'resume_headless'):
+                    scraper.resume_headless()
+        return success_count
     
     def scrape_and_cache(self):
         """Background task: Scrape all configured wallets and cache results"""
+        with self._scrape_lock:
+            self._scrape_all()
+    
+    def scrape_wallet(self, wallet_address):
+        """Scrape and cache a single configured wallet; returns True on success"""
+        with self._scrape_lock:
+            return self._scrape_one(wallet_address)
+    
+    def _sources_for(self, wallet_address):
+        """Sources to scrape a wallet with: every candidate in fan-out mode, else the primary"""
+        candidates = [spec.name for spec in registry.sources_for(wallet_address)]
+        return candidates if FANOUT else candidates[:1]
+    
+    def _scrape_one(self, wallet_address):
+        """Scrape a single wallet (caller holds the scrape lock)
+        
+        In fan-out mode all sources race; this returns once every source has
+        finished, but the first result is cached as soon as it arrives.
+        """
+        sources = self._sources_for(wallet_address)
+        if not sources:
+            print(f"[Scheduler] ✗ No enabled scraper source handles {wallet_address[:8]}...")
+            return False
+        if len(sources) == 1:
+            return self._scrape_routed(sources[0], wallet_address)
+        
+        with self._race_lock:
+            self._race.pop(wallet_address, None)
+        with ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix='fanout') as pool:
+            results = list(pool.map(lambda source: self._scrape_routed(source, wallet_address, raced=True), sources))
+        return any(results)
+    
+    def _claim(self, wallet_address, source, portfolio_data):
+        """Fastest wins: True for the first result of a raced wallet, later ones are cross-checked"""
+        with self._race_lock:
+            winner = self._race.get(wallet_address)
+            if winner is None:
+                self._race[wallet_address] = (source, portfolio_data)
+                return True
+        
+        winner_source, winner_data = winner
+        try:
+            report = crosscheck.compare(winner_data, portfolio_data, winner_source, source)
+        except Exception as e:
+            # A cross-check is informational, never worth losing the cycle over
+            inc(CROSSCHECK_METRIC, result='error')
+            print(f"      ⚠️  Cross-check {winner_source}/{source} failed: {e}")
+            return False
+        report["checked_at"] = datetime.now().isoformat()
+        self.cross_checks[wallet_address] = report
+        if report["consistent"]:
+            inc(CROSSCHECK_METRIC, result='consistent')
+            print(f"      ✓ Cross-check {winner_source}/{source} agrees (Δ ${report['total_diff_usd']:,.2f})")
+        else:
+            inc(CROSSCHECK_METRIC, result='discrepancy')
+            print(f"      ⚠️  Cross-check {winner_source}/{source} differs by ${report['total_diff_usd']:,.2f} "
+                  f"({report['total_diff_pct']}%), {len(report['project_mismatches'])} project mismatch(es)")
+        return False
+    
+    def _scrape_routed(self, source, wallet_address, slot=0, raced=False):
+        """Scrape a wallet with a given source and cache it
+        
+        Returns True if the result was cached. For a raced wallet, a result
+        arriving after another source's is only cross-checked (returns None).
+        """
+        try:
+            portfolio_data = self._scrape_with_retry(source, wallet_address, slot)
+        except CaptchaChallenge as challenge:
+            # Don't let one captcha stall the cycle: park it and move on
+            self.needs_human.park(challenge, slot)
+            inc(RESULT_METRIC, source=source, result='captcha')
+            print(f"      ⏸ Captcha - wallet parked, continuing")
+            return False
+        
+        if not portfolio_data:
+            print(f"      ✗ Scraping failed")
+            return False
+        if not self._plausible(source, wallet_address, portfolio_data):
+            self.needs_human.resolve(wallet_address)
+            return False
+        if raced and not self._claim(wallet_address, source, portfolio_data):
+            return None
+        self._store_portfolio(wallet_address, portfolio_data, source)
+        self.needs_human.resolve(wallet_address)
+        return True
+    
+    def refresh_in_background(self, wallet_address):
+        """Queue a background re-scrape of a stale wallet (stale-while-revalidate)
+        
+        Returns False if a refresh for this wallet is already queued.
+        """
+        with self._refreshing_lock:
+            if wallet_address in self._refreshing:
+                return False
+            self._refreshing.add(wallet_address)
+        
+        def _refresh():
+            try:
+                # Data scraped while we waited for the lock (e.g. by the cycle) is fresh enough
+                before = self.scraped_at.get(wallet_address)
+                with self._scrape_lock:
+                    if self.scraped_at.get(wallet_address) != before:
+                        return
+                    print(f"[Scheduler] 🔄 Background refresh of stale wallet {wallet_address[:8]}...")
+                    self._scrape_one(wallet_address)
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing.discard(wallet_address)
+        
+        threading.Thread(target=_refresh, daemon=True, name=f"refresh-{wallet_address[:8]}").start()
+        return True
+    
+    def _scrape_source(self, source, wallets, raced=()):
+        """Scrape one source's wallets over its concurrency slots; returns the success count"""
+        spec = registry.get(source)
+        work = queue.Queue()
+        for idx, wallet_address in enumerate(wallets, 1):
+            work.put((idx, wallet_address))
+        
+        def worker(slot):
+            scraped = 0
+            while True:
+                try:
+                    idx, wallet_address = work.get_nowait()
+                except queue.Empty:
+                    return scraped
+                print(f"\n   [{source} {idx}/{len(wallets)}] Scraping wallet: {wallet_address[:8]}...{wallet_address[-8:]}")
+                if self._scrape_routed(source, wallet_address, slot, raced=wallet_address in raced):
+                    scraped += 1
+        
+        slots = min(spec.max_concurrency, len(wallets))
+        if slots <= 1:
+            success_count = worker(0)
+        else:
+            with ThreadPoolExecutor(max_workers=slots, thread_name_prefix=source) as pool:
+                success_count = sum(pool.map(worker, range(slots)))
+        
+        # Don't leave a visible window open unless a captcha is waiting in it
+        if not self.needs_human.wallets(source):
+            with self._turn(source):
+                for (name, _slot), scraper in list(self.scrapers.items()):
+                    if name == source and hasattr(scraper, 'resume_headless'):
+                        scraper.resume_headless()
+        return success_count
+    
+    def _scrape_all(self):
+        """One full cycle over all configured wallets (caller holds the scrape lock)"""
         all_addresses = self.solana_addresses + self.evm_addresses
         print(f"\n[{datetime.now().strftime('%H:%M:%S')}] 🔄 Starting background scrape for {len(all_addresses)} wallets...")
         
-        success_count = 0
+        # Route every wallet to its source(s) (see registry)
+        plan = {}
+        raced = set()
+        for wallet_address in all_addresses:
+            sources = self._sources_for(wallet_address)
+            if not sources:
+                print(f"   ⚠️  No enabled scraper source for {wallet_address[:8]}..., skipping")
+                continue
+            if len(sources) > 1:
+                raced.add(wallet_address)  # Fan-out: fastest source wins
+            for source in sources:
+                plan.setdefault(source, []).append(wallet_address)
+        with self._race_lock:
+            self._race = {}
         
-        # Scrape Solana addresses (FIRST)
-        if self.solana_addresses:
-            jupiter = self.get_jupiter_scraper()
-            if jupiter:
-                for idx, wallet_address in enumerate(self.solana_addresses, 1):
-                    print(f"\n   [{idx}/{len(self.solana_addresses)}] Scraping Solana wallet: {wallet_address[:8]}...{wallet_address[-8:]}")
-                    portfolio_data = jupiter.scrape_portfolio(wallet_address)
-                    
-                    if portfolio_data:
-                        self.cached_portfolio_data[wallet_address] = portfolio_data
-                        output_file = f"{OUTPUT_DIR}/solana_portfolio_{wallet_address[:8]}.json"
-                        with open(output_file, "w", encoding="utf-8") as f:
-                            json.dump(portfolio_data, f, indent=2, ensure_ascii=False)
-                        
-                        projects_count = len(portfolio_data.get('projects', []))
-                        print(f"      ✓ Scraped successfully - {projects_count} projects")
-                        success_count += 1
-                    else:
-                        print(f"      ✗ Scraping failed")
-            else:
-                print(f"\n   ✗ Failed to initialize Jupiter scraper")
-        
-        # Scrape EVM addresses using DeBank (SECOND)
-        if self.evm_addresses:
-            debank = self.get_debank_scraper()
-            if debank:
-                for idx, wallet_address in enumerate(self.evm_addresses, 1):
-                    print(f"\n   [{idx}/{len(self.evm_addresses)}] Scraping EVM wallet: {wallet_address[:8]}...{wallet_address[-8:]}")
-                    
-                    portfolio_data = debank.scrape_portfolio(wallet_address)
-                    
-                    if portfolio_data:
-                        self.cached_portfolio_data[wallet_address] = portfolio_data
-                        output_file = f"{OUTPUT_DIR}/evm_portfolio_{wallet_address[:8]}.json"
-                        with open(output_file, "w", encoding="utf-8") as f:
-                            json.dump(portfolio_data, f, indent=2, ensure_ascii=False)
-                        
-                        projects_count = len(portfolio_data.get('projects', []))
-                        print(f"      ✓ Scraped successfully - {projects_count} projects")
-                        success_count += 1
-                    else:
-                        print(f"      ✗ Scraping failed")
-            else:
-                print(f"\n   ✗ Failed to initialize DeBank scraper")
+        # The WebDriver profile reported below covers this cycle only
+        profiler.reset()
+        cycle_start = time.perf_counter()
+        
+        # Sources run in parallel, each on up to max_concurrency drivers
+        with ThreadPoolExecutor(max_workers=max(1, len(plan)), thread_name_prefix='source') as pool:
+            success_count = sum(pool.map(lambda item: self._scrape_source(*item, raced=raced), plan.items()))
+        
+        observe(PHASE_METRIC, time.perf_counter() - cycle_start, phase='cycle', source='scheduler')
+        
+        # Reap renderers that outlived their browser, flag bloated trees
+        supervisor.check()
+        
+        if WEBDRIVER_PROFILE:
+            print(f"\n{profiler.report()}")
+            try:
+                print(f"   ✓ WebDriver profile written to {profiler.dump_json()}")
+            except OSError as e:
+                print(f"   ⚠️  Could not write WebDriver profile: {e}")
         
         if success_count > 0:
             self.last_update_time = datetime.now()
             print(f"\n   ✓ Completed: {success_count}/{len(all_addresses)} wallets scraped successfully")
         else:
             print(f"\n   ✗ Failed: No wallets were scraped successfully")
+        
+        # Parked wallets last, so a pending captcha only delays themselves
+        if self.retry_parked() > 0:
+            self.last_update_time = datetime.now()
     
     def start(self):
         """Start the background scheduler"""
         print(f"⏰ Setting up automatic scraping (every {self.scrape_interval_minutes} minutes)...")
+        # Serve the last snapshots right away; the first cycle refreshes them
+        restored = self.load_snapshots()
+        print(f"   ✓ Restored {restored} wallet(s) from {OUTPUT_DIR} (served as stale until re-scraped)")
+        
         self.scheduler = BackgroundScheduler()
         self.scheduler.add_job(
             func=self.scrape_and_cache,
             trigger="interval",
             minutes=self.scrape_interval_minutes,
+            next_run_time=datetime.now(),  # Initial scrape runs in the background
             id='portfolio_scraper',
             name='Scrape Portfolio',
             replace_existing=True
@@ -144,28 +511,57 @@ class PortfolioScheduler:
         # Register shutdown
         atexit.register(lambda: self.scheduler.shutdown())
         
-        # Initial scrape
-        print("🔄 Performing initial scrape...")
-        self.scrape_and_cache()
+        print("🔄 Initial scrape started in the background")
         print()
     
-    def get_cached_data(self, wallet_address):
-        """Get cached portfolio data for a wallet"""
-        return self.cached_portfolio_data.get(wallet_address)
+    def get_cached_data(self, wallet_address, min_usd=None):
+        """Get cached portfolio data for a wallet, serialized to the JSON shape
+        
+        The cache holds every scraped row; rows worth less than min_usd
+        (default MIN_USD_VALUE) are left out of the result.
+        """
+        portfolio = self.cached_portfolio_data.get(wallet_address)
+        if portfolio is None:
+            return None
+        return portfolio.to_dict(MIN_USD_VALUE if min_usd is None else min_usd)
+    
+    def get_freshness(self, wallet_address, max_age=None):
+        """Freshness metadata of a cached wallet
+        
+        Args:
+            max_age: Seconds after which the data counts as stale
+                (default STALE_AFTER_SECONDS)
+        """
+        scraped_at = self.scraped_at.get(wallet_address)
+        if scraped_at is None:
+            return {"scraped_at": None, "age_seconds": None, "stale": True}
+        
+        max_age = STALE_AFTER_SECONDS if max_age is None else max_age
+        age_seconds = (datetime.now() - scraped_at).total_seconds()
+        return {
+            "scraped_at": scraped_at.isoformat(),
+            "age_seconds": round(age_seconds),
+            "stale": wallet_address in self.restored or age_seconds > max_age,
+        }
     
     def get_status(self):
         """Get scheduler status"""
         all_addresses = self.solana_addresses + self.evm_addresses
         wallet_status = {}
+        needs_human = self.needs_human.snapshot()
         
         for wallet in all_addresses:
             blockchain_type = "solana" if is_solana_address(wallet) else "evm"
+            spec = registry.route(wallet)
             short_addr = f"{wallet[:8]}...{wallet[-8:]}"
             wallet_status[short_addr] = {
                 "full_address": wallet,
                 "blockchain": blockchain_type,
+                "source": self.source_of.get(wallet) or (spec.name if spec else None),
                 "cached": wallet in self.cached_portfolio_data,
-                "projects": len(self.cached_portfolio_data.get(wallet, {}).get('projects', []))
+                "scraped_at": self.scraped_at[wallet].isoformat() if wallet in self.scraped_at else None,
+                "needs_human": wallet in needs_human,
+                "projects": self.cached_portfolio_data[wallet].projects_count if wallet in self.cached_portfolio_data else 0
             }
         
         return {
@@ -175,5 +571,13 @@ class PortfolioScheduler:
             "evm_wallets": len(self.evm_addresses),
             "cached_wallets": len(self.cached_portfolio_data),
             "scrape_interval_minutes": self.scrape_interval_minutes,
-            "wallet_status": wallet_status
+            "wallet_status": wallet_status,
+            "needs_human": needs_human,
+            "retries": self.retry_policy.snapshot(),
+            "circuit_breakers": {source: breaker.snapshot() for source, breaker in self.breakers.items()},
+            "cross_checks": dict(self.cross_checks),
+            "drift": self.drift.snapshot(),
+            "reconciliation": dict(self.reconciliations),
+            "processes": supervisor.snapshot(),
+            "browser_memory": self.memory_watchdog.snapshot()
         }
\ No newline at end of file
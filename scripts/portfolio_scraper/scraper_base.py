@@ -0,0 +1,88 @@
+"""
+Common interface for the browser-backed scrapers
+
+Jupiter, DeBank and Rabby all hold one WebDriver and share the same
+lifecycle: connect, health check, scrape a wallet, clean up (releasing a
+shared-session tab or quitting the driver and reaping its processes).
+The scheduler only talks to scrapers through this interface; which scraper
+handles which address is declared in the registry.
+"""
+from abc import ABC, abstractmethod
+
+from .supervisor import supervisor
+
+
+class Scraper(ABC):
+    """Base class for portfolio scrapers
+
+    Subclasses set `name` (source name) and `tag` (log prefix), and implement
+    connect_to_chrome(), returning attach_session() when a shared
+    BrowserSession was given, and scrape_portfolio(wallet_address). Extra
+    concurrency slots (slot > 0) get their own profile directory and
+    supervisor label, see label and slot_profile().
+    """
+
+    name = None
+    tag = None
+    slot = 0  # Concurrency slot, see registry
+    waits_for_captcha = False  # scrape_portfolio() accepts wait_for_captcha=True
+
+    driver = None
+    session = None
+    block_resources = None
+    reconciliation = None  # wallet -> report of rows vs page totals (DeBank, Rabby)
+
+    @property
+    def label(self):
+        """Supervisor label and session tab of this instance ('debank', 'debank-1', ...)"""
+        return f"{self.name}-{self.slot}" if self.slot else self.name
+
+    @property
+    def process_label(self):
+        """Supervisor label of the processes backing this scraper"""
+        return self.session.LABEL if self.session else self.label
+
+    def slot_profile(self, user_data_dir):
+        """Chrome profile directory of this slot; two Chromes can't share one"""
+        return f"{user_data_dir}-{self.slot}" if self.slot else user_data_dir
+
+    def is_driver_alive(self):
+        """Check if the driver is still responsive"""
+        if not self.driver:
+            return False
+        try:
+            # Try a simple command to check if driver is responsive
+            _ = self.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def attach_session(self):
+        """Use (and switch to) our tab of the shared browser"""
+        self.driver = self.session.attach(self.label, self.block_resources)
+        self.headless = self.session.headless
+        return self.driver is not None
+
+    @abstractmethod
+    def connect_to_chrome(self):
+        """Start (or attach to) the browser; returns True on success"""
+
+    @abstractmethod
+    def scrape_portfolio(self, wallet_address):
+        """Scrape one wallet; returns a Portfolio or None"""
+
+    def cleanup(self):
+        """Clean up resources"""
+        if self.session:
+            if self.driver:
+                self.session.release(self.label)
+                self.driver = None
+            return
+        if self.driver:
+            try:
+                self.driver.quit()
+                print(f"[{self.tag}] ✓ Driver cleaned up")
+            except:
+                pass
+            # quit() can leave the browser or renderers behind
+            supervisor.reap(self.label)
@@ -0,0 +1,109 @@
+"""
+Incremental scroll harvesting for lazy-loaded and virtualized lists
+
+Scrolls the list in viewport-sized steps and, at every step, hands the rows
+that were rendered since the previous step to an extract callback. Rows are
+deduplicated by a stable key (element id, data-key/data-index, or the start
+of their text), so virtualized lists that unmount rows scrolled out of view
+are still read completely. Harvesting stops once the bottom is reached and
+nothing new appears, so short pages only pay for a couple of short settles.
+"""
+import time
+
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+
+
+# Scrolls one viewport (unless it's the first step), waits for rendering to
+# settle, then returns rows whose key has not been seen yet.
+# arguments: selector, seen keys, scroll?, settle ms, callback
+_STEP_JS = """
+const [selector, seenKeys, scroll, settleMs, done] = arguments;
+
+function keyOf(el) {
+    return el.id || el.getAttribute('data-key') || el.getAttribute('data-index')
+        || (el.textContent || '').trim().slice(0, 200);
+}
+
+function scrollerFor(el) {
+    for (let node = el && el.parentElement; node; node = node.parentElement) {
+        const overflow = getComputedStyle(node).overflowY;
+        if ((overflow === 'auto' || overflow === 'scroll') && node.scrollHeight > node.clientHeight) {
+            return node;
+        }
+    }
+    return document.scrollingElement || document.documentElement;
+}
+
+const scroller = scrollerFor(document.querySelector(selector));
+if (scroll) {
+    scroller.scrollTop = scroller.scrollTop + Math.max(scroller.clientHeight * 0.8, 200);
+}
+
+setTimeout(() => {
+    const seen = new Set(seenKeys);
+    const fresh = [];
+    for (const el of document.querySelectorAll(selector)) {
+        const key = keyOf(el);
+        if (key && !seen.has(key)) {
+            seen.add(key);
+            fresh.push([key, el]);
+        }
+    }
+    const atBottom = scroller.scrollTop + scroller.clientHeight >= scroller.scrollHeight - 2;
+    done({fresh: fresh, atBottom: atBottom});
+}, scroll ? settleMs : 0);
+"""
+
+
+def harvest(driver, selector, extract=None, settle=0.4, idle_steps=2, max_steps=300, label="Scroll"):
+    """Scroll through a list and collect every row matching selector
+
+    Args:
+        driver: Selenium driver
+        selector: CSS selector of the rows to harvest
+        extract: Called with each newly rendered row element while it is
+            still mounted; None keeps the element itself
+        settle: Seconds to let the page render after each scroll step
+        idle_steps: Steps at the bottom without new rows before stopping
+        max_steps: Hard limit on scroll steps
+        label: Log prefix, e.g. "DeBank"
+
+    Returns:
+        List of (key, extracted value) in the order rows were found
+    """
+    seen = set()
+    results = []
+    idle = 0
+    steps = 0
+
+    for steps in range(max_steps):
+        try:
+            step = driver.execute_async_script(_STEP_JS, selector, list(seen), steps > 0, int(settle * 1000))
+        except WebDriverException as e:
+            print(f"[{label}] ⚠ Scroll step failed: {e}")
+            break
+
+        new_rows = 0
+        for key, element in step["fresh"]:
+            if extract is None:
+                value = element
+            else:
+                try:
+                    value = extract(element)
+                except StaleElementReferenceException:
+                    # Unmounted before we got to it; it's picked up again when re-rendered
+                    continue
+            seen.add(key)
+            new_rows += 1
+            if value is not None:
+                results.append((key, value))
+
+        if new_rows or not step["atBottom"]:
+            idle = 0
+        else:
+            idle += 1
+            if idle >= idle_steps:
+                break
+
+    print(f"[{label}] ✓ Harvested {len(seen)} rows in {steps + 1} scroll steps")
+    return results
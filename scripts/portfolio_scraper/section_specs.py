@@ -0,0 +1,362 @@
+"""
+Declarative section specs for the DeBank and Rabby DeFi panels
+
+Both sites render a project as panels tagged with a bookmark (Lending, Yield,
+...) holding rows of cells. A source spec (DEBANK, RABBY) names the selectors
+of that markup; SECTIONS maps each section type to its column layouts and
+fields. EXTRACTOR_JS reads panels in a single script call and returns raw
+cell texts, build_project()/build_section() turn them into section dicts with
+the shared parsers.
+
+Supporting a new section type is a SECTIONS entry, a markup change is a
+selector edit in the source spec. Both sites hash their class names
+('ProjectTitle_projectTitle__yC5VD'); healed_spec() matches them by prefix
+for when a site deploy changes the hashes.
+"""
+import re
+
+from .metrics import span
+from .parsing import parse_numeric_value, parse_amount_value, extract_balance_value, parse_column
+
+
+# Column layouts per section type: [(min_cells, {field: column})], the first
+# layout whose cell count fits is used and rows fitting none are ignored.
+# "defaults" fills fields a layout does not provide, "tables" splits a panel
+# into sub-tables by header keywords and "health_rate" reads the panel's
+# health rate.
+SECTIONS = {
+    "Token": {
+        "layouts": [(4, {"token": 0, "price": 1, "amount": 2, "usd_value": 3})],
+    },
+    "Lending": {
+        "layouts": [(3, {"token": 0, "balance": 1, "usd_value": 2})],
+        "tables": {"supplied": ("supplied", "supply"), "borrowed": ("borrowed", "borrow")},
+        "health_rate": True,
+    },
+    "Deposit": {
+        "layouts": [(3, {"pool": 0, "balance": 1, "usd_value": 2})],
+    },
+    "Yield": {
+        "layouts": [
+            (4, {"identifier": 0, "pool": 1, "balance": 2, "usd_value": 3}),
+            (3, {"pool": 0, "balance": 1, "usd_value": 2}),
+        ],
+        "defaults": {"identifier": ""},
+    },
+    "Staked": {
+        "layouts": [(4, {"identifier": 0, "pool": 1, "balance": 2, "usd_value": 3})],
+    },
+    "Locked": {
+        # 4 columns: pool, balance, unlock time (ignored), usd value
+        "layouts": [
+            (4, {"pool": 0, "balance": 1, "usd_value": 3}),
+            (3, {"pool": 0, "balance": 1, "usd_value": 2}),
+        ],
+    },
+}
+
+# Fields parsed from their cell text; other fields keep the text
+FIELD_PARSERS = {
+    "balance": extract_balance_value,
+    "amount": parse_amount_value,
+    "price": parse_numeric_value,
+    "usd_value": parse_numeric_value,
+}
+
+# Fields naming the row: read from the spec's "name" element when the cell has one
+NAME_FIELDS = ("token", "pool")
+
+
+DEBANK = {
+    "source": "debank",
+    "tag": "DeBank",
+    "project": {
+        "title": "div.ProjectTitle_projectTitle__yC5VD",
+        "panels": "div[class*='Panel_container']",  # Siblings of the titles, see the DeBank scraper
+        "name": ["span.ProjectTitle_protocolLink__4Yqn3", "div.ProjectTitle_name__x2ZNR"],
+        "total": "div.projectTitle-number",
+        "chain": "evm",
+    },
+    "bookmark": "div.BookMark_bookmark__UG5a4",
+    "rows": "div.table_contentRow__Mi3k5",
+    "cells": ":scope > div",
+    "name": "a.utils_detailLink__XnB7N",
+    "first_line": (),
+    # Lending: each header's parent holds that table's rows
+    "table_header": "div.table_header__onfbK",
+    "table": None,
+    "health_label": "Health",  # Value is the sibling span of the label
+    "token_table": {
+        "root": "div.Card_card__pSup9.TokenWallet_card__teb0g",
+        "rows": "div.db-table-wrappedRow",
+        "cells": "div.db-table-cell",
+        "name": "a.TokenWallet_detailLink__goYJR",
+    },
+}
+
+RABBY = {
+    "source": "rabby",
+    "tag": "Rabby",
+    "project": {
+        "panels": "div.rabby-PoolListContainer-rabby--yotgd0 div.rabby-Container-rabby--1rr9ga5",
+        "name": ["span.name"],
+        "total": "div.flex.items-center.justify-end.flex-1 span",
+        "chain": "unknown",
+    },
+    "bookmark": "div.rabby-Bookmark-rabby--1kwtxm2",
+    "rows": "div.rabby-Content-rabby--fixjhz div.rabby-ContentRow-rabby--e2twba",
+    "cells": ":scope > div",
+    "name": "span.ml-2",
+    # Rabby cells carry a second line (token symbol, USD price) under the value
+    "first_line": ("token", "pool", "balance", "price", "amount"),
+    "table_header": "div.rabby-HeaderRow-rabby--1yo6z9x",
+    "table": "div.px-8",
+    "health_value": "span.rabby-KVValue-rabby--1n591ca",
+    "token_table": {
+        "root": None,
+        "rows": "div.rabby-TokenRowWrapper-rabby--1n616m8",
+        "cells": ":scope > div",
+        "name": "span.ml-2",
+    },
+}
+
+
+# CSS-module / styled-components class names end in a build hash:
+# 'Card_card__pSup9', 'rabby-Container-rabby--1rr9ga5'
+_HASHED_CLASS_RE = re.compile(r'\.([A-Za-z][\w-]*?(?:__|--))[A-Za-z0-9]+(?![\w-])')
+
+
+def prefix_selector(selector):
+    """'div.Card_card__pSup9' -> 'div[class*="Card_card__"]' (other classes are kept)"""
+    return _HASHED_CLASS_RE.sub(r'[class*="\1"]', selector)
+
+
+def healed_spec(spec):
+    """Copy of a source spec with every hashed class matched by its prefix"""
+    if isinstance(spec, str):
+        return prefix_selector(spec)
+    if isinstance(spec, dict):
+        return {key: healed_spec(value) for key, value in spec.items()}
+    if isinstance(spec, (list, tuple)):
+        return type(spec)(healed_spec(value) for value in spec)
+    return spec
+
+
+# Helpers shared by the extraction scripts. Rows come back as lists of
+# [cell text, name element text or null] so all parsing stays in Python.
+EXTRACTOR_JS = """
+function text(el) {
+    return el ? el.innerText.trim() : null;
+}
+function ownText(el) {
+    return Array.from(el.childNodes, n => n.nodeType === 3 ? n.nodeValue : '').join('');
+}
+function extractRows(root, table) {
+    return Array.from(root.querySelectorAll(table.rows), row =>
+        Array.from(row.querySelectorAll(table.cells), cell => {
+            const name = table.name ? cell.querySelector(table.name) : null;
+            return [cell.innerText.trim(), name ? name.innerText.trim() : null];
+        }));
+}
+function extractTokens(table) {
+    const root = table.root ? document.querySelector(table.root) : document;
+    return root ? extractRows(root, table) : null;
+}
+function healthRate(panel, spec) {
+    if (spec.health_value) return text(panel.querySelector(spec.health_value));
+    for (const label of panel.querySelectorAll('span')) {
+        if (!ownText(label).includes(spec.health_label)) continue;
+        for (const value of label.parentElement.querySelectorAll('span')) {
+            if (!ownText(value).includes(spec.health_label)) return text(value);
+        }
+    }
+    return null;
+}
+function extractPanel(panel, spec) {
+    const type = text(panel.querySelector(spec.bookmark));
+    if (type === null) return null;
+    const raw = {type: type};
+    if (spec.health_for.includes(type)) raw.health_rate = healthRate(panel, spec);
+    if (spec.tables_for.includes(type)) {
+        raw.tables = Array.from(panel.querySelectorAll(spec.table_header), header => ({
+            header: header.innerText.toLowerCase(),
+            rows: extractRows(spec.table ? header.closest(spec.table) : header.parentElement, spec),
+        }));
+    } else {
+        raw.rows = extractRows(panel, spec);
+    }
+    return raw;
+}
+function extractProject(title, panels, spec) {
+    let name = null;
+    for (const selector of spec.project.name) {
+        name = text(title.querySelector(selector));
+        if (name !== null) break;
+    }
+    if (!panels) panels = title.querySelectorAll(spec.project.panels);
+    return {
+        id: title.id || '',
+        name: name,
+        total: text(title.querySelector(spec.project.total)),
+        panels: Array.from(panels, panel => extractPanel(panel, spec)),
+    };
+}
+"""
+
+# Rabby: one project element (arguments[0]) of the virtualized DeFi list
+EXTRACT_PROJECT_JS = EXTRACTOR_JS + "return extractProject(arguments[0], null, arguments[1]);"
+
+# Rabby: all rows of the Token tab
+EXTRACT_TOKENS_JS = EXTRACTOR_JS + "return extractTokens(arguments[0].token_table);"
+
+
+def compile_spec(spec):
+    """Script argument for a source spec: its selectors plus which section
+    types are split into tables or have a health rate"""
+    return dict(
+        spec,
+        tables_for=[name for name, section in SECTIONS.items() if section.get("tables")],
+        health_for=[name for name, section in SECTIONS.items() if section.get("health_rate")],
+    )
+
+
+def _cell_text(cell, field, spec):
+    text, name = cell
+    if field in NAME_FIELDS and name is not None:
+        return name
+    if field in spec["first_line"]:
+        return text.split('\n')[0]
+    return text
+
+
+def parse_table(rows, section_type, spec):
+    """Map a table's raw rows to asset dicts, column by column
+
+    Returns one asset per row, in order, None for rows no layout fits.
+    """
+    section = SECTIONS[section_type]
+    layouts = section["layouts"]
+    # Row indices per layout: the first layout whose cell count fits
+    groups = {}
+    for index, cells in enumerate(rows):
+        for layout, (min_cells, _) in enumerate(layouts):
+            if len(cells) >= min_cells:
+                groups.setdefault(layout, []).append(index)
+                break
+
+    assets = [None] * len(rows)
+    for layout, indices in groups.items():
+        parsed = [dict(section.get("defaults", {})) for _ in indices]
+        for field, column in layouts[layout][1].items():
+            texts = [_cell_text(rows[index][column], field, spec) for index in indices]
+            parser = FIELD_PARSERS.get(field)
+            values = parse_column(texts, parser) if parser else texts
+            for asset, value in zip(parsed, values):
+                asset[field] = value
+        for index, asset in zip(indices, parsed):
+            assets[index] = asset
+    return assets
+
+
+def asset_name(asset):
+    return next((asset[field] for field in NAME_FIELDS if field in asset), None)
+
+
+def is_complete(asset):
+    """Rows without a name or a balance are never captured"""
+    return bool(asset_name(asset)) and asset.get("balance", 0) is not None
+
+
+def parse_rows(rows, section_type, spec, label=None):
+    """Parse a table's raw rows, keeping every complete row (dust is filtered at query time)"""
+    tag = spec["tag"]
+    label = label or section_type
+    assets = []
+    for asset in parse_table(rows, section_type, spec):
+        if asset is not None and is_complete(asset):
+            assets.append(asset)
+            print(f"[{tag}]         ✓ {label}: {asset_name(asset)} - ${asset['usd_value']}")
+    return assets
+
+
+def _health_rate(text):
+    if text is None:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def _table_key(section, header):
+    """Sub-table ("supplied", "borrowed") a lending table header belongs to, or None"""
+    return next((key for key, words in section["tables"].items() if any(w in header for w in words)), None)
+
+
+def build_section(raw, spec):
+    """Section dict for one extracted panel, None for unknown section types"""
+    section_type = raw["type"]
+    section = SECTIONS.get(section_type)
+    if section is None or section_type == "Token":
+        print(f"[{spec['tag']}]       Skipping unknown section type: {section_type}")
+        return None
+
+    print(f"[{spec['tag']}]       Processing section: {section_type}")
+    data = {"section_type": section_type}
+    if section.get("health_rate"):
+        data["health_rate"] = _health_rate(raw.get("health_rate"))
+
+    if not section.get("tables"):
+        data["assets"] = parse_rows(raw["rows"], section_type, spec)
+        return data
+
+    for key in section["tables"]:
+        data[key] = []
+    for table in raw["tables"]:
+        header = table["header"]
+        print(f"[{spec['tag']}]         Table '{header}': {len(table['rows'])} rows")
+        key = _table_key(section, header)
+        assets = parse_rows(table["rows"], section_type, spec, label=(key or header).capitalize())
+        if key:
+            data[key].extend(assets)
+    return data
+
+
+def build_project(raw, spec):
+    """Project dict from an extractProject() result"""
+    project_id = raw["id"]
+    chain = project_id.split("_")[0] if "_" in project_id else spec["project"]["chain"]
+    project = {
+        "project_name": raw["name"] or "Unknown",
+        "chain": chain,
+        "total_value": parse_numeric_value(raw["total"]) if raw["total"] else 0,
+        "sections": [],
+    }
+    print(f"[{spec['tag']}] Processing: {project['project_name']} ({chain}) - ${project['total_value']}")
+    print(f"[{spec['tag']}]     Found {len(raw['panels'])} panels")
+
+    for panel in raw["panels"]:
+        if panel is None:
+            print(f"[{spec['tag']}]       Warning: Panel without bookmark found")
+            continue
+        with span('section', source=spec['source'], section=panel["type"]):
+            section = build_section(panel, spec)
+        if section:
+            project["sections"].append(section)
+    return project
+
+
+def build_token_project(rows, spec, total_value=None):
+    """The wallet's plain token balances as the "Token" project
+
+    total_value defaults to the sum of the rows.
+    """
+    assets = parse_rows(rows, "Token", spec)
+    if total_value is None:
+        total_value = sum(asset["usd_value"] for asset in assets)
+    return {
+        "project_name": "Token",
+        "chain": "evm",
+        "total_value": total_value,
+        "sections": [{"section_type": "Token", "assets": assets}],
+    }
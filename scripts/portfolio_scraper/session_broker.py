@@ -0,0 +1,133 @@
+"""
+Shared browser session broker
+
+With SHARED_BROWSER enabled, Jupiter and DeBank run in one undetected Chrome
+on a single profile instead of two, each in its own tab. The broker launches
+the browser lazily, hands every site its tab (creating it on first use, or
+again after a relaunch), and quits the browser when the last site releases
+its tab. CDP settings such as request blocking are per tab, so they are
+applied whenever a site's tab is created.
+
+Only one site can drive the browser at a time; callers that run sites
+concurrently hold `session.lock` for the duration of a scrape.
+"""
+import os
+import threading
+
+import undetected_chromedriver as uc
+
+from .browser import build_chrome_options, apply_request_blocking
+from .config import HEADLESS
+from .metrics import span
+from .supervisor import supervisor
+from .utils import get_chrome_major_version
+from .webdriver_profiler import maybe_attach
+
+
+class BrowserSession:
+    """One Chrome, one tab per site"""
+
+    LABEL = 'shared-browser'
+
+    def __init__(self, user_data_dir=None, headless=None):
+        self.user_data_dir = user_data_dir or os.path.expanduser('~/.chrome_shared_scraper')
+        self.headless = HEADLESS if headless is None else headless
+        self.driver = None
+        self.lock = threading.RLock()
+        self._tabs = {}  # site -> window handle
+
+    def is_alive(self):
+        if not self.driver:
+            return False
+        try:
+            _ = self.driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def launch(self):
+        """Start the shared Chrome (called lazily by attach)"""
+        print(f"[Session] Starting shared Chrome ({'headless' if self.headless else 'headed'})...")
+        print(f"[Session] Profile directory: {self.user_data_dir}")
+        supervisor.reap_profile(self.user_data_dir)
+
+        options = build_chrome_options(uc.ChromeOptions(), self.user_data_dir, headless=self.headless)
+        options.add_argument('--disable-blink-features=AutomationControlled')
+
+        with span('connect', source='shared'):
+            version_main = get_chrome_major_version()
+            kwargs = {"version_main": version_main} if version_main else {}
+            self.driver = uc.Chrome(options=options, use_subprocess=False, **kwargs)
+
+        supervisor.track_driver(self.driver, self.LABEL, self.user_data_dir)
+        maybe_attach(self.driver)
+        self._tabs = {}
+        print("[Session] ✓ Shared Chrome started")
+
+    def attach(self, site, block_resources=None):
+        """Switch to a site's tab, launching the browser or opening the tab as needed
+
+        Returns the shared driver, or None if the browser could not start.
+        """
+        with self.lock:
+            try:
+                if not self.is_alive():
+                    self.shutdown()
+                    self.launch()
+
+                handles = self.driver.window_handles
+                handle = self._tabs.get(site)
+                if handle not in handles:
+                    claimed = set(self._tabs.values())
+                    unclaimed = [h for h in handles if h not in claimed]
+                    if unclaimed:
+                        # The window Chrome opened at launch
+                        self.driver.switch_to.window(unclaimed[0])
+                    else:
+                        self.driver.switch_to.new_window('tab')
+                    handle = self._tabs[site] = self.driver.current_window_handle
+                    apply_request_blocking(self.driver, block_resources, label=f"Session/{site}")
+                    print(f"[Session] ✓ Opened tab for {site}")
+                elif self.driver.current_window_handle != handle:
+                    self.driver.switch_to.window(handle)
+                return self.driver
+            except Exception as e:
+                print(f"[Session] ✗ Could not attach {site}: {e}")
+                return None
+
+    def release(self, site):
+        """Close a site's tab; the last release quits the browser"""
+        with self.lock:
+            handle = self._tabs.pop(site, None)
+            if not self.driver:
+                return
+            if not self._tabs:
+                self.shutdown()
+                return
+            try:
+                if handle in self.driver.window_handles:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                self.driver.switch_to.window(next(iter(self._tabs.values())))
+            except Exception:
+                pass
+
+    def relaunch(self, headless):
+        """Restart the browser in another mode (tabs reopen on the next attach)"""
+        with self.lock:
+            print(f"[Session] Relaunching shared Chrome {'headless' if headless else 'headed'}...")
+            self.shutdown()
+            self.headless = headless
+
+    def shutdown(self):
+        """Quit the browser and reap its processes"""
+        with self.lock:
+            if self.driver:
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+                print("[Session] ✓ Shared Chrome shut down")
+            supervisor.reap(self.LABEL)
+            self.driver = None
+            self._tabs = {}
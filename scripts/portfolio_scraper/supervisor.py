@@ -0,0 +1,203 @@
+"""
+Chrome process supervisor
+
+Tracks the processes this scraper launched (the debug Chrome, each
+chromedriver and the Chrome it drives) and only ever terminates those, so
+several scraper instances, or a desktop Chrome, can live on the same host.
+
+Reaping terminates the whole process tree and waits for it to exit instead
+of sleeping a fixed amount. check() finds renderer/helper processes that
+outlived their browser (orphans still holding one of our profiles), zombies
+in our trees, and trees whose resident memory exceeds CHROME_MAX_RSS_MB.
+"""
+import os
+import threading
+from datetime import datetime
+
+import psutil
+
+from .config import CHROME_MAX_RSS_MB
+
+
+def _uses_profile(proc, user_data_dir):
+    """Whether a process was started with --user-data-dir=<user_data_dir>"""
+    try:
+        cmdline = proc.cmdline()
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return False
+    flag = f"--user-data-dir={user_data_dir}"
+    return any(arg == flag or arg == flag + os.sep for arg in cmdline)
+
+
+def _terminate(procs, timeout, label):
+    """SIGTERM, wait up to timeout, SIGKILL the rest; returns the number reaped"""
+    procs = [p for p in procs if p.pid != os.getpid()]
+    if not procs:
+        return 0
+    for proc in procs:
+        try:
+            proc.terminate()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    _gone, alive = psutil.wait_procs(procs, timeout=timeout)
+    for proc in alive:
+        try:
+            print(f"[Supervisor] {label}: force killing PID {proc.pid}")
+            proc.kill()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    if alive:
+        psutil.wait_procs(alive, timeout=timeout)
+    return len(procs)
+
+
+class ProcessSupervisor:
+    """Registry of the Chrome/chromedriver processes we launched, keyed by label"""
+
+    def __init__(self, max_rss_mb=None):
+        self.max_rss_mb = max_rss_mb or CHROME_MAX_RSS_MB
+        self._lock = threading.Lock()
+        self._tracked = {}  # pid -> {"label", "create_time", "user_data_dir"}
+
+    def track(self, pid, label, user_data_dir=None):
+        """Start supervising a process (and, implicitly, its children)"""
+        try:
+            create_time = psutil.Process(pid).create_time()
+        except psutil.NoSuchProcess:
+            return False
+        with self._lock:
+            self._tracked[pid] = {
+                "label": label,
+                "create_time": create_time,
+                "user_data_dir": os.path.abspath(user_data_dir) if user_data_dir else None,
+            }
+        return True
+
+    def track_driver(self, driver, label, user_data_dir=None):
+        """Track a WebDriver's chromedriver and, for undetected-chromedriver, its browser"""
+        pids = []
+        process = getattr(getattr(driver, 'service', None), 'process', None)
+        if process is not None and getattr(process, 'pid', None):
+            pids.append(process.pid)
+        browser_pid = getattr(driver, 'browser_pid', None)  # uc.Chrome launches Chrome itself
+        if browser_pid:
+            pids.append(browser_pid)
+        return [pid for pid in pids if self.track(pid, label, user_data_dir)]
+
+    def _roots(self, label=None):
+        """Live tracked processes; forgets PIDs that exited or were reused"""
+        roots = []
+        with self._lock:
+            for pid, entry in list(self._tracked.items()):
+                if label is not None and entry["label"] != label:
+                    continue
+                try:
+                    proc = psutil.Process(pid)
+                    if proc.create_time() != entry["create_time"]:
+                        raise psutil.NoSuchProcess(pid)  # PID reused by something else
+                    roots.append((proc, entry))
+                except psutil.NoSuchProcess:
+                    del self._tracked[pid]
+        return roots
+
+    def processes(self, label=None):
+        """Tracked processes plus all their descendants"""
+        procs = {}
+        for root, _entry in self._roots(label):
+            procs[root.pid] = root
+            try:
+                for child in root.children(recursive=True):
+                    procs[child.pid] = child
+            except psutil.NoSuchProcess:
+                pass
+        return list(procs.values())
+
+    def profiles(self, label=None):
+        with self._lock:
+            return {
+                entry["user_data_dir"] for entry in self._tracked.values()
+                if entry["user_data_dir"] and (label is None or entry["label"] == label)
+            }
+
+    def reap(self, label, timeout=5):
+        """Terminate everything launched under a label; returns the number of processes"""
+        procs = self.processes(label)
+        count = _terminate(procs, timeout, label)
+        with self._lock:
+            for pid in [pid for pid, entry in self._tracked.items() if entry["label"] == label]:
+                del self._tracked[pid]
+        if count:
+            print(f"[Supervisor] ✓ {label}: reaped {count} process(es)")
+        return count
+
+    def reap_profile(self, user_data_dir, timeout=5):
+        """Terminate leftover Chrome processes holding our profile, e.g. from a crashed run
+
+        Chrome refuses to start on a profile that is still in use, and only
+        processes started with exactly this --user-data-dir are touched.
+        """
+        user_data_dir = os.path.abspath(user_data_dir)
+        procs = [p for p in psutil.process_iter(['pid']) if _uses_profile(p, user_data_dir)]
+        count = _terminate(procs, timeout, os.path.basename(user_data_dir))
+        if count:
+            print(f"[Supervisor] ✓ Reaped {count} stale process(es) using {user_data_dir}")
+        return count
+
+    def check(self, reap_orphans=True):
+        """Health pass over our processes
+
+        Returns {"trees": {label: {"processes", "rss_mb", "zombies", "bloated"}},
+        "orphans": count}. Orphans are processes on one of our profiles that are
+        no longer part of a tracked tree; they are reaped unless reap_orphans
+        is False.
+        """
+        trees = {}
+        in_tree = set()
+        labels = {entry["label"] for _root, entry in self._roots()}
+        for label in sorted(labels):
+            procs = self.processes(label)
+            rss = zombies = 0
+            for proc in procs:
+                in_tree.add(proc.pid)
+                try:
+                    if proc.status() == psutil.STATUS_ZOMBIE:
+                        zombies += 1
+                        continue
+                    rss += proc.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            rss_mb = rss / 1024 / 1024
+            bloated = rss_mb > self.max_rss_mb
+            if bloated:
+                print(f"[Supervisor] ⚠️  {label}: {rss_mb:.0f} MB resident across {len(procs)} processes (limit {self.max_rss_mb} MB)")
+            if zombies:
+                print(f"[Supervisor] ⚠️  {label}: {zombies} zombie process(es)")
+            trees[label] = {
+                "processes": len(procs),
+                "rss_mb": round(rss_mb, 1),
+                "zombies": zombies,
+                "bloated": bloated,
+            }
+
+        orphans = []
+        profiles = self.profiles()
+        if profiles:
+            for proc in psutil.process_iter(['pid']):
+                if proc.pid in in_tree or proc.pid == os.getpid():
+                    continue
+                if any(_uses_profile(proc, profile) for profile in profiles):
+                    orphans.append(proc)
+        if orphans:
+            print(f"[Supervisor] ⚠️  {len(orphans)} orphaned Chrome process(es) on our profiles")
+            if reap_orphans:
+                _terminate(orphans, 5, 'orphans')
+        return {"trees": trees, "orphans": len(orphans)}
+
+    def snapshot(self):
+        """JSON-serializable view for /health"""
+        report = self.check(reap_orphans=False)
+        report["checked_at"] = datetime.now().isoformat()
+        return report
+
+
+supervisor = ProcessSupervisor()
@@ -0,0 +1,38 @@
+"""Cross-check of two sources' portfolios (run with pytest from scripts/)"""
+from portfolio_scraper.crosscheck import compare
+from portfolio_scraper.model import Portfolio
+
+
+def _portfolio(*projects):
+    return Portfolio.from_dict({
+        "blockchain": "evm",
+        "wallet_address": "0xabc",
+        "projects": [
+            {"project_name": name, "total_value": value, "sections": sections}
+            for name, value, sections in projects
+        ],
+    })
+
+
+def _yield(usd_value):
+    return [{"section_type": "Yield", "assets": [{"token": "USDC", "usd_value": usd_value}]}]
+
+
+def test_zero_value_project_missing_from_other_source():
+    # A project without sections nets to 0.0 on one side and is absent on the other
+    debank = _portfolio(("Aave V3", 100.0, _yield(100.0)), ("Empty", 0, []))
+    rabby = _portfolio(("Aave v3", 100.0, _yield(100.0)))
+
+    report = compare(debank, rabby, "debank", "rabby")
+
+    assert report["project_mismatches"] == []
+    assert report["consistent"]
+
+
+def test_missing_project_with_value_is_flagged():
+    debank = _portfolio(("Aave V3", 100.0, _yield(100.0)), ("Pendle", 50.0, _yield(50.0)))
+    rabby = _portfolio(("Aave v3", 100.0, _yield(100.0)))
+
+    report = compare(debank, rabby, "debank", "rabby")
+
+    assert report["project_mismatches"] == [{"project": "pendle", "debank": 50.0, "rabby": None}]
@@ -0,0 +1,21 @@
+"""Shared parsers: column parsing against the per-cell parsers (run with pytest from scripts/)"""
+from portfolio_scraper.bench.parsing import build_sample_columns
+from portfolio_scraper.parsing import (
+    extract_balance_value,
+    parse_amount_value,
+    parse_column,
+    parse_numeric_value,
+)
+
+
+def test_column_matches_per_cell_parsing():
+    values, amounts = build_sample_columns(rows=500)
+    assert parse_column(values) == [parse_numeric_value(v) for v in values]
+    assert parse_column(amounts, parse_amount_value) == [parse_amount_value(a) for a in amounts]
+
+
+def test_amount_column_falls_back_per_cell():
+    # No '1,234.5' cell to settle the locale, an empty balance, suffixes
+    texts = ['0,5 A', '1.234,56 B', '46,172 CASH', '1.5k C']
+    assert parse_column(texts, parse_amount_value) == [0.5, 1234.56, 46172.0, 1500.0]
+    assert parse_column(['1,234.5 X', ' '], extract_balance_value) == [1234.5, None]
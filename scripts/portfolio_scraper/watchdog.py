@@ -0,0 +1,91 @@
+"""
+Browser memory watchdog
+
+Long-lived uc.Chrome sessions grow over days of SPA navigation. Between
+wallets the scheduler samples the resident memory of the scraper's browser
+process tree (psutil, via the process supervisor) and the page's used JS heap
+(CDP Performance.getMetrics). Readings are exported as gauges; a driver over
+CHROME_MAX_RSS_MB or JS_HEAP_MAX_MB is recycled before its next wallet.
+"""
+import threading
+from datetime import datetime
+
+import psutil
+
+from .config import CHROME_MAX_RSS_MB, JS_HEAP_MAX_MB
+from .metrics import set_gauge, BROWSER_RSS_METRIC, BROWSER_JS_HEAP_METRIC
+from .supervisor import supervisor
+
+MB = 1024 * 1024
+
+
+def process_tree_rss(label):
+    """Resident bytes of all processes the supervisor tracks under a label"""
+    rss = 0
+    for proc in supervisor.processes(label):
+        try:
+            rss += proc.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+    return rss
+
+
+def js_heap_used(driver):
+    """Used JS heap bytes of the current page, or None if CDP is unavailable"""
+    try:
+        driver.execute_cdp_cmd('Performance.enable', {})  # Idempotent
+        result = driver.execute_cdp_cmd('Performance.getMetrics', {})
+    except Exception:
+        return None
+    for metric in result.get('metrics', []):
+        if metric.get('name') == 'JSHeapUsedSize':
+            return metric.get('value')
+    return None
+
+
+class MemoryWatchdog:
+    """Samples browser memory per source and decides when to recycle a driver"""
+
+    def __init__(self, max_rss_mb=None, max_js_heap_mb=None):
+        self.max_rss_mb = max_rss_mb or CHROME_MAX_RSS_MB
+        self.max_js_heap_mb = max_js_heap_mb or JS_HEAP_MAX_MB
+        self._lock = threading.Lock()
+        self._readings = {}
+
+    def sample(self, label, driver):
+        """Take a reading for one source and publish it as gauges"""
+        rss = process_tree_rss(label)
+        heap = js_heap_used(driver) if driver else None
+        reading = {
+            "rss_mb": round(rss / MB, 1),
+            "js_heap_mb": round(heap / MB, 1) if heap is not None else None,
+            "sampled_at": datetime.now().isoformat(),
+        }
+        set_gauge(BROWSER_RSS_METRIC, rss, source=label)
+        if heap is not None:
+            set_gauge(BROWSER_JS_HEAP_METRIC, heap, source=label)
+        with self._lock:
+            # Keep the recycle history of this source
+            reading = self._readings[label] = {"recycles": 0, **self._readings.get(label, {}), **reading}
+        return reading
+
+    def over_limit(self, label, driver):
+        """Sample a source; returns the reason it should be recycled, or None"""
+        reading = self.sample(label, driver)
+        if reading["rss_mb"] > self.max_rss_mb:
+            return f"RSS {reading['rss_mb']:.0f} MB > {self.max_rss_mb} MB"
+        if reading["js_heap_mb"] is not None and reading["js_heap_mb"] > self.max_js_heap_mb:
+            return f"JS heap {reading['js_heap_mb']:.0f} MB > {self.max_js_heap_mb} MB"
+        return None
+
+    def record_recycle(self, label, reason):
+        with self._lock:
+            reading = self._readings.setdefault(label, {})
+            reading["recycles"] = reading.get("recycles", 0) + 1
+            reading["last_recycle"] = datetime.now().isoformat()
+            reading["last_recycle_reason"] = reason
+
+    def snapshot(self):
+        """JSON-serializable readings for /health"""
+        with self._lock:
+            return {label: dict(reading) for label, reading in self._readings.items()}
@@ -0,0 +1,182 @@
+"""
+WebDriver round-trip profiler
+
+Wraps a driver's command executor so every WebDriver command (find_element(s),
+.text, get_attribute, execute_script, ...) is counted and timed per wallet,
+per section and per call site in this package. Enable with WEBDRIVER_PROFILE=1.
+"""
+import json
+import os
+import sys
+import threading
+import time
+
+from .config import WEBDRIVER_PROFILE, WEBDRIVER_PROFILE_FILE
+from .metrics import current_context
+
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_THIS_FILE = os.path.abspath(__file__)
+
+# Selenium command names -> the API call a reader of the scrapers would recognize
+_COMMAND_CATEGORIES = {
+    'findElement': 'find_element',
+    'findChildElement': 'find_element',
+    'findElements': 'find_elements',
+    'findChildElements': 'find_elements',
+    'getElementText': 'text',
+    'getElementAttribute': 'get_attribute',
+    'getElementProperty': 'get_attribute',
+    'executeScript': 'execute_script',
+    'w3cExecuteScript': 'execute_script',
+    'w3cExecuteScriptAsync': 'execute_script',
+    'get': 'navigate',
+}
+
+# Selenium implements some element APIs as injected scripts tagged with a comment
+_SCRIPT_CATEGORIES = {
+    '/* getAttribute */': 'get_attribute',
+    '/* isDisplayed */': 'is_displayed',
+}
+
+
+def _categorize(command, params):
+    category = _COMMAND_CATEGORIES.get(command, command)
+    if category == 'execute_script' and params:
+        script = params.get('script') or ''
+        for prefix, script_category in _SCRIPT_CATEGORIES.items():
+            if script.startswith(prefix):
+                return script_category
+    return category
+
+
+def _call_site():
+    """Return 'module.py:function:line' of the innermost caller in this package"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(_PACKAGE_DIR) and filename != _THIS_FILE:
+            relative = os.path.relpath(filename, _PACKAGE_DIR)
+            return f"{relative}:{frame.f_code.co_name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return 'external'
+
+
+class WebDriverProfiler:
+    """Counts and times WebDriver commands issued through attached drivers"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+        self.started_at = time.time()
+
+    def attach(self, driver):
+        """Intercept all commands of a driver (and the elements it returns)"""
+        if driver is None or getattr(driver, '_profiler_original_execute', None):
+            return driver
+
+        original_execute = driver.execute
+
+        def execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                self._record(driver_command, params, time.perf_counter() - start)
+
+        # WebElement commands go through parent.execute, so this covers them too
+        driver._profiler_original_execute = original_execute
+        driver.execute = execute
+        return driver
+
+    def detach(self, driver):
+        """Restore the driver's original command executor"""
+        original_execute = getattr(driver, '_profiler_original_execute', None)
+        if original_execute:
+            driver.execute = original_execute
+            driver._profiler_original_execute = None
+
+    def _record(self, command, params, elapsed):
+        context = current_context()
+        key = (
+            context.get('wallet', '-'),
+            context.get('source', '-'),
+            context.get('section') or context.get('phase', '-'),
+            _categorize(command, params),
+            _call_site(),
+        )
+        with self._lock:
+            stat = self._stats.get(key)
+            if stat is None:
+                self._stats[key] = [1, elapsed]
+            else:
+                stat[0] += 1
+                stat[1] += elapsed
+
+    def reset(self):
+        """Drop collected statistics"""
+        with self._lock:
+            self._stats.clear()
+            self.started_at = time.time()
+
+    def summary(self):
+        """Aggregate statistics into a JSON-serializable profile"""
+        with self._lock:
+            items = [(key, list(stat)) for key, stat in self._stats.items()]
+
+        def _group(index_fn):
+            grouped = {}
+            for key, (count, elapsed) in items:
+                group_key = index_fn(key)
+                entry = grouped.setdefault(group_key, {"calls": 0, "seconds": 0.0})
+                entry["calls"] += count
+                entry["seconds"] += elapsed
+            return dict(sorted(grouped.items(), key=lambda kv: -kv[1]["calls"]))
+
+        total_calls = sum(stat[0] for _, stat in items)
+        total_seconds = sum(stat[1] for _, stat in items)
+        return {
+            "started_at": self.started_at,
+            "total_calls": total_calls,
+            "total_seconds": total_seconds,
+            "by_command": _group(lambda key: key[3]),
+            "by_wallet": _group(lambda key: key[0]),
+            "by_section": _group(lambda key: f"{key[1]}:{key[2]}"),
+            "by_call_site": _group(lambda key: f"{key[4]} [{key[3]}]"),
+        }
+
+    def report(self, top=15):
+        """Return a human readable summary of the profile"""
+        profile = self.summary()
+        lines = [
+            f"WebDriver profile: {profile['total_calls']} calls, "
+            f"{profile['total_seconds']:.2f}s in round-trips"
+        ]
+        for title, group in (
+            ("By command", profile["by_command"]),
+            ("By wallet", profile["by_wallet"]),
+            ("By section", profile["by_section"]),
+            ("Top call sites", profile["by_call_site"]),
+        ):
+            lines.append(f"  {title}:")
+            for name, entry in list(group.items())[:top]:
+                lines.append(f"    {entry['calls']:>7} calls  {entry['seconds']:>8.2f}s  {name}")
+        return '\n'.join(lines)
+
+    def dump_json(self, path=None):
+        """Write the profile as JSON and return the path"""
+        path = path or WEBDRIVER_PROFILE_FILE
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, indent=2)
+        return path
+
+
+# Process-wide profiler shared by all scrapers
+profiler = WebDriverProfiler()
+
+
+def maybe_attach(driver):
+    """Attach the shared profiler when WEBDRIVER_PROFILE is enabled"""
+    if WEBDRIVER_PROFILE:
+        profiler.attach(driver)
+    return driver
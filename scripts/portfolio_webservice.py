@@ -4,7 +4,6 @@ Simple Flask webservice that serves JSON files from feeds/ directory
 NO SCRAPING - just reads and serves existing JSON files
 """
 from flask import Flask, request, jsonify
-from pyngrok import ngrok
 import os
 import json
 from pathlib import Path
@@ -16,6 +15,8 @@ app = Flask(__name__)
 
 def setup_ngrok(port):
     """Set up ngrok tunnel"""
+    from pyngrok import ngrok  # Only needed when tunneling, keep it out of import time
+    
     ngrok_token = os.environ.get('NGROK_AUTHTOKEN')
     
     if ngrok_token: